@@ -1,6 +1,16 @@
 from enum import Enum, IntEnum
 
 
+class OrdinalEnum(Enum):
+    """
+    Enum whose members know their position in the order they are defined in.
+    The ordinal is fixed when the enum is defined, so it can index arrays directly.
+    """
+
+    def __init__(self, *args) -> None:
+        self.ordinal: int = len(self.__class__.__members__)
+
+
 class GameResult(IntEnum):
     """
     Enum class to represent the possible game results
@@ -23,7 +33,7 @@ class Constants:
     MAX_NUM_TEAMS = 20
 
 
-class PlayerStats(Enum):
+class PlayerStats(OrdinalEnum):
     GAMES_PLAYED = "Games Played"
     GOALS = "Goals"
     ASSISTS = "Assists"
@@ -35,7 +45,7 @@ class PlayerStats(Enum):
     HEIGHT = "Height"
 
 
-class TeamStats(Enum):
+class TeamStats(OrdinalEnum):
     GAMES_PLAYED = "Games Played"
     POINTS = "Points"
     WINS = "Wins"
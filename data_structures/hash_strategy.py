@@ -0,0 +1,124 @@
+""" Seeded hash functions for hash tables
+
+The tables hash keys with a fixed polynomial by default, so anyone who knows the
+constants can pick keys that all land in the same cluster. A UniversalHash is drawn
+at random from a universal family when it is created, so which keys collide is
+different for every table and cannot be chosen in advance.
+
+Pass one as the hash_strategy of LinearProbeTable (and its variants),
+HashyStepTable or HashTableSeparateChaining. The strategy returns a full width
+hash that the table reduces modulo its size, so growing a table never rehashes
+the strings themselves. INTERNED_HASH is one such strategy shared by the whole
+process, which hashes every distinct key only once.
+"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+import random
+import secrets
+import sys
+from typing import Union
+
+
+class UniversalHash:
+    """
+    Carter-Wegman polynomial hashing of strings modulo the Mersenne prime 2^61 - 1:
+
+        h(key) = ((c_0 + 1) * a^n + ... + (c_(n-1) + 1) * a + b) mod P
+
+    with a and b drawn at random. Each character code is shifted up by one so that
+    no character counts as a zero coefficient; otherwise leading "\\x00" characters
+    would add nothing and keys of different lengths could be made to collide for
+    every a. Two different keys, the longer of length n, then collide with
+    probability at most n / P over the choice of a.
+
+    Hashes of recently seen keys are cached, so hashing the same key again is a
+    single dictionary lookup.
+    """
+
+    PRIME = (1 << 61) - 1
+    CACHE_LIMIT = 1 << 16
+
+    def __init__(self, seed: Union[int, None] = None) -> None:
+        """
+        :param seed: Makes the drawn function reproducible. None draws it from the operating system.
+        :complexity: O(1)
+        """
+        if seed is None:
+            self.a = 1 + secrets.randbelow(self.PRIME - 1)
+            self.b = secrets.randbelow(self.PRIME)
+        else:
+            rng = random.Random(seed)
+            self.a = rng.randrange(1, self.PRIME)
+            self.b = rng.randrange(self.PRIME)
+        self.cache: dict[str, int] = {}
+
+    def __call__(self, key: str) -> int:
+        """
+        Returns the hash of a key, a non-negative int below PRIME.
+
+        :complexity best: O(1) when the key is cached.
+        :complexity worst: O(len(key))
+        """
+        value = self.cache.get(key)
+        if value is not None:
+            return value
+
+        value = self._compute(key)
+        if len(self.cache) >= self.CACHE_LIMIT:
+            self.cache.clear()
+        self.cache[key] = value
+        return value
+
+    def _compute(self, key: str) -> int:
+        """
+        Hashes a key without looking at the cache.
+
+        :complexity: O(len(key))
+        """
+        value = 0
+        for char in key:
+            value = (value * self.a + ord(char) + 1) % self.PRIME
+        return (value * self.a + self.b) % self.PRIME
+
+
+class InternedHash(UniversalHash):
+    """
+    A UniversalHash whose cache is never cleared, meant to be shared by every table
+    in the process through INTERNED_HASH.
+
+    Every key it sees is interned with sys.intern, so each distinct key is hashed
+    once per process and equal keys share one string object. Tables sharing it
+    never process the characters of a key again, including when they resize,
+    and comparing a stored key with an interned one is an identity check.
+
+    Only use it for keys from a bounded set, such as statistic names or player
+    names, since the cache grows with every distinct key.
+    """
+
+    def __call__(self, key: str) -> int:
+        """
+        :complexity best: O(1) when the key has been seen before.
+        :complexity worst: O(len(key))
+        """
+        value = self.cache.get(key)
+        if value is None:
+            key = sys.intern(key)
+            value = self.cache[key] = self._compute(key)
+        return value
+
+    def intern(self, key: str) -> str:
+        """
+        Returns the shared copy of a key, hashing it if it has not been seen before.
+        Storing the returned string in place of the key makes later lookups with it
+        cheaper, as equal keys compare by identity.
+
+        :complexity best: O(1) when the key has been seen before.
+        :complexity worst: O(len(key))
+        """
+        self(key)
+        return sys.intern(key)
+
+
+# Shared by every table that wants each key hashed once per process.
+INTERNED_HASH = InternedHash()
@@ -8,6 +8,7 @@ __since__ = '07/02/2023'
 
 
 from typing import TypeVar, Generic
+from data_structures.primes import next_prime
 from data_structures.referential_array import ArrayR
 
 K = TypeVar('K')
@@ -27,6 +28,15 @@ class LinearProbeTable(Generic[K, V]):
                 Otherwise `hash` should be overwritten.
         - V:    Value Type.
 
+    With tombstones=True, deleting marks the slot with TOMBSTONE instead of reinserting
+    the rest of its cluster. Probes step over tombstones, inserts reuse them, and the
+    table is rebuilt at the same size once they take up MAX_TOMBSTONE_LOAD of it.
+
+    Tables grow through TABLE_SIZES and then on through computed primes, each the next
+    prime after twice the size before. With shrink=True, meant for long-lived tables
+    that empty out again, a delete that leaves less than MIN_LOAD of the table used
+    shrinks it back to the previous size.
+
     Unless stated otherwise, all methods have O(1) complexity.
     """
 
@@ -35,28 +45,133 @@ class LinearProbeTable(Generic[K, V]):
 
     HASH_BASE = 31
 
-    def __init__(self, sizes=None) -> None:
+    # The table grows once more than this fraction of it is used.
+    MAX_LOAD = 1 / 2
+    # With shrink=True, the table shrinks once less than this fraction of it is used.
+    MIN_LOAD = 1 / 8
+
+    # Marks a deleted slot that probes have to step over.
+    TOMBSTONE = object()
+    MAX_TOMBSTONE_LOAD = 1 / 4
+
+    def __init__(self, sizes=None, tombstones: bool = False, hash_strategy=None, shrink: bool = False) -> None:
         """
         Initialise the Hash Table.
+
+        :param sizes: The table sizes to grow through before computing more, TABLE_SIZES by default.
+        :param tombstones: Whether to delete with tombstones instead of reinserting clusters.
+        :param hash_strategy: Function from a key to a non-negative int, such as a
+            hash_strategy.UniversalHash, reduced modulo the table size. None uses the fixed polynomial hash.
+        :param shrink: Whether to move back down the table sizes when deletes leave the table sparse.
         """
         if sizes is not None:
             self.TABLE_SIZES = sizes
+        self.hash_strategy = hash_strategy
         self.size_index = 0
-        self.array:ArrayR[tuple[K, V]] = ArrayR(self.TABLE_SIZES[self.size_index])
+        self._allocate(self.TABLE_SIZES[self.size_index])
         self.count = 0
+        self.use_tombstones = tombstones
+        self.tombstone_count = 0
+        self.shrink = shrink
+
+    @classmethod
+    def with_capacity(cls, capacity: int, sizes=None, **kwargs) -> LinearProbeTable[K, V]:
+        """
+        Creates an empty table already large enough to hold `capacity` items without growing.
+        Other arguments are passed on to the constructor.
+
+        :complexity: O(S + M) where S is the number of table sizes and M the chosen size.
+        """
+        table = cls(sizes, **kwargs)
+        size_index = 0
+        while capacity > table._size_at(size_index) * table.MAX_LOAD:
+            size_index += 1
+        if size_index > 0:
+            table.size_index = size_index
+            table._allocate(table.TABLE_SIZES[size_index])
+        return table
+
+    def _size_at(self, size_index: int) -> int:
+        """
+        Returns the table size at an index of TABLE_SIZES. Sizes past the end of the
+        list are computed and added to it, each the next prime after twice the one before.
 
-    def hash(self, key: K) -> int:
+        :complexity best: O(1) when the size is in the list.
+        :complexity worst: O(I * next_prime) where I is the number of sizes computed.
+        """
+        if size_index >= len(self.TABLE_SIZES):
+            sizes = list(self.TABLE_SIZES)
+            while size_index >= len(sizes):
+                sizes.append(next_prime(2 * sizes[-1]))
+            self.TABLE_SIZES = sizes
+        return self.TABLE_SIZES[size_index]
+
+    def _shrink_if_sparse(self) -> None:
+        """
+        With shrink=True, moves to the previous table size once less than MIN_LOAD of the table is used.
+
+        :complexity: O(1), or O(_resize) when the table shrinks.
+        """
+        if self.shrink and self.size_index > 0 and self.count < self.table_size * self.MIN_LOAD:
+            self._resize(self.size_index - 1)
+
+    @classmethod
+    def from_items(cls, items, sizes=None, **kwargs) -> LinearProbeTable[K, V]:
+        """
+        Builds a table from (key, value) pairs in one pass, sized once up front so it never rehashes.
+        Later pairs overwrite earlier ones with the same key.
+        Other arguments are passed on to the constructor.
+
+        :complexity best: O(N*hash(K)) No probing.
+        :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing.
+        Where N is the number of items
+        """
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        table = cls.with_capacity(len(items), sizes, **kwargs)
+        table._bulk_insert(items)
+        return table
+
+    def _allocate(self, size: int) -> None:
+        """
+        Replaces the storage with an empty array of the given size.
+        Subclasses that store items differently override this.
+        """
+        self.array: ArrayR[tuple[K, V]] = ArrayR(size)
+
+    def _bulk_insert(self, items) -> None:
+        """
+        Inserts (key, value) pairs without checking whether the table has to grow.
+
+        :pre: the table is large enough for the items.
+        :complexity: See linear probe, for each item.
+        """
+        for key, value in items:
+            position = self._linear_probe(key, True)
+            if self.array[position] is None:
+                self.count += 1
+            elif self.array[position] is self.TOMBSTONE:
+                self.count += 1
+                self.tombstone_count -= 1
+            self.array[position] = (key, value)
+
+    def hash(self, key: K, size: int = None) -> int:
         """
         Hash a key for insert/retrieve/update into the hashtable.
 
-        :complexity: O(len(key))
+        :param size: The table size to hash for, the current table size by default.
+        :complexity: O(len(key)), or the complexity of the hash strategy.
         """
+        if size is None:
+            size = self.table_size
+        if self.hash_strategy is not None:
+            return self.hash_strategy(key) % size
 
         value = 0
         a = 31415
         for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
+            value = (ord(char) + a * value) % size
+            a = a * self.HASH_BASE % (size - 1)
         return value
 
     @property
@@ -80,20 +195,28 @@ class LinearProbeTable(Generic[K, V]):
         """
         # Initial position
         position = self.hash(key)
+        # Inserts of new keys reuse the first tombstone on the way
+        tombstone = None
 
         for _ in range(self.table_size):
             if self.array[position] is None:
                 # Empty spot. Am I upserting or retrieving?
                 if is_insert:
-                    return position
+                    return position if tombstone is None else tombstone
                 else:
                     raise KeyError(key)
+            elif self.array[position] is self.TOMBSTONE:
+                if tombstone is None:
+                    tombstone = position
+                position = (position + 1) % self.table_size
             elif self.array[position][0] == key:
                 return position
             else:
                 # Taken by something else. Time to linear probe.
                 position = (position + 1) % self.table_size
 
+        if is_insert and tombstone is not None:
+            return tombstone
         if is_insert:
             raise FullError("Table is full!")
         else:
@@ -108,7 +231,7 @@ class LinearProbeTable(Generic[K, V]):
         res = ArrayR(self.count)
         i = 0
         for x in range(self.table_size):
-            if self.array[x] is not None:
+            if self.array[x] is not None and self.array[x] is not self.TOMBSTONE:
                 res[i] = self.array[x][0]
                 i += 1
         return res
@@ -122,7 +245,7 @@ class LinearProbeTable(Generic[K, V]):
         res = ArrayR(self.count)
         i = 0
         for x in range(self.table_size):
-            if self.array[x] is not None:
+            if self.array[x] is not None and self.array[x] is not self.TOMBSTONE:
                 res[i] = self.array[x][1]
                 i += 1
         return res
@@ -155,17 +278,20 @@ class LinearProbeTable(Generic[K, V]):
         Set an (key, value) pair in our hash table.
 
         :complexity: See linear probe.
-        :raises FullError: when the table cannot be resized further.
+        :raises FullError: when the table is full.
         """
 
         position = self._linear_probe(key, True)
 
         if self.array[position] is None:
             self.count += 1
+        elif self.array[position] is self.TOMBSTONE:
+            self.count += 1
+            self.tombstone_count -= 1
 
         self.array[position] = (key, data)
 
-        if len(self) > self.table_size / 2:
+        if len(self) > self.table_size * self.MAX_LOAD:
             self._rehash()
 
     def __delitem__(self, key: K) -> None:
@@ -174,9 +300,20 @@ class LinearProbeTable(Generic[K, V]):
 
         :complexity best: O(hash(key)) deleting item is not probed and in correct spot.
         :complexity worst: O(N*hash(key)+N^2*comp(K)) deleting item is midway through large chain.
+            With tombstones, O(hash(key) + N*comp(K)) to find the item, plus O(_compact) once
+            tombstones pass MAX_TOMBSTONE_LOAD.
         :raises KeyError: when the key doesn't exist.
         """
         position = self._linear_probe(key, False)
+        if self.use_tombstones:
+            self.array[position] = self.TOMBSTONE
+            self.count -= 1
+            self.tombstone_count += 1
+            if self.tombstone_count > self.table_size * self.MAX_TOMBSTONE_LOAD:
+                self._compact()
+            self._shrink_if_sparse()
+            return
+
         # Remove the element
         self.array[position] = None
         self.count -= 1
@@ -189,6 +326,7 @@ class LinearProbeTable(Generic[K, V]):
             newpos = self._linear_probe(key2, True)
             self.array[newpos] = (key2, value)
             position = (position + 1) % self.table_size
+        self._shrink_if_sparse()
 
     def is_empty(self) -> bool:
         return self.count == 0
@@ -200,22 +338,43 @@ class LinearProbeTable(Generic[K, V]):
         """
         Need to resize table and reinsert all values
 
+        :complexity: See _resize.
+        """
+        self._resize(self.size_index + 1)
+
+    def _resize(self, size_index: int) -> None:
+        """
+        Moves every item into a new array of the size at size_index.
+
         :complexity best: O(N*hash(K)) No probing.
         :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing.
         Where N is len(self)
         """
         old_array = self.array
-        self.size_index += 1
-        if self.size_index == len(self.TABLE_SIZES):
-            # Cannot be resized further.
-            return
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
+        self.size_index = size_index
+        self.array = ArrayR(self._size_at(size_index))
         self.count = 0
+        self.tombstone_count = 0
         for item in old_array:
-            if item is not None:
+            if item is not None and item is not self.TOMBSTONE:
                 key, value = item
                 self[key] = value
 
+    def _compact(self) -> None:
+        """
+        Rebuilds the table at the same size without its tombstones.
+
+        :complexity best: O(N*hash(K)) No probing.
+        :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing.
+        Where N is the table size
+        """
+        old_array = self.array
+        self.array = ArrayR(len(old_array))
+        self.tombstone_count = 0
+        for item in old_array:
+            if item is not None and item is not self.TOMBSTONE:
+                self.array[self._linear_probe(item[0], True)] = item
+
     def __str__(self) -> str:
         """
         Returns all they key/value pairs in our hash table (no particular
@@ -224,7 +383,592 @@ class LinearProbeTable(Generic[K, V]):
         """
         result = ""
         for item in self.array:
-            if item is not None:
+            if item is not None and item is not self.TOMBSTONE:
                 (key, value) = item
                 result += "(" + str(key) + "," + str(value) + ")\n"
         return result
+
+
+class IncrementalLinearProbeTable(LinearProbeTable[K, V]):
+    """
+    Linear Probe Table that spreads each resize over the operations that follow it.
+
+    When the table grows, the old array is kept alongside the new one and every
+    later operation migrates a bounded number of its slots, so no single insert pays
+    for reinserting the whole table. While a migration is running, keys are looked
+    up in the new array first and then in the old one.
+
+    Items that leave the old array (migrated, updated or deleted) are replaced by a
+    tombstone that lookups step over, so the clusters of the old array stay intact.
+
+    Unless stated otherwise, all methods have the same complexity as in LinearProbeTable,
+    plus O(MIGRATE_STEP * probe) while a migration is running.
+    """
+
+    # Old slots migrated per operation. A migration finishes long before the new array needs to grow.
+    MIGRATE_STEP = 8
+
+    def __init__(self, sizes=None, tombstones: bool = False, hash_strategy=None, shrink: bool = False) -> None:
+        LinearProbeTable.__init__(self, sizes, tombstones, hash_strategy, shrink)
+        self.old_array: ArrayR[tuple[K, V]] = None
+        self.migrate_index = 0
+
+    def is_migrating(self) -> bool:
+        return self.old_array is not None
+
+    def _migrate(self, steps: int) -> None:
+        """
+        Moves the items of the next `steps` slots of the old array into the new one.
+
+        :complexity: O(steps * (hash(K) + N*comp(K))) where N is the table size.
+        """
+        if self.old_array is None:
+            return
+        end = min(self.migrate_index + steps, len(self.old_array))
+        for position in range(self.migrate_index, end):
+            item = self.old_array[position]
+            if item is not None and item is not self.TOMBSTONE:
+                self.old_array[position] = self.TOMBSTONE
+                key, value = item
+                new_position = self._linear_probe(key, True)
+                if self.array[new_position] is self.TOMBSTONE:
+                    self.tombstone_count -= 1
+                self.array[new_position] = (key, value)
+        self.migrate_index = end
+        if self.migrate_index == len(self.old_array):
+            self.old_array = None
+            self.migrate_index = 0
+
+    def _old_position(self, key: K) -> int:
+        """
+        Find the position of a key in the old array.
+
+        :complexity best: O(hash(key)) first position is empty
+        :complexity worst: O(hash(key) + N*comp(K)) where N is the size of the old array.
+        :raises KeyError: When the key is not in the old array.
+        """
+        position = self.hash(key, len(self.old_array))
+        for _ in range(len(self.old_array)):
+            item = self.old_array[position]
+            if item is None:
+                break
+            if item is not self.TOMBSTONE and item[0] == key:
+                return position
+            position = (position + 1) % len(self.old_array)
+        raise KeyError(key)
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value at a certain key
+
+        :complexity: See linear probe, done in both arrays while migrating.
+        :raises KeyError: when the key doesn't exist.
+        """
+        self._migrate(self.MIGRATE_STEP)
+        try:
+            return LinearProbeTable.__getitem__(self, key)
+        except KeyError:
+            if self.old_array is None:
+                raise
+        return self.old_array[self._old_position(key)][1]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table. Keys still in the old array are moved to the new one.
+
+        :complexity: See linear probe, done in both arrays while migrating.
+        :raises FullError: when the table is full.
+        """
+        self._migrate(self.MIGRATE_STEP)
+        if self.old_array is not None:
+            try:
+                position = self._old_position(key)
+            except KeyError:
+                pass
+            else:
+                self.old_array[position] = self.TOMBSTONE
+                self.count -= 1
+        LinearProbeTable.__setitem__(self, key, data)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+
+        :complexity: See LinearProbeTable.__delitem__, items of the old array are removed in O(old linear probe).
+        :raises KeyError: when the key doesn't exist.
+        """
+        self._migrate(self.MIGRATE_STEP)
+        try:
+            LinearProbeTable.__delitem__(self, key)
+            return
+        except KeyError:
+            if self.old_array is None:
+                raise
+        self.old_array[self._old_position(key)] = self.TOMBSTONE
+        self.count -= 1
+        self._shrink_if_sparse()
+
+    def _resize(self, size_index: int) -> None:
+        """
+        Starts moving to the table size at size_index. Items are migrated by later operations.
+
+        :complexity best: O(M) to allocate the new array, where M is its size.
+        :complexity worst: O(M + N*hash(K) + N^2*comp(K)) when a previous migration has to be finished first,
+            where N is len(self).
+        """
+        if self.old_array is not None:
+            self._migrate(len(self.old_array))
+        self.size_index = size_index
+        self.old_array = self.array
+        self.migrate_index = 0
+        self.array = ArrayR(self._size_at(size_index))
+        self.tombstone_count = 0
+
+    def __items(self):
+        arrays = (self.array,) if self.old_array is None else (self.array, self.old_array)
+        for array in arrays:
+            for item in array:
+                if item is not None and item is not self.TOMBSTONE:
+                    yield item
+
+    def keys(self) -> ArrayR[K]:
+        """
+        Returns all keys in the hash table.
+
+        :complexity: O(N) where N is the size of both arrays.
+        """
+        res = ArrayR(self.count)
+        for i, item in enumerate(self.__items()):
+            res[i] = item[0]
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the hash table.
+
+        :complexity: O(N) where N is the size of both arrays.
+        """
+        res = ArrayR(self.count)
+        for i, item in enumerate(self.__items()):
+            res[i] = item[1]
+        return res
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular
+        order).
+        :complexity: O(N * (str(key) + str(value))) where N is the size of both arrays
+        """
+        result = ""
+        for key, value in self.__items():
+            result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
+
+
+class RobinHoodTable(LinearProbeTable[K, V]):
+    """
+    Linear Probe Table using Robin Hood hashing.
+
+    Every slot records how far its item is from the position its key hashes to.
+    An insert that reaches an item closer to home than itself takes that slot
+    and carries on inserting the displaced item instead, which keeps probe
+    distances short and even. Lookups stop as soon as they reach an item closer
+    to home than the key would be, and deletes shift the following items back
+    instead of leaving tombstones.
+
+    The even distances allow the table to fill up to MAX_LOAD before growing.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    MAX_LOAD = 0.9
+
+    def __init__(self, sizes=None, hash_strategy=None, shrink: bool = False) -> None:
+        LinearProbeTable.__init__(self, sizes, hash_strategy=hash_strategy, shrink=shrink)
+
+    def _allocate(self, size: int) -> None:
+        self.array = ArrayR(size)
+        self.distances: ArrayR[int] = ArrayR(size)
+
+    def _bulk_insert(self, items) -> None:
+        """
+        Inserts (key, value) pairs without checking whether the table has to grow.
+
+        :pre: the table is large enough for the items.
+        :complexity: See linear probe and _robin_hood_insert, for each item.
+        """
+        for key, value in items:
+            try:
+                self.array[self._linear_probe(key, False)] = (key, value)
+            except KeyError:
+                self._robin_hood_insert(key, value)
+
+    def _linear_probe(self, key: K, is_insert: bool) -> int:
+        """
+        Find the position of a key in the hash table.
+        Inserts of new keys are done by _robin_hood_insert, so is_insert only changes the error raised.
+
+        :complexity best: O(hash(key)) first position is empty
+        :complexity worst: O(hash(key) + D*comp(K)) where D is the longest probe distance.
+        :raises KeyError: When the key is not in the table.
+        """
+        position = self.hash(key)
+        distance = 0
+        while distance < self.table_size:
+            item = self.array[position]
+            if item is None or self.distances[position] < distance:
+                # The key would have displaced this item had it been inserted
+                break
+            if item[0] == key:
+                return position
+            position = (position + 1) % self.table_size
+            distance += 1
+        raise KeyError(key)
+
+    def _robin_hood_insert(self, key: K, data: V) -> None:
+        """
+        Inserts a key that is not in the table.
+
+        :complexity best: O(hash(key)) first position is empty
+        :complexity worst: O(hash(key) + N) where N is the table size.
+        :raises FullError: When the table is full.
+        """
+        item = (key, data)
+        position = self.hash(key)
+        distance = 0
+        for _ in range(self.table_size):
+            if self.array[position] is None:
+                self.array[position] = item
+                self.distances[position] = distance
+                self.count += 1
+                return
+            if self.distances[position] < distance:
+                # Take from the rich: swap with the item that is closer to home
+                item, self.array[position] = self.array[position], item
+                distance, self.distances[position] = self.distances[position], distance
+            position = (position + 1) % self.table_size
+            distance += 1
+        raise FullError("Table is full!")
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+
+        :complexity: See linear probe and _robin_hood_insert.
+        :raises FullError: when the table is full.
+        """
+        try:
+            position = self._linear_probe(key, False)
+        except KeyError:
+            self._robin_hood_insert(key, data)
+            if len(self) > self.table_size * self.MAX_LOAD:
+                self._rehash()
+        else:
+            self.array[position] = (key, data)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair, shifting the items after it back by one until
+        one is found that is already where its key hashes to.
+
+        :complexity best: O(hash(key)) the next slot is empty or already home.
+        :complexity worst: O(hash(key) + D*comp(K) + N) where D is the longest probe distance and N the table size.
+        :raises KeyError: when the key doesn't exist.
+        """
+        position = self._linear_probe(key, False)
+        following = (position + 1) % self.table_size
+        while self.array[following] is not None and self.distances[following] > 0:
+            self.array[position] = self.array[following]
+            self.distances[position] = self.distances[following] - 1
+            position = following
+            following = (following + 1) % self.table_size
+        self.array[position] = None
+        self.distances[position] = None
+        self.count -= 1
+        self._shrink_if_sparse()
+
+    def _resize(self, size_index: int) -> None:
+        """
+        Moves every item into a new array of the size at size_index.
+
+        :complexity best: O(N*hash(K)) No probing.
+        :complexity worst: O(N*hash(K) + N^2) Lots of displacing.
+        Where N is len(self)
+        """
+        old_array = self.array
+        self.size_index = size_index
+        self._allocate(self._size_at(size_index))
+        self.count = 0
+        for item in old_array:
+            if item is not None:
+                self._robin_hood_insert(item[0], item[1])
+
+
+class SplitLinearProbeTable(LinearProbeTable[K, V]):
+    """
+    Linear Probe Table that stores keys and values in parallel arrays instead of
+    one (key, value) tuple per slot.
+
+    Updating the value of an existing key is a single write with no allocation.
+    With cache_hashes=True, the hash of each key is kept in a third array, and
+    probes compare it before comparing keys, so most items of a cluster are
+    skipped without a key comparison. Supports the same tombstone mode as
+    LinearProbeTable.
+
+    With a hash_strategy the stored hash is the strategy's full width hash, which
+    does not depend on the table size, so resizing reuses it and never hashes a
+    key again. Without one, the stored hash is the key's home position.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    def __init__(self, sizes=None, tombstones: bool = False, cache_hashes: bool = True, hash_strategy=None,
+                 shrink: bool = False) -> None:
+        """
+        Initialise the Hash Table.
+
+        :param sizes: The table sizes to grow through, TABLE_SIZES by default.
+        :param tombstones: Whether to delete with tombstones instead of reinserting clusters.
+        :param cache_hashes: Whether to keep the hash of every key.
+        :param hash_strategy: See LinearProbeTable.
+        :param shrink: See LinearProbeTable.
+        """
+        # Read by _allocate, which the base initialiser calls
+        self.cache_hashes = cache_hashes
+        LinearProbeTable.__init__(self, sizes, tombstones, hash_strategy, shrink)
+
+    def _allocate(self, size: int) -> None:
+        self.key_array: ArrayR[K] = ArrayR(size)
+        self.value_array: ArrayR[V] = ArrayR(size)
+        self.hash_array: ArrayR[int] = ArrayR(size) if self.cache_hashes else None
+
+    @property
+    def table_size(self) -> int:
+        return len(self.key_array)
+
+    def _full_hash(self, key: K) -> int:
+        """
+        The hash kept for a key in hash_array: the full width hash of the hash
+        strategy, or the home position of the key when there is no strategy.
+
+        :complexity: O(hash(key))
+        """
+        if self.hash_strategy is not None:
+            return self.hash_strategy(key)
+        return self.hash(key)
+
+    def _probe(self, key: K, is_insert: bool) -> tuple[int, int]:
+        """
+        Linear probe that also returns the hash of the key to keep in hash_array.
+
+        :complexity best: O(hash(key)) first position is empty
+        :complexity worst: O(hash(key) + N*comp(K)) when we've searched the entire table
+                        where N is the tablesize
+        :raises KeyError: When the key is not in the table, but is_insert is False.
+        :raises FullError: When a table is full and cannot be inserted.
+        """
+        full = self._full_hash(key)
+        position = full % self.table_size
+        tombstone = None
+        hashes = self.hash_array
+        for _ in range(self.table_size):
+            stored = self.key_array[position]
+            if stored is None:
+                if is_insert:
+                    return (position if tombstone is None else tombstone), full
+                raise KeyError(key)
+            elif stored is self.TOMBSTONE:
+                if tombstone is None:
+                    tombstone = position
+            elif (hashes is None or hashes[position] == full) and stored == key:
+                return position, full
+            position = (position + 1) % self.table_size
+
+        if is_insert and tombstone is not None:
+            return tombstone, full
+        if is_insert:
+            raise FullError("Table is full!")
+        raise KeyError(key)
+
+    def _linear_probe(self, key: K, is_insert: bool) -> int:
+        """
+        :complexity: See _probe.
+        """
+        return self._probe(key, is_insert)[0]
+
+    def _bulk_insert(self, items) -> None:
+        """
+        Inserts (key, value) pairs without checking whether the table has to grow.
+
+        :pre: the table is large enough for the items.
+        :complexity: See _probe, for each item.
+        """
+        for key, value in items:
+            self._store(key, value)
+
+    def _place(self, key: K, data: V) -> int:
+        """
+        Writes a key and its value into its probed position and returns that position.
+
+        :complexity: See _probe.
+        """
+        position, full = self._probe(key, True)
+        self.key_array[position] = key
+        self.value_array[position] = data
+        if self.hash_array is not None:
+            self.hash_array[position] = full
+        return position
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value at a certain key
+
+        :complexity: See linear probe.
+        :raises KeyError: when the key doesn't exist.
+        """
+        return self.value_array[self._linear_probe(key, False)]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table, updating existing values in place.
+
+        :complexity: See linear probe.
+        :raises FullError: when the table is full.
+        """
+        self._store(key, data)
+        if len(self) > self.table_size * self.MAX_LOAD:
+            self._rehash()
+
+    def _store(self, key: K, data: V) -> None:
+        """
+        Sets a key's value, counting the key if it is new.
+
+        :complexity: See _probe.
+        """
+        position, full = self._probe(key, True)
+        stored = self.key_array[position]
+        if stored is None or stored is self.TOMBSTONE:
+            self.count += 1
+            if stored is self.TOMBSTONE:
+                self.tombstone_count -= 1
+            self.key_array[position] = key
+            if self.hash_array is not None:
+                self.hash_array[position] = full
+        self.value_array[position] = data
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+
+        :complexity: See LinearProbeTable.__delitem__.
+        :raises KeyError: when the key doesn't exist.
+        """
+        position = self._linear_probe(key, False)
+        self.value_array[position] = None
+        self.count -= 1
+        if self.use_tombstones:
+            self.key_array[position] = self.TOMBSTONE
+            self.tombstone_count += 1
+            if self.tombstone_count > self.table_size * self.MAX_TOMBSTONE_LOAD:
+                self._compact()
+            self._shrink_if_sparse()
+            return
+
+        self.key_array[position] = None
+        # Start moving over the cluster
+        position = (position + 1) % self.table_size
+        while self.key_array[position] is not None:
+            key2, value = self.key_array[position], self.value_array[position]
+            self.key_array[position] = None
+            self.value_array[position] = None
+            self._place(key2, value)
+            position = (position + 1) % self.table_size
+        self._shrink_if_sparse()
+
+    def __items(self):
+        for position in range(self.table_size):
+            key = self.key_array[position]
+            if key is not None and key is not self.TOMBSTONE:
+                yield key, self.value_array[position]
+
+    def __reinsert(self, size: int) -> None:
+        """
+        Moves every item into new arrays of the given size.
+
+        When the stored hashes are full width hashes, each item goes to the first
+        free slot from its stored hash, with no hashing and no key comparisons.
+        """
+        if self.hash_strategy is None or self.hash_array is None:
+            items = list(self.__items())
+            self._allocate(size)
+            self.tombstone_count = 0
+            for key, value in items:
+                self._place(key, value)
+            return
+
+        old_keys, old_values, old_hashes = self.key_array, self.value_array, self.hash_array
+        self._allocate(size)
+        self.tombstone_count = 0
+        for old_position in range(len(old_keys)):
+            key = old_keys[old_position]
+            if key is None or key is self.TOMBSTONE:
+                continue
+            full = old_hashes[old_position]
+            position = full % size
+            while self.key_array[position] is not None:
+                position = (position + 1) % size
+            self.key_array[position] = key
+            self.value_array[position] = old_values[old_position]
+            self.hash_array[position] = full
+
+    def _resize(self, size_index: int) -> None:
+        """
+        Moves every item into new arrays of the size at size_index.
+
+        :complexity best: O(N*hash(K)) No probing, or O(N) with a hash strategy.
+        :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing, or O(N^2) with a hash strategy.
+        Where N is len(self)
+        """
+        self.size_index = size_index
+        self.__reinsert(self._size_at(size_index))
+
+    def _compact(self) -> None:
+        """
+        Rebuilds the table at the same size without its tombstones.
+
+        :complexity: See _rehash.
+        """
+        self.__reinsert(self.table_size)
+
+    def keys(self) -> ArrayR[K]:
+        """
+        Returns all keys in the hash table.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        res = ArrayR(self.count)
+        for i, (key, _) in enumerate(self.__items()):
+            res[i] = key
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the hash table.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        res = ArrayR(self.count)
+        for i, (_, value) in enumerate(self.__items()):
+            res[i] = value
+        return res
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular
+        order).
+        :complexity: O(N * (str(key) + str(value))) where N is the table size
+        """
+        result = ""
+        for key, value in self.__items():
+            result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
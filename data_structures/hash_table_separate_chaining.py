@@ -1,20 +1,154 @@
 """ Hash Table ADT
 
-Defines a Hash Table using Linear Probing for conflict resolution.
-It currently rehashes the primary cluster to handle deletion.
+Defines a Hash Table using Separate Chaining for conflict resolution.
+Each chain is a small array-backed bucket, and the table grows once it holds
+more items than MAX_LOAD times its size. Chains that grow past TREEIFY_THRESHOLD
+are kept sorted by key, so that even a very long chain is searched in O(log n).
 """
+from __future__ import annotations
 __author__ = 'Brendon Taylor & Rupert Ebeling'
 __docformat__ = 'reStructuredText'
 __modified__ = '15/08/2023'
 __since__ = '31/03/2023'
 
+from data_structures.array_sorted_list import ArraySortedList
 from data_structures.referential_array import ArrayR
-from data_structures.linked_list import LinkedList
-from typing import TypeVar, Generic
+from typing import Generator, TypeVar, Generic
 
 T = TypeVar('T')
 
 
+class _ArrayBucket(Generic[T]):
+    """
+    The chain of one position, as parallel arrays of keys and values.
+    Items are unordered, so deleting moves the last item into the gap.
+    """
+    INITIAL_CAPACITY = 2
+
+    def __init__(self) -> None:
+        self.keys: ArrayR[str] = ArrayR(self.INITIAL_CAPACITY)
+        self.values: ArrayR[T] = ArrayR(self.INITIAL_CAPACITY)
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def index_of(self, key: str) -> int:
+        """
+        Returns the index of the key in the bucket, or -1 when it is not there.
+        :complexity: O(B * comp(K)) where B is the length of the bucket
+        """
+        keys = self.keys
+        for index in range(self.length):
+            if keys[index] == key:
+                return index
+        return -1
+
+    def append(self, key: str, data: T) -> None:
+        """
+        :complexity: O(1) amortised, O(B) when the arrays have to grow
+        """
+        if self.length == len(self.keys):
+            keys, values = self.keys, self.values
+            self.keys = ArrayR(2 * len(keys))
+            self.values = ArrayR(2 * len(values))
+            for index in range(self.length):
+                self.keys[index] = keys[index]
+                self.values[index] = values[index]
+        self.keys[self.length] = key
+        self.values[self.length] = data
+        self.length += 1
+
+    def delete_at(self, index: int) -> None:
+        """
+        :complexity: O(1)
+        """
+        self.length -= 1
+        self.keys[index] = self.keys[self.length]
+        self.values[index] = self.values[self.length]
+        self.keys[self.length] = None
+        self.values[self.length] = None
+
+    def value_at(self, index: int) -> T:
+        return self.values[index]
+
+    def set_value(self, index: int, data: T) -> None:
+        self.values[index] = data
+
+    def __iter__(self) -> Generator[tuple[str, T], None, None]:
+        for index in range(self.length):
+            yield self.keys[index], self.values[index]
+
+
+class _Entry(Generic[T]):
+    """ A key and its value, ordered and compared by key only. """
+
+    def __init__(self, key: str, value: T = None) -> None:
+        self.key = key
+        self.value = value
+
+    def __eq__(self, other: _Entry) -> bool:
+        return self.key == other.key
+
+    def __lt__(self, other: _Entry) -> bool:
+        return self.key < other.key
+
+    def __str__(self) -> str:
+        return "(" + str(self.key) + "," + str(self.value) + ")"
+
+
+class _SortedBucket(Generic[T]):
+    """
+    A long chain kept sorted by key in an ArraySortedList, found by binary search.
+    Has the same interface as _ArrayBucket.
+    """
+
+    def __init__(self, items) -> None:
+        """
+        :complexity: O(B * log(B) * comp(K)) where B is the number of items
+        """
+        self.entries: ArraySortedList[_Entry[T]] = ArraySortedList(len(items))
+        for key, value in items:
+            self.entries.add(_Entry(key, value))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def index_of(self, key: str) -> int:
+        """
+        Returns the index of the key in the bucket, or -1 when it is not there.
+        :complexity: O(log(B) * comp(K)) where B is the length of the bucket
+        """
+        try:
+            return self.entries.index(_Entry(key))
+        except ValueError:
+            return -1
+
+    def append(self, key: str, data: T) -> None:
+        """
+        Adds a key that is not in the bucket yet, in its sorted place.
+        :complexity: O(log(B) * comp(K) + B) where B is the length of the bucket
+        """
+        self.entries.add(_Entry(key, data))
+
+    def delete_at(self, index: int) -> None:
+        """
+        :complexity: O(B) where B is the length of the bucket
+        """
+        self.entries.delete_at_index(index)
+
+    def value_at(self, index: int) -> T:
+        return self.entries[index].value
+
+    def set_value(self, index: int, data: T) -> None:
+        self.entries[index].value = data
+
+    def __iter__(self) -> Generator[tuple[str, T], None, None]:
+        for index in range(len(self.entries)):
+            entry = self.entries[index]
+            yield entry.key, entry.value
+
+
 class HashTableSeparateChaining(Generic[T]):
     """
     Separate Chaining Hash Table
@@ -23,6 +157,10 @@ class HashTableSeparateChaining(Generic[T]):
         MIN_CAPACITY: smallest valid table size
         DEFAULT_TABLE_SIZE: default table size used in the __init__
         DEFAULT_HASH_TABLE: default hash base used for the hash function
+        MAX_LOAD: average chain length above which the table grows
+        TREEIFY_THRESHOLD: chain length above which a chain is kept sorted
+        UNTREEIFY_THRESHOLD: length below which a sorted chain goes back to an unsorted one
+        TABLE_SIZES: prime sizes the table grows through, at least doubling each time
 
     attributes:
         count: number of elements in the hash table
@@ -32,11 +170,20 @@ class HashTableSeparateChaining(Generic[T]):
 
     DEFAULT_TABLE_SIZE = 17
     DEFAULT_HASH_BASE = 31
+    MAX_LOAD = 1
+    TREEIFY_THRESHOLD = 8
+    UNTREEIFY_THRESHOLD = 6
+
+    TABLE_SIZES = [17, 37, 79, 163, 331, 673, 1361, 2729, 5471, 10949, 21911, 43853, 87719, 175447, 350899,
+                   701819, 1403641, 2807303]
 
-    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE) -> None:
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE, hash_strategy=None) -> None:
         """
+        :param hash_strategy: Function from a key to a non-negative int, such as a
+            hash_strategy.UniversalHash, reduced modulo the table size. None uses the fixed polynomial hash.
         :complexity: O(A) where A is complexity of ArrayR.__init__()
         """
+        self.hash_strategy = hash_strategy
         self.count = 0
         self.table = ArrayR(max(self.MIN_CAPACITY, table_size))
 
@@ -53,40 +200,76 @@ class HashTableSeparateChaining(Generic[T]):
         :raises KeyError: when the key doesn't exist
         """
         position = self.hash(key)
-        if self.table[position] is None:
+        bucket = self.table[position]
+        index = -1 if bucket is None else bucket.index_of(key)
+        if index < 0:
             raise KeyError(key)
 
-        for index, item in enumerate(self.table[position]):
-            if item[0] == key:
-                if len(self.table[position]) <= 1:
-                    self.table[position] = None
-                else:
-                    self.table[position].delete_at_index(index)
-
-                self.count -= 1
-                return
-
-        raise KeyError(key)
+        if len(bucket) <= 1:
+            self.table[position] = None
+        else:
+            bucket.delete_at(index)
+            if isinstance(bucket, _SortedBucket) and len(bucket) < self.UNTREEIFY_THRESHOLD:
+                self.table[position] = self.__untreeify(bucket)
+        self.count -= 1
 
     def __setitem__(self, key: str, data: T) -> None:
         """
-        Set a (key, data) pair in our hash table
+        Set a (key, data) pair in our hash table, finding or inserting the key in one pass over its chain
+        :complexity: O(hash(key) + B * comp(K)) where B is the length of the chain,
+            plus O(_rehash) when the table grows.
         """
         position = self.hash(key)
-        if self.table[position] is None:
-            self.table[position] = LinkedList()
-
-        # Attempt to find the key in our linked list
-        if len(self.table[position]) > 0:
-            for index, item in enumerate(self.table[position]):
-                if item[0] == key:
-                    # If found update the data
-                    self.table[position][index] = (key, data)
-                    return
-                
-        # self.table[position].insert(0, (key, data)) # To insert at the beginning 
-        self.table[position].append((key, data))
+        bucket = self.table[position]
+        index = -1 if bucket is None else bucket.index_of(key)
+        if index >= 0:
+            bucket.set_value(index, data)
+            return
+
+        self.__append(position, key, data)
         self.count += 1
+        if self.count > len(self.table) * self.MAX_LOAD:
+            self._rehash()
+
+    def __append(self, position: int, key: str, data: T) -> None:
+        """
+        Adds a key that is not in the table to the chain at position, sorting the chain once it gets too long.
+        :complexity: See _ArrayBucket.append and _SortedBucket.append, O(B * log(B) * comp(K)) when the chain is sorted.
+        """
+        bucket = self.table[position]
+        if bucket is None:
+            bucket = self.table[position] = _ArrayBucket()
+        bucket.append(key, data)
+        if isinstance(bucket, _ArrayBucket) and len(bucket) > self.TREEIFY_THRESHOLD:
+            self.table[position] = _SortedBucket([item for item in bucket])
+
+    @staticmethod
+    def __untreeify(bucket: _SortedBucket[T]) -> _ArrayBucket[T]:
+        chain: _ArrayBucket[T] = _ArrayBucket()
+        for key, data in bucket:
+            chain.append(key, data)
+        return chain
+
+    def _rehash(self) -> None:
+        """
+        Moves every item into the next table size that is at least twice the current one.
+        Nothing happens once the largest size is reached.
+        :complexity: O(N * hash(K) + M) where N is the number of items and M the new table size
+        """
+        new_size = None
+        for size in self.TABLE_SIZES:
+            if size >= 2 * len(self.table):
+                new_size = size
+                break
+        if new_size is None:
+            return
+
+        old_table = self.table
+        self.table = ArrayR(new_size)
+        for bucket in old_table:
+            if bucket is not None:
+                for key, data in bucket:
+                    self.__append(self.hash(key), key, data)
 
     def __contains__(self, key: str) -> bool:
         """
@@ -107,13 +290,11 @@ class HashTableSeparateChaining(Generic[T]):
         :raises KeyError: when the key doesn't exist
         """
         position = self.hash(key)
-        if self.table[position] is None:
+        bucket = self.table[position]
+        index = -1 if bucket is None else bucket.index_of(key)
+        if index < 0:
             raise KeyError(key)
-        for item in self.table[position]:
-            if item[0] == key:
-                return item[1]
-
-        raise KeyError(key)
+        return bucket.value_at(index)
 
     def is_empty(self):
         """
@@ -126,8 +307,11 @@ class HashTableSeparateChaining(Generic[T]):
         """
         Universal Hash function
         :post: returns a valid position (0 <= value < table_size)
-        :complexity: O(K) where K is the size of the key
+        :complexity: O(K) where K is the size of the key, or the complexity of the hash strategy
         """
+        if self.hash_strategy is not None:
+            return self.hash_strategy(key) % len(self.table)
+
         value = 0
         a = 31415
         for char in key:
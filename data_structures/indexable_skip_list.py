@@ -0,0 +1,190 @@
+""" Indexable skip list.
+
+Defines a sorted collection of (key, value) pairs that supports insertion,
+deletion, rank queries and access by position in O(log N) expected time.
+Every link also records how many positions it skips over, which is what
+allows positions to be found without walking the bottom level.
+"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+from data_structures.referential_array import ArrayR
+from random_gen import RandomStream
+from typing import Generic, TypeVar, Union
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class _SkipNode(Generic[K, V]):
+    """ A node with one link (and its width) per level it appears in. """
+
+    def __init__(self, key: K, value: V, height: int) -> None:
+        self.key = key
+        self.value = value
+        self.next: ArrayR[Union[_SkipNode[K, V], None]] = ArrayR(height)
+        self.width: ArrayR[int] = ArrayR(height)
+
+    def height(self) -> int:
+        return len(self.next)
+
+
+class IndexableSkipList(Generic[K, V]):
+    """
+    Sorted (key, value) pairs, smallest key first.
+
+    Keys must be comparable with each other. Node heights are drawn from a
+    private RandomStream, so using the list never affects RandomGen.
+
+    Unless stated otherwise, all methods are O(log N) expected where N is len(self).
+    """
+
+    MAX_HEIGHT = 32
+    DEFAULT_SEED = 1008
+
+    def __init__(self, seed: int = DEFAULT_SEED) -> None:
+        """
+        :complexity: O(MAX_HEIGHT)
+        """
+        self.head: _SkipNode[K, V] = _SkipNode(None, None, self.MAX_HEIGHT)
+        for level in range(self.MAX_HEIGHT):
+            # Widths are measured to the position just past the end
+            self.head.width[level] = 1
+        self.length = 0
+        self.rng = RandomStream(seed)
+
+    def __len__(self) -> int:
+        """ :complexity: O(1) """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """ :complexity: O(1) """
+        return self.length == 0
+
+    def __find_predecessors(self, key: K) -> tuple[ArrayR[_SkipNode[K, V]], ArrayR[int]]:
+        """
+        For every level, finds the last node with a key smaller than `key` and its position
+        (the head is position 0, the first item position 1).
+        """
+        chain = ArrayR(self.MAX_HEIGHT)
+        positions = ArrayR(self.MAX_HEIGHT)
+        node = self.head
+        position = 0
+        for level in range(self.MAX_HEIGHT - 1, -1, -1):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            positions[level] = position
+        return chain, positions
+
+    def __random_height(self) -> int:
+        height = 1
+        while height < self.MAX_HEIGHT and self.rng.random_chance(0.5):
+            height += 1
+        return height
+
+    def add(self, key: K, value: V = None) -> None:
+        """
+        Inserts a (key, value) pair, before any pairs with an equal key.
+        """
+        chain, positions = self.__find_predecessors(key)
+        new_position = positions[0] + 1
+        node = _SkipNode(key, value, self.__random_height())
+        for level in range(node.height()):
+            previous = chain[level]
+            node.next[level] = previous.next[level]
+            previous.next[level] = node
+            node.width[level] = previous.width[level] - (new_position - 1 - positions[level])
+            previous.width[level] = new_position - positions[level]
+        for level in range(node.height(), self.MAX_HEIGHT):
+            chain[level].width[level] += 1
+        self.length += 1
+
+    def remove(self, key: K) -> V:
+        """
+        Removes the first pair with the given key and returns its value.
+        :raises KeyError: when the key is not in the list.
+        """
+        chain, _ = self.__find_predecessors(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        for level in range(self.MAX_HEIGHT):
+            previous = chain[level]
+            if level < node.height() and previous.next[level] is node:
+                previous.width[level] += node.width[level] - 1
+                previous.next[level] = node.next[level]
+            else:
+                previous.width[level] -= 1
+        self.length -= 1
+        return node.value
+
+    def rank(self, key: K) -> int:
+        """
+        Returns the 0-based position of the first pair with the given key.
+        :raises KeyError: when the key is not in the list.
+        """
+        chain, positions = self.__find_predecessors(key)
+        node = chain[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        return positions[0]
+
+    def __contains__(self, key: K) -> bool:
+        try:
+            self.rank(key)
+        except KeyError:
+            return False
+        return True
+
+    def __node_at(self, index: int) -> _SkipNode[K, V]:
+        if not 0 <= index < self.length:
+            raise IndexError('Index out of bounds')
+        target = index + 1
+        node = self.head
+        position = 0
+        for level in range(self.MAX_HEIGHT - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] <= target:
+                position += node.width[level]
+                node = node.next[level]
+        return node
+
+    def __getitem__(self, index: int) -> tuple[K, V]:
+        """
+        Returns the (key, value) pair at a 0-based position.
+        :raises IndexError: when the index is out of bounds.
+        """
+        node = self.__node_at(index)
+        return node.key, node.value
+
+    def first(self, k: int) -> ArrayR[tuple[K, V]]:
+        """
+        Returns the k pairs with the smallest keys, in order.
+        :complexity: O(k)
+        """
+        k = min(k, self.length)
+        if k <= 0:
+            return None
+        result = ArrayR(k)
+        node = self.head.next[0]
+        for i in range(k):
+            result[i] = (node.key, node.value)
+            node = node.next[0]
+        return result
+
+    def __iter__(self):
+        """
+        Yields every (key, value) pair in order.
+        :complexity: O(N)
+        """
+        node = self.head.next[0]
+        while node is not None:
+            yield node.key, node.value
+            node = node.next[0]
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(f'({key}, {value})' for key, value in self) + ']'
+
+    def __repr__(self) -> str:
+        return str(self)
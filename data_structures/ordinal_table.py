@@ -0,0 +1,180 @@
+""" Hash Table ADT for the members of a single OrdinalEnum """
+from __future__ import annotations
+
+from constants import OrdinalEnum
+from data_structures.referential_array import ArrayR
+from typing import Generic, Union, TypeVar
+
+K = TypeVar('K', bound=OrdinalEnum)
+V = TypeVar('V')
+
+
+class OrdinalTable(Generic[K, V]):
+    """
+    OrdinalTable holds one slot per member of an OrdinalEnum, such as PlayerStats or TeamStats.
+    Every member's slot is its ordinal, so no key is ever hashed or probed.
+    Values are stored directly in their slot, so updating one allocates nothing.
+
+    It has the same interface as HashyPerfectionTable. Keys may be given either as
+    enum members or as their string values, which are converted to members first.
+
+    Type Arguments:
+        - K:    Key Type. Members of the enum the table was created for.
+        - V:    Value Type.
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+    def __init__(self, key_type: type[K]) -> None:
+        """
+        Initialise the table with one slot per member of key_type.
+        """
+        self.key_type: type[K] = key_type
+        self.members: tuple[K, ...] = tuple(key_type)
+        self.array: ArrayR[V] = ArrayR(len(key_type))
+        self.present: bytearray = bytearray(len(key_type))
+        self.count: int = 0
+
+    def hash(self, key: Union[K, str]) -> int:
+        """
+        Returns the slot of a key.
+
+        Complexity:
+        Best Case Complexity: O(1) when key is a member of key_type.
+        Worst Case Complexity: O(len(key)) when key is a string value.
+
+        Raises:
+        KeyError: When the key is not a member or value of key_type.
+        """
+        return self._member(key).ordinal
+
+    def _member(self, key: Union[K, str]) -> K:
+        """
+        Converts a key to a member of key_type.
+
+        Raises:
+        KeyError: When the key is not a member or value of key_type.
+        """
+        if isinstance(key, self.key_type):
+            return key
+        try:
+            return self.key_type(key)
+        except ValueError:
+            raise KeyError(f"{key} not found")
+
+    def __len__(self) -> int:
+        """
+        Returns number of elements in the table
+        """
+        return self.count
+
+    def keys(self) -> ArrayR[K]:
+        """
+        Returns all keys in the table, in the order the enum defines them.
+        An empty table returns a single empty slot, as ArrayR cannot have length 0.
+
+        :complexity: O(N) where N is the number of members of key_type.
+        """
+        res = ArrayR(max(1, self.count))
+        i = 0
+        for x in range(len(self.array)):
+            if self.present[x]:
+                res[i] = self.members[x]
+                i += 1
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the table, in the order the enum defines their keys.
+        An empty table returns a single empty slot, as ArrayR cannot have length 0.
+
+        :complexity: O(N) where N is the number of members of key_type.
+        """
+        res = ArrayR(max(1, self.count))
+        i = 0
+        for x in range(len(self.array)):
+            if self.present[x]:
+                res[i] = self.array[x]
+                i += 1
+        return res
+
+    def __contains__(self, key: Union[K, str]) -> bool:
+        """
+        Checks to see if the given key is in the table
+
+        Complexity:
+        Best Case Complexity: O(hash)
+        Worst Case Complexity: O(hash)
+        """
+        try:
+            return self.present[self.hash(key)] == 1
+        except KeyError:
+            return False
+
+    def __getitem__(self, key: Union[K, str]) -> V:
+        """
+        Get the value at a certain key
+
+        Complexity:
+        Best Case Complexity: O(hash)
+        Worst Case Complexity: O(hash)
+
+        Raises:
+        KeyError: When the key doesn't exist.
+        """
+        position: int = self.hash(key)
+        if not self.present[position]:
+            raise KeyError(f"{key} not found")
+        return self.array[position]
+
+    def __setitem__(self, key: Union[K, str], data: V) -> None:
+        """
+        Set a (key, value) pair in our table.
+
+        Complexity:
+        Best Case Complexity: O(hash)
+        Worst Case Complexity: O(hash)
+
+        Raises:
+        KeyError: When the key is not a member of key_type.
+        """
+        position: int = self.hash(key)
+        if not self.present[position]:
+            self.present[position] = 1
+            self.count += 1
+        self.array[position] = data
+
+    def __delitem__(self, key: Union[K, str]) -> None:
+        """
+        Deletes a (key, value) pair in our table.
+
+        Complexity:
+        Best Case Complexity: O(hash)
+        Worst Case Complexity: O(hash)
+
+        Raises:
+        KeyError: When the key doesn't exist.
+        """
+        position: int = self.hash(key)
+        if not self.present[position]:
+            raise KeyError(f"{key} not found")
+        self.array[position] = None
+        self.present[position] = 0
+        self.count -= 1
+
+    def is_empty(self) -> bool:
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        return self.count == len(self.array)
+
+    def __str__(self) -> str:
+        """
+        Complexity:
+        Best Case Complexity: O(N) where N is the length of the array.
+        Worst Case Complexity: O(N * (str(key) + str(value))) where N is the length of the array.
+        """
+        result: str = ""
+        for x in range(len(self.array)):
+            if self.present[x]:
+                result += "(" + str(self.members[x]) + "," + str(self.array[x]) + ")\n"
+        return result
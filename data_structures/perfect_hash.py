@@ -0,0 +1,290 @@
+""" Minimal perfect hashing for fixed sets of string keys
+
+Builds hash functions that map each key of a set known in advance to its own
+slot of a table with exactly as many slots as there are keys, using the
+hash and displace method:
+
+    1. Keys are split into buckets by a first hash.
+    2. Going from the largest bucket to the smallest, each bucket gets the
+       smallest displacement seed under which a second hash sends all of its
+       keys to slots that are still free.
+
+A lookup is then two string hashes and no probing. Generated functions can be
+saved to and loaded from JSON, so the search only has to run once per key set.
+"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+import json
+import os
+from data_structures.referential_array import ArrayR
+from enum import Enum
+from typing import Generic, Iterable, TypeVar, Union
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class PerfectHash:
+    """
+    A minimal perfect hash function for one key set.
+
+    Keys outside the set still hash to some slot, so the key that owns every slot
+    is kept in `keys` for tables to check against.
+    """
+
+    MASK = (1 << 32) - 1
+    # Seeds tried per bucket before the keys are redistributed with a new first hash
+    MAX_DISPLACEMENT = 1 << 16
+    MAX_ATTEMPTS = 64
+
+    def __init__(self, size: int, bucket_seed: int, displacements: ArrayR[int], keys: ArrayR[str]) -> None:
+        """
+        :param size: The number of slots, equal to the number of keys.
+        :param bucket_seed: The seed of the first hash, which picks a key's bucket.
+        :param displacements: The seed of the second hash for every bucket.
+        :param keys: The key of every slot.
+        """
+        self.size = size
+        self.bucket_seed = bucket_seed
+        self.displacements = displacements
+        self.keys = keys
+
+    def owns(self, slot: int, key: str) -> bool:
+        """
+        Returns whether the key is the one the slot was built for.
+
+        :complexity: O(len(key))
+        """
+        return self.keys[slot] == key
+
+    @staticmethod
+    def seeded_hash(seed: int, key: str) -> int:
+        """
+        A 32 bit FNV-1a hash of the key started from the seed, with a final mix so
+        that the low bits depend on every character.
+
+        :complexity: O(len(key))
+        """
+        value = (2166136261 ^ seed) & PerfectHash.MASK
+        for char in key:
+            value = ((value ^ ord(char)) * 16777619) & PerfectHash.MASK
+        value ^= value >> 16
+        value = (value * 0x45D9F3B) & PerfectHash.MASK
+        value ^= value >> 16
+        return value
+
+    def __call__(self, key: str) -> int:
+        """
+        Returns the slot of a key.
+
+        :complexity: O(len(key))
+        """
+        bucket = self.seeded_hash(self.bucket_seed, key) % len(self.displacements)
+        return self.seeded_hash(self.displacements[bucket], key) % self.size
+
+    @classmethod
+    def generate(cls, keys: Iterable[str]) -> PerfectHash:
+        """
+        Searches for a minimal perfect hash of the given keys.
+
+        :complexity: O(N * L) expected where N is the number of keys and L their
+            longest length, the number of seeds tried is small on average.
+        :raises ValueError: when there are no keys, duplicate keys or no hash was found.
+        """
+        key_list = [str(key) for key in keys]
+        size = len(key_list)
+        if size == 0:
+            raise ValueError("Cannot build a perfect hash with no keys.")
+        if len(set(key_list)) != size:
+            raise ValueError("Keys of a perfect hash must be unique.")
+
+        num_buckets = max(1, size // 2)
+        for bucket_seed in range(cls.MAX_ATTEMPTS):
+            displacements = cls.__displace(key_list, size, num_buckets, bucket_seed)
+            if displacements is not None:
+                slot_keys = ArrayR(size)
+                perfect_hash = cls(size, bucket_seed, displacements, slot_keys)
+                for key in key_list:
+                    slot_keys[perfect_hash(key)] = key
+                return perfect_hash
+        raise ValueError("No perfect hash found for the keys.")
+
+    @classmethod
+    def __displace(cls, keys: list[str], size: int, num_buckets: int, bucket_seed: int) -> Union[ArrayR[int], None]:
+        """
+        Finds a displacement seed for every bucket, or returns None when some bucket has none.
+        """
+        buckets: list[list[str]] = [[] for _ in range(num_buckets)]
+        for key in keys:
+            buckets[cls.seeded_hash(bucket_seed, key) % num_buckets].append(key)
+
+        taken = bytearray(size)
+        displacements = ArrayR(num_buckets)
+        for bucket in sorted(range(num_buckets), key=lambda b: -len(buckets[b])):
+            members = buckets[bucket]
+            for seed in range(cls.MAX_DISPLACEMENT):
+                slots = {cls.seeded_hash(seed, key) % size for key in members}
+                if len(slots) == len(members) and not any(taken[slot] for slot in slots):
+                    for slot in slots:
+                        taken[slot] = 1
+                    displacements[bucket] = seed
+                    break
+            else:
+                return None
+        return displacements
+
+    def to_dict(self) -> dict:
+        return {"size": self.size, "bucket_seed": self.bucket_seed, "displacements": self.displacements.to_list(),
+                "keys": self.keys.to_list()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PerfectHash:
+        return cls(data["size"], data["bucket_seed"], ArrayR.from_list(data["displacements"]),
+                   ArrayR.from_list(data["keys"]))
+
+    @classmethod
+    def cached(cls, keys: Iterable[str], path: str) -> PerfectHash:
+        """
+        Loads the perfect hash of a key set from a JSON file, generating and
+        saving it first when the file is missing or was made for other keys.
+
+        :complexity: O(N * L) where N is the number of keys and L their longest length,
+            plus the search of generate when the cache is not usable.
+        """
+        key_list = sorted(str(key) for key in keys)
+        if os.path.exists(path):
+            with open(path) as file:
+                data = json.load(file)
+            if sorted(data.get("keys", [])) == key_list:
+                return cls.from_dict(data)
+        perfect_hash = cls.generate(key_list)
+        with open(path, "w") as file:
+            json.dump(perfect_hash.to_dict(), file)
+        return perfect_hash
+
+
+class PerfectHashTable(Generic[K, V]):
+    """
+    Hash table for a fixed set of keys, with one slot per key and no probing.
+    It has the same interface as HashyPerfectionTable. Keys outside the set are
+    rejected with a KeyError.
+
+    Keys may be strings or members of a string valued Enum, which are looked up by value.
+
+    Type Arguments:
+        - K:    Key Type. Strings or Enum members.
+        - V:    Value Type.
+
+    Unless stated otherwise, all methods have O(hash) complexity.
+    """
+
+    def __init__(self, keys: Union[Iterable[K], type[Enum], PerfectHash]) -> None:
+        """
+        :param keys: The key set, an Enum whose values are the keys, or an already generated PerfectHash.
+        :complexity: O(PerfectHash.generate) unless a PerfectHash is given.
+        """
+        if not isinstance(keys, PerfectHash):
+            keys = PerfectHash.generate(PerfectHashTable.__key(key) for key in keys)
+        self.perfect_hash = keys
+        self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(keys.size)
+        self.count = 0
+
+    @staticmethod
+    def __key(key: Union[K, Enum]) -> str:
+        return key.value if isinstance(key, Enum) else key
+
+    def hash(self, key: K) -> int:
+        """
+        :complexity: O(len(key))
+        """
+        return self.perfect_hash(self.__key(key))
+
+    def __slot(self, key: K) -> int:
+        """
+        :raises KeyError: when the key is not one of the table's keys.
+        """
+        name = self.__key(key)
+        position = self.perfect_hash(name)
+        if not self.perfect_hash.owns(position, name):
+            raise KeyError(key)
+        return position
+
+    def __position(self, key: K) -> int:
+        """
+        :raises KeyError: when the key is not in the table.
+        """
+        position = self.__slot(key)
+        if self.array[position] is None:
+            raise KeyError(key)
+        return position
+
+    def __len__(self) -> int:
+        return self.count
+
+    def keys(self) -> ArrayR[K]:
+        """
+        :complexity: O(N) where N is the table size.
+        """
+        res = ArrayR(self.count)
+        i = 0
+        for item in self.array:
+            if item is not None:
+                res[i] = item[0]
+                i += 1
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        :complexity: O(N) where N is the table size.
+        """
+        res = ArrayR(self.count)
+        i = 0
+        for item in self.array:
+            if item is not None:
+                res[i] = item[1]
+                i += 1
+        return res
+
+    def __contains__(self, key: K) -> bool:
+        try:
+            self.__position(key)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, key: K) -> V:
+        """
+        :raises KeyError: when the key doesn't exist.
+        """
+        return self.array[self.__position(key)][1]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        :raises KeyError: when the key is not one of the table's keys.
+        """
+        position = self.__slot(key)
+        if self.array[position] is None:
+            self.count += 1
+        self.array[position] = (key, data)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        :raises KeyError: when the key doesn't exist.
+        """
+        self.array[self.__position(key)] = None
+        self.count -= 1
+
+    def is_empty(self) -> bool:
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        return self.count == len(self.array)
+
+    def __str__(self) -> str:
+        result = ""
+        for item in self.array:
+            if item is not None:
+                (key, value) = item
+                result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
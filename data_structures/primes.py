@@ -0,0 +1,54 @@
+""" Prime numbers for hash table sizes
+
+Hash tables grow through a fixed list of prime sizes. Once a table outgrows its
+list, next_prime computes further sizes on demand.
+"""
+__docformat__ = 'reStructuredText'
+
+# Testing against these bases gives the correct answer for every n below 3.3 * 10^24.
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def is_prime(n: int) -> bool:
+    """
+    Deterministic Miller-Rabin primality test.
+
+    :complexity: O(B * log(n)^3) where B is the number of bases.
+    """
+    if n < 2:
+        return False
+    for p in MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+
+    # n - 1 = d * 2^s with d odd
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def next_prime(n: int) -> int:
+    """
+    Returns the smallest prime greater than n.
+
+    :complexity: O(G * B * log(n)^3) where G is the gap to the next prime, O(log(n)) on average.
+    """
+    if n < 2:
+        return 2
+    candidate = n + 1 if n % 2 == 0 else n + 2
+    while not is_prime(candidate):
+        candidate += 2
+    return candidate
@@ -71,6 +71,13 @@ class ArrayR(Generic[T]):
         """
         return [self.array[i] for i in range(len(self))]
 
+    def __reduce__(self) -> tuple:
+        """ Allows the array to be pickled and deep copied, which ctypes arrays do not support
+        on their own (e.g. to send it to another process).
+        :complexity: O(n) where n is the length of the array
+        """
+        return self.__class__.from_list, (self.to_list(),)
+
     def __str__(self) -> str:
         """ Returns a string representation of the array
         :complexity: O(n) where n is the length of the array
@@ -3,107 +3,270 @@ from data_structures.hash_table import LinearProbeTable
 from data_structures.referential_array import ArrayR
 from constants import PlayerPosition, PlayerStats, ResultStats
 from player import Player
-from random_gen import RandomGen
+from random_gen import RandomGen, RandomStream
 from team import Team
+from typing import Iterable, TYPE_CHECKING, Union
+from weighted_table import CumulativeWeightTable
 
+if TYPE_CHECKING:
+    from season import Game, WeekOfGames
 
-class GameSimulator:
 
-    @staticmethod
-    def simulate(home_team: Team, away_team: Team) -> LinearProbeTable:
+class SimulationResults:
+    """
+    Columnar container for the results of a batch of simulated games.
+
+    Each column holds one ResultStats value for every game, row i being the
+    i-th game that was simulated. Use `to_table(i)` (or `results[i]`) to get
+    the same LinearProbeTable that GameSimulator.simulate returns.
+
+    Besides the names the table holds, the player behind every goal, assist,
+    tackle and interception is kept in the *_players columns, in the same order,
+    so players of either team that share a name are never confused.
+    """
+
+    def __init__(self, num_games: int) -> None:
         """
-        Simulates a game between two teams, considering player stats for a more probabilistic outcome.
-        Note: To call this method, use: GameSimulator.simulate(home_team, away_team)
+        Args:
+            num_games (int): The number of games held in the results.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is num_games.
+            Worst Case Complexity: O(N) where N is num_games.
+        """
+        self.count: int = num_games
+        size: int = max(1, num_games)
+        self.home_teams: ArrayR[Team] = ArrayR(size)
+        self.away_teams: ArrayR[Team] = ArrayR(size)
+        self.home_goals: ArrayR[int] = ArrayR(size)
+        self.away_goals: ArrayR[int] = ArrayR(size)
+        self.goal_scorers: ArrayR[Union[ArrayR[str], None]] = ArrayR(size)
+        self.goal_assists: ArrayR[Union[ArrayR[str], None]] = ArrayR(size)
+        self.tackles: ArrayR[Union[ArrayR[str], None]] = ArrayR(size)
+        self.interceptions: ArrayR[Union[ArrayR[str], None]] = ArrayR(size)
+        self.goal_scorer_players: ArrayR[Union[ArrayR[Player], None]] = ArrayR(size)
+        self.goal_assist_players: ArrayR[Union[ArrayR[Player], None]] = ArrayR(size)
+        self.tackle_players: ArrayR[Union[ArrayR[Player], None]] = ArrayR(size)
+        self.interception_players: ArrayR[Union[ArrayR[Player], None]] = ArrayR(size)
+
+    def to_table(self, index: int) -> LinearProbeTable:
+        """
+        Converts the result of a single game into the table format of GameSimulator.simulate.
 
         Args:
-            home_team (Team): The home team.
-            away_team (Team): The away team.
+            index (int): The row of the game in the results.
 
         Returns:
-            LinearProbeTable: A table with keys 'Home Goals', 'Away Goals', 'Goal Scorers',
-                            'Goal Assists', 'Interceptions', 'Tacklers'
+            LinearProbeTable: The result table for that game.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
         """
+        if not 0 <= index < self.count:
+            raise IndexError("Game index out of range.")
         result_table: LinearProbeTable = LinearProbeTable()
+        result_table[ResultStats.HOME_GOALS.value] = self.home_goals[index]
+        result_table[ResultStats.AWAY_GOALS.value] = self.away_goals[index]
+        result_table[ResultStats.GOAL_SCORERS.value] = self.goal_scorers[index]
+        result_table[ResultStats.GOAL_ASSISTS.value] = self.goal_assists[index]
+        result_table[ResultStats.TACKLES.value] = self.tackles[index]
+        result_table[ResultStats.INTERCEPTIONS.value] = self.interceptions[index]
+        return result_table
 
-        # 1. Determine goals scored by each team with a higher likelihood of low scores
-        goal_distribution: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
-        home_goals: int = RandomGen.random_choice(goal_distribution)
-        away_goals: int = RandomGen.random_choice(goal_distribution)
-        result_table[ResultStats.HOME_GOALS.value] = home_goals
-        result_table[ResultStats.AWAY_GOALS.value] = away_goals
+    def __getitem__(self, index: int) -> LinearProbeTable:
+        return self.to_table(index)
 
-        # 2. Select goal scorers and assist providers based on stats
-        goal_scorers: list[str] = []
-        goal_assists: list[str] = []
-        home_players: ArrayR[Player] = home_team.get_players()
-        away_players: ArrayR[Player] = away_team.get_players()
+    def __len__(self) -> int:
+        return self.count
 
-        # Get a list of outfield player from both teams
-        home_outfield: list[Player] = [player for player in home_players if player.get_position() != PlayerPosition.GOALKEEPER]
-        away_outfield: list[Player] = [player for player in away_players if player.get_position() != PlayerPosition.GOALKEEPER]
 
-        all_players: ArrayR[Player] = ArrayR(len(home_players) + len(away_players))
+class _RosterTables:
+    """
+    Per-team data the simulator needs on every game, computed once per team.
+    Weighted tables are only built the first time they are needed.
 
-        for i in range(len(home_players)):
-            all_players[i] = home_players[i]
+    Teams that keep a RosterIndex can provide get_outfield_players(), whose view is
+    read directly. It lists players in the order they were added, the same order
+    as filtering get_players(), which is done for every other team.
+    """
 
-        for i in range(len(away_players)):
-            all_players[i + len(home_players)] = away_players[i]
+    def __init__(self, team: Team) -> None:
+        self.players: list[Player] = [player for player in team.get_players()]
+        self.outfield: Iterable[Player]
+        if hasattr(team, "get_outfield_players"):
+            outfield: Union[Iterable[Player], None] = team.get_outfield_players()
+            self.outfield = outfield if outfield is not None else []
+        else:
+            self.outfield = [player for player in self.players if player.get_position() != PlayerPosition.GOALKEEPER]
+        self.heights: list[int] = [player[PlayerStats.HEIGHT] for player in self.players]
+        self.scorer_table: Union[CumulativeWeightTable[Player], None] = None
+        self.assist_table: Union[CumulativeWeightTable[Player], None] = None
 
-        for _ in range(home_goals):
-            scorer: Player = GameSimulator.__weighted_choice(home_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
-            goal_scorers.append(scorer.get_name())
+    def scorers(self) -> CumulativeWeightTable[Player]:
+        if self.scorer_table is None:
+            self.scorer_table = _RosterTables.weighted_table(self.outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
+        return self.scorer_table
 
-            if RandomGen.random_chance(0.7):  # 70% chance of an assist
-                assist: Player = GameSimulator.__weighted_choice(home_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
-                goal_assists.append(assist.get_name())
+    def assists(self) -> CumulativeWeightTable[Player]:
+        if self.assist_table is None:
+            self.assist_table = _RosterTables.weighted_table(self.outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
+        return self.assist_table
 
-        for _ in range(away_goals):
-            scorer: Player = GameSimulator.__weighted_choice(away_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEIGHT, PlayerStats.HEIGHT)
-            goal_scorers.append(scorer.get_name())
+    @staticmethod
+    def weighted_table(players: Iterable[Player], *attributes: str) -> CumulativeWeightTable[Player]:
+        """
+        Builds a table for selecting players based on weighted stats.
 
-            if RandomGen.random_chance(0.7):  # 70% chance of an assist
-                assist: Player = GameSimulator.__weighted_choice(away_outfield, PlayerStats.STAR_SKILL, PlayerStats.WEAK_FOOT_ABILITY)
-                goal_assists.append(assist.get_name())
+        Args:
+            players (Iterable[Player]): The players to choose from.
+            *attributes (str): Attributes to consider for weighting.
 
-        result_table[ResultStats.GOAL_SCORERS.value] = ArrayR.from_list(goal_scorers)
-        result_table[ResultStats.GOAL_ASSISTS.value] = ArrayR.from_list(goal_assists)
+        Returns:
+            CumulativeWeightTable[Player]: The table to draw players from.
 
-        # 3. Assign interceptions and tackles based on defensive stats
-        interceptions: list[str] = [GameSimulator.__weighted_choice(all_players, PlayerStats.HEIGHT).get_name() for _ in range(RandomGen.randint(0, 10))]
-        tackles: list[str] = [GameSimulator.__weighted_choice(all_players, PlayerStats.HEIGHT).get_name() for _ in range(RandomGen.randint(0, 10))]
+        Complexity:
+            Best Case Complexity: O(N * A) where N is the number of players and A the number of attributes.
+            Worst Case Complexity: O(N * A) where N is the number of players and A the number of attributes.
+        """
+        weights: list[int] = [sum(player[attr] for attr in attributes) for player in players]
+        return GameSimulator.WEIGHTED_TABLE(players, weights)
 
-        result_table[ResultStats.TACKLES.value] = ArrayR.from_list(tackles)
-        result_table[ResultStats.INTERCEPTIONS.value] = ArrayR.from_list(interceptions)
 
-        return result_table
+class GameSimulator:
+    """
+    Simulates games between teams.
+
+    Weighted player selection is done through prebuilt tables. The default
+    CumulativeWeightTable reproduces the original linear scan exactly for a given seed,
+    set WEIGHTED_TABLE to weighted_table.AliasTable for O(1) draws instead.
+    """
+
+    WEIGHTED_TABLE = CumulativeWeightTable
+
+    # Goals scored by each team with a higher likelihood of low scores
+    GOAL_DISTRIBUTION: ArrayR[int] = ArrayR.from_list([0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5)
 
     @staticmethod
-    def __weighted_choice(players: list, *attributes: str) -> Player:
+    def simulate(home_team: Team, away_team: Team, rng: Union[RandomStream, type[RandomGen]] = RandomGen) -> LinearProbeTable:
         """
-        Selects a player based on weighted stats.
+        Simulates a game between two teams, considering player stats for a more probabilistic outcome.
+        Note: To call this method, use: GameSimulator.simulate(home_team, away_team)
 
         Args:
-            players (list): List of players to choose from.
-            *attributes (str): Attributes to consider for weighting.
+            home_team (Team): The home team.
+            away_team (Team): The away team.
+            rng (Union[RandomStream, type[RandomGen]]): The random stream to draw from, the global stream by default.
 
         Returns:
-            Player: The selected player.
+            LinearProbeTable: A table with keys 'Home Goals', 'Away Goals', 'Goal Scorers',
+                            'Goal Assists', 'Interceptions', 'Tacklers'
         """
-        total_weight: int = sum(
-            sum(player[attr] for attr in attributes) for player in players
-        )
+        return GameSimulator.simulate_game(home_team, away_team, rng).to_table(0)
+
+    @staticmethod
+    def simulate_game(home_team: Team, away_team: Team,
+                      rng: Union[RandomStream, type[RandomGen]] = RandomGen) -> SimulationResults:
+        """
+        Simulates a game like simulate, drawing the same random numbers, but returns it as a
+        single row of SimulationResults, which also records the player behind every event.
+
+        Args:
+            home_team (Team): The home team.
+            away_team (Team): The away team.
+            rng (Union[RandomStream, type[RandomGen]]): The random stream to draw from, the global stream by default.
 
-        if total_weight == 0:  # Handle edge case where all weights are zero
-            return RandomGen.random_choice(players)
+        Returns:
+            SimulationResults: The result of the game in row 0.
+        """
+        results: SimulationResults = SimulationResults(1)
+        results.home_teams[0] = home_team
+        results.away_teams[0] = away_team
+        GameSimulator.__simulate_into(results, 0, _RosterTables(home_team), _RosterTables(away_team), rng)
+        return results
 
-        rand_val: int = RandomGen.random_choice(range(total_weight))
-        cumulative_weight: int = 0
-        for player in players:
-            player_weight: int = sum(player[attr] for attr in attributes)
-            cumulative_weight += player_weight
-            if cumulative_weight >= rand_val:
-                return player
+    @staticmethod
+    def simulate_many(games: Union[WeekOfGames, Iterable[Game]],
+                      rng: Union[RandomStream, type[RandomGen]] = RandomGen) -> SimulationResults:
+        """
+        Simulates a batch of games in one pass.
+
+        Rosters and weighted tables are prepared once per team and shared by every
+        game that team plays in the batch. Games are simulated in order, drawing the
+        same random numbers as calling simulate on each game in turn.
+
+        Args:
+            games (Union[WeekOfGames, Iterable[Game]]): The games to simulate.
+            rng (Union[RandomStream, type[RandomGen]]): The random stream to draw from, the global stream by default.
+
+        Returns:
+            SimulationResults: The results of every game, in the order they were given.
+
+        Complexity:
+            Best Case Complexity: O(G + T * P) where G is the number of games,
+                T is the number of distinct teams and P the number of players in a team.
+            Worst Case Complexity: O(G * (P + log(P)) + T * P) where G is the number of games,
+                T is the number of distinct teams and P the number of players in a team.
+        """
+        if hasattr(games, "get_games"):
+            games = games.get_games()
+        game_list: list[Game] = [game for game in games] if games is not None else []
 
-        # Fallback in case rounding errors cause a miss
-        return RandomGen.random_choice(players)
+        results: SimulationResults = SimulationResults(len(game_list))
+        rosters: dict[int, _RosterTables] = {}
+        for index, game in enumerate(game_list):
+            for team in (game.home_team, game.away_team):
+                if id(team) not in rosters:
+                    rosters[id(team)] = _RosterTables(team)
+            results.home_teams[index] = game.home_team
+            results.away_teams[index] = game.away_team
+            GameSimulator.__simulate_into(results, index, rosters[id(game.home_team)], rosters[id(game.away_team)], rng)
+        return results
+
+    @staticmethod
+    def __simulate_into(results: SimulationResults, index: int, home: _RosterTables, away: _RosterTables,
+                        rng: Union[RandomStream, type[RandomGen]]) -> None:
+        """
+        Simulates a single game and writes it into row `index` of `results`.
+
+        Complexity:
+            Best Case Complexity: O(P) where P is the number of players in both teams.
+            Worst Case Complexity: O(P + log(P)) where P is the number of players in both teams.
+        """
+        # 1. Determine goals scored by each team with a higher likelihood of low scores
+        home_goals: int = rng.random_choice(GameSimulator.GOAL_DISTRIBUTION)
+        away_goals: int = rng.random_choice(GameSimulator.GOAL_DISTRIBUTION)
+        results.home_goals[index] = home_goals
+        results.away_goals[index] = away_goals
+
+        # 2. Select goal scorers and assist providers based on stats
+        goal_scorers: list[Player] = []
+        goal_assists: list[Player] = []
+
+        for roster, goals in ((home, home_goals), (away, away_goals)):
+            for _ in range(goals):
+                goal_scorers.append(roster.scorers().choice(rng))
+
+                if rng.random_chance(0.7):  # 70% chance of an assist
+                    goal_assists.append(roster.assists().choice(rng))
+
+        GameSimulator.__record(results.goal_scorers, results.goal_scorer_players, index, goal_scorers)
+        GameSimulator.__record(results.goal_assists, results.goal_assist_players, index, goal_assists)
+
+        # 3. Assign interceptions and tackles based on defensive stats
+        all_players: list[Player] = home.players + away.players
+        height_table = GameSimulator.WEIGHTED_TABLE(all_players, home.heights + away.heights)
+        interceptions: list[Player] = [height_table.choice(rng) for _ in range(rng.randint(0, 10))]
+        tackles: list[Player] = [height_table.choice(rng) for _ in range(rng.randint(0, 10))]
+
+        GameSimulator.__record(results.tackles, results.tackle_players, index, tackles)
+        GameSimulator.__record(results.interceptions, results.interception_players, index, interceptions)
+
+    @staticmethod
+    def __record(names: ArrayR, players: ArrayR, index: int, event_players: list[Player]) -> None:
+        """
+        Stores the players of one kind of event and their names in row `index`.
+        Both are None when there were no such events, like ArrayR.from_list.
+        """
+        players[index] = ArrayR.from_list(event_players)
+        names[index] = ArrayR.from_list([player.get_name() for player in event_players])
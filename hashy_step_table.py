@@ -6,6 +6,7 @@ from __future__ import annotations
 __author__ = 'Jackson Goerner'
 __since__ = '07/02/2023'
 
+from data_structures.primes import next_prime
 from data_structures.referential_array import ArrayR
 from typing import Generic, TypeVar, Union
 
@@ -34,16 +35,23 @@ class HashyStepTable(Generic[K, V]):
 
     HASH_BASE = 31
 
-    def __init__(self, sizes=None) -> None:
+    def __init__(self, sizes=None, hash_strategy=None) -> None:
         """
         Initialise the Hash Table.
 
+        Args:
+        sizes: The table sizes to grow through, TABLE_SIZES by default.
+        hash_strategy: Function from a key to a non-negative int, such as a
+            data_structures.hash_strategy.UniversalHash, reduced modulo the table size.
+            None uses the fixed polynomial hash.
+
         Complexity:
         Best Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
         Worst Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
         """
         if sizes is not None:
             self.TABLE_SIZES = sizes
+        self.hash_strategy = hash_strategy
         self.size_index = 0
         self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(self.TABLE_SIZES[self.size_index])
         self.count = 0
@@ -53,9 +61,11 @@ class HashyStepTable(Generic[K, V]):
         Hash a key for insert/retrieve/update into the hashtable.
 
         Complexity:
-        Best Case Complexity: O(len(key))
-        Worst Case Complexity: O(len(key))
+        Best Case Complexity: O(len(key)), or the complexity of the hash strategy.
+        Worst Case Complexity: O(len(key)), or the complexity of the hash strategy.
         """
+        if self.hash_strategy is not None:
+            return self.hash_strategy(key) % self.table_size
 
         value = 0
         a = 31415
@@ -74,6 +84,23 @@ class HashyStepTable(Generic[K, V]):
         """
         raise NotImplementedError
 
+    def _size_at(self, size_index: int) -> int:
+        """
+        Returns the table size at an index of TABLE_SIZES, so the table can keep growing
+        after the list runs out. Sizes past the end of the list are computed and added
+        to it, each the next prime after twice the one before.
+
+        Complexity:
+        Best Case Complexity: O(1) when the size is in the list.
+        Worst Case Complexity: O(I * next_prime) where I is the number of sizes computed.
+        """
+        if size_index >= len(self.TABLE_SIZES):
+            sizes = list(self.TABLE_SIZES)
+            while size_index >= len(sizes):
+                sizes.append(next_prime(2 * sizes[-1]))
+            self.TABLE_SIZES = sizes
+        return self.TABLE_SIZES[size_index]
+
     @property
     def table_size(self) -> int:
         return len(self.array)
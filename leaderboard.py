@@ -0,0 +1,144 @@
+"""
+Incrementally maintained season standings.
+"""
+from __future__ import annotations
+from constants import TeamStats
+from data_structures.hash_table import LinearProbeTable
+from data_structures.indexable_skip_list import IndexableSkipList
+from data_structures.referential_array import ArrayR
+from team import Team
+from typing import Union
+
+StandingKey = tuple[int, int, int, str]
+
+
+class LeaderboardIndex:
+    """
+    Keeps the teams of a season ordered by points, goal difference, goals for
+    and then name, updating a team's place in O(log N) whenever its statistics change.
+
+    Full table, rank and top k queries are answered from the index without sorting.
+    It can be passed as the standings of a SeasonPipeline to stay up to date after every game.
+    Team names are assumed to be unique within the season.
+    """
+
+    def __init__(self, teams: ArrayR[Team]) -> None:
+        """
+        Args:
+            teams (ArrayR[Team]): The teams in the season.
+
+        Complexity:
+            Best Case Complexity: O(N * log(N)) where N is the number of teams.
+            Worst Case Complexity: O(N * log(N)) where N is the number of teams.
+        """
+        self.index: IndexableSkipList[StandingKey, Team] = IndexableSkipList()
+        self.keys: LinearProbeTable[str, StandingKey] = LinearProbeTable.with_capacity(len(teams))
+        for team in teams:
+            key: StandingKey = LeaderboardIndex.standing_key(team)
+            self.keys[team.get_name()] = key
+            self.index.add(key, team)
+
+    @staticmethod
+    def standing_key(team: Team) -> StandingKey:
+        """
+        Orders teams from first to last when compared in ascending order.
+        """
+        return (-team[TeamStats.POINTS], -team[TeamStats.GOALS_DIFFERENCE],
+                -team[TeamStats.GOALS_FOR], team.get_name())
+
+    def update(self, team: Team) -> None:
+        """
+        Moves a team to its place after its statistics have changed.
+
+        Complexity:
+            Best Case Complexity: O(hash(name)) when the team's standing did not change.
+            Worst Case Complexity: O(log(N) + hash(name)) expected, where N is the number of teams.
+        """
+        name: str = team.get_name()
+        old_key: StandingKey = self.keys[name]
+        new_key: StandingKey = LeaderboardIndex.standing_key(team)
+        if old_key == new_key:
+            return
+        self.index.remove(old_key)
+        self.index.add(new_key, team)
+        self.keys[name] = new_key
+
+    def rank(self, team: Team) -> int:
+        """
+        Returns the team's place in the standings, starting at 1.
+
+        Complexity:
+            Best Case Complexity: O(log(N) + hash(name)) expected, where N is the number of teams.
+            Worst Case Complexity: O(log(N) + hash(name)) expected, where N is the number of teams.
+        """
+        return self.index.rank(self.keys[team.get_name()]) + 1
+
+    def team_at(self, place: int) -> Team:
+        """
+        Returns the team in the given place, starting at 1.
+
+        Complexity:
+            Best Case Complexity: O(log(N)) expected, where N is the number of teams.
+            Worst Case Complexity: O(log(N)) expected, where N is the number of teams.
+        """
+        return self.index[place - 1][1]
+
+    def top(self, k: int) -> Union[ArrayR[Team], None]:
+        """
+        Returns the first k teams in order.
+
+        Complexity:
+            Best Case Complexity: O(k)
+            Worst Case Complexity: O(k)
+        """
+        pairs = self.index.first(k)
+        if pairs is None:
+            return None
+        teams: ArrayR[Team] = ArrayR(len(pairs))
+        for i in range(len(pairs)):
+            teams[i] = pairs[i][1]
+        return teams
+
+    def teams(self) -> Union[ArrayR[Team], None]:
+        """
+        Returns every team in order.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of teams.
+            Worst Case Complexity: O(N) where N is the number of teams.
+        """
+        return self.top(len(self))
+
+    def get_leaderboard(self) -> ArrayR[ArrayR[Union[int, str]]]:
+        """
+        Builds the rows of the leaderboard in the same format as Season.get_leaderboard.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of teams.
+            Worst Case Complexity: O(N * get_last_five_results) where N is the number of teams.
+        """
+        leaderboard: ArrayR[ArrayR[Union[int, str]]] = ArrayR(max(1, len(self)))
+        for place, (_, team) in enumerate(self.index):
+            leaderboard[place] = ArrayR.from_list([
+                team.get_name(),
+                team[TeamStats.GAMES_PLAYED],
+                team[TeamStats.POINTS],
+                team[TeamStats.WINS],
+                team[TeamStats.DRAWS],
+                team[TeamStats.LOSSES],
+                team[TeamStats.GOALS_FOR],
+                team[TeamStats.GOALS_AGAINST],
+                team[TeamStats.GOALS_DIFFERENCE],
+                team.get_last_five_results(),
+            ])
+        return leaderboard
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self):
+        """
+        Yields the teams from first to last.
+        """
+        for _, team in self.index:
+            yield team
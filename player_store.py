@@ -0,0 +1,226 @@
+"""
+League-wide columnar storage of player statistics.
+
+Instead of every player holding its own table of statistics, a PlayerStore keeps
+one integer column per PlayerStats member and gives every player a row id.
+A player then only holds a PlayerStatsView, which reads and writes its row.
+
+Whole-league operations work on the columns directly, so resetting every
+player is one fill per statistic and totals or leaders of a statistic scan a
+single contiguous column.
+
+Usage:
+```
+store = PlayerStore()
+stats = store.stats(store.allocate())   # inside Player.__init__
+stats[PlayerStats.GOALS] += 1           # Player.__getitem__ / __setitem__ delegate to the view
+store.reset()                           # reset every player in the league
+```
+"""
+from __future__ import annotations
+from array import array
+from constants import PlayerStats
+from data_structures.linked_stack import LinkedStack
+from data_structures.referential_array import ArrayR
+from heapq import nlargest
+from typing import Iterable, Union
+
+
+class PlayerStore:
+    """
+    One array('q') column per statistic, indexed by player id.
+    A statistic's column is its ordinal in PlayerStats.
+    """
+
+    STATS: tuple[PlayerStats, ...] = tuple(PlayerStats)
+    TYPECODE = 'q'
+
+    def __init__(self) -> None:
+        """
+        Complexity:
+            Best Case Complexity: O(S) where S is the number of statistics.
+            Worst Case Complexity: O(S) where S is the number of statistics.
+        """
+        self.columns: ArrayR[array] = ArrayR(len(self.STATS))
+        for column in range(len(self.STATS)):
+            self.columns[column] = array(self.TYPECODE)
+        self.alive: bytearray = bytearray()
+        self.free_ids: LinkedStack[int] = LinkedStack()
+        self.count: int = 0
+
+    def allocate(self) -> int:
+        """
+        Reserves a row for a new player with every statistic at 0.
+        Rows of released players are reused first.
+
+        Returns:
+            int: The id of the new player.
+
+        Complexity:
+            Best Case Complexity: O(S) where S is the number of statistics.
+            Worst Case Complexity: O(S) amortised where S is the number of statistics.
+        """
+        if not self.free_ids.is_empty():
+            player_id: int = self.free_ids.pop()
+        else:
+            player_id = len(self.alive)
+            for column in self.columns:
+                column.append(0)
+            self.alive.append(0)
+        self.alive[player_id] = 1
+        self.count += 1
+        return player_id
+
+    def release(self, player_id: int) -> None:
+        """
+        Frees the row of a player that is no longer needed. Its statistics are reset
+        so that released rows never count towards league totals.
+
+        Raises:
+            KeyError: If the id does not belong to an allocated player.
+
+        Complexity:
+            Best Case Complexity: O(S) where S is the number of statistics.
+            Worst Case Complexity: O(S) where S is the number of statistics.
+        """
+        self.__check(player_id)
+        self.reset_player(player_id)
+        self.alive[player_id] = 0
+        self.free_ids.push(player_id)
+        self.count -= 1
+
+    def get(self, player_id: int, stat: PlayerStats) -> int:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.columns[stat.ordinal][player_id]
+
+    def set(self, player_id: int, stat: PlayerStats, value: int) -> None:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.columns[stat.ordinal][player_id] = value
+
+    def stats(self, player_id: int) -> PlayerStatsView:
+        """
+        Returns a view of one player's row.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.__check(player_id)
+        return PlayerStatsView(self, player_id)
+
+    def column(self, stat: PlayerStats) -> memoryview:
+        """
+        Returns a read-only view of a statistic for every row, indexed by player id.
+        Rows of released players are 0.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return memoryview(self.columns[stat.ordinal]).toreadonly()
+
+    def reset(self) -> None:
+        """
+        Resets every statistic of every player to 0 with one fill per column.
+
+        Complexity:
+            Best Case Complexity: O(S * N) where S is the number of statistics and N the number of rows.
+            Worst Case Complexity: O(S * N) where S is the number of statistics and N the number of rows.
+        """
+        zeros: array = array(self.TYPECODE, bytes(len(self.alive) * array(self.TYPECODE).itemsize))
+        for column in self.columns:
+            column[:] = zeros
+
+    def reset_player(self, player_id: int) -> None:
+        """
+        Complexity:
+            Best Case Complexity: O(S) where S is the number of statistics.
+            Worst Case Complexity: O(S) where S is the number of statistics.
+        """
+        for column in self.columns:
+            column[player_id] = 0
+
+    def total(self, stat: PlayerStats, player_ids: Union[Iterable[int], None] = None) -> int:
+        """
+        Sums a statistic over the given players, or over the whole league when player_ids is None.
+
+        Complexity:
+            Best Case Complexity: O(P) where P is the number of players summed.
+            Worst Case Complexity: O(N) where N is the number of rows when summing the whole league.
+        """
+        column: array = self.columns[stat.ordinal]
+        if player_ids is None:
+            return sum(column)
+        return sum(column[player_id] for player_id in player_ids)
+
+    def top(self, stat: PlayerStats, k: int) -> Union[ArrayR[int], None]:
+        """
+        Returns the ids of the k players with the highest value of a statistic, highest first.
+        Ties are broken by the lower id.
+
+        Complexity:
+            Best Case Complexity: O(N * log(k)) where N is the number of rows.
+            Worst Case Complexity: O(N * log(k)) where N is the number of rows.
+        """
+        column: array = self.columns[stat.ordinal]
+        alive: bytearray = self.alive
+        ids: list[int] = nlargest(k, (player_id for player_id in range(len(alive)) if alive[player_id]),
+                                  key=lambda player_id: (column[player_id], -player_id))
+        return ArrayR.from_list(ids)
+
+    def __check(self, player_id: int) -> None:
+        if not 0 <= player_id < len(self.alive) or not self.alive[player_id]:
+            raise KeyError(player_id)
+
+    def __contains__(self, player_id: int) -> bool:
+        return 0 <= player_id < len(self.alive) and self.alive[player_id] == 1
+
+    def __len__(self) -> int:
+        """
+        Returns the number of allocated players.
+        """
+        return self.count
+
+
+class PlayerStatsView:
+    """
+    The statistics of one player, stored in a PlayerStore.
+    Supports the same indexing by PlayerStats as Player.
+    """
+
+    def __init__(self, store: PlayerStore, player_id: int) -> None:
+        self.store: PlayerStore = store
+        self.player_id: int = player_id
+
+    def __getitem__(self, stat: PlayerStats) -> int:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.store.columns[stat.ordinal][self.player_id]
+
+    def __setitem__(self, stat: PlayerStats, value: int) -> None:
+        """
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.store.columns[stat.ordinal][self.player_id] = value
+
+    def reset(self) -> None:
+        self.store.reset_player(self.player_id)
+
+    def __str__(self) -> str:
+        return str({stat.value: self[stat] for stat in PlayerStore.STATS})
+
+    def __repr__(self) -> str:
+        return str(self)
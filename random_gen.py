@@ -1,9 +1,264 @@
 """
-Random number generator class. Uses LCG method with some reasonable initialisation.
+Random number generator classes. Use LCG method with some reasonable initialisation.
 """
+from __future__ import annotations
 __author__ = "Jackson Goerner"
 
 import time
+from data_structures.linked_list import LinkedList
+from data_structures.referential_array import ArrayR
+
+
+def lcg_jump(steps: int, a: int, c: int, mod: int) -> tuple[int, int]:
+    """
+    Returns (a_n, c_n) such that applying the LCG x -> (a * x + c) % mod `steps` times
+    is the same as x -> (a_n * x + c_n) % mod.
+
+    Composes the step with itself by repeated squaring, so the mod does not
+    need to be prime.
+
+    :complexity: O(log(steps))
+    """
+    acc_mult, acc_plus = 1, 0
+    cur_mult, cur_plus = a % mod, c % mod
+    while steps > 0:
+        if steps & 1:
+            acc_mult = acc_mult * cur_mult % mod
+            acc_plus = (acc_plus * cur_mult + cur_plus) % mod
+        cur_plus = (cur_mult + 1) * cur_plus % mod
+        cur_mult = cur_mult * cur_mult % mod
+        steps >>= 1
+    return acc_mult, acc_plus
+
+
+class _LinkedItems:
+    """
+    Constant time random access to the items of a LinkedList, through an array of its nodes.
+    Used by the shuffles, which would otherwise walk the list on every access.
+    """
+
+    def __init__(self, linked_list: LinkedList) -> None:
+        self.nodes = ArrayR(max(1, len(linked_list)))
+        self.length = len(linked_list)
+        current = linked_list.head
+        for i in range(self.length):
+            self.nodes[i] = current
+            current = current.link
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int):
+        return self.nodes[index].item
+
+    def __setitem__(self, index: int, item) -> None:
+        self.nodes[index].item = item
+
+
+class RandomStream:
+    """
+    An independent random number stream, using the LCG method.
+
+    Holds its own state, so any number of streams can be used side by side without
+    affecting each other or the global RandomGen stream, which is itself a RandomStream.
+    A stream seeded with the same value as RandomGen produces exactly the same numbers.
+    Streams can be passed anywhere RandomGen is accepted as an `rng` argument.
+
+    Usage:
+    ```
+    stream = RandomStream(123)
+    stream.randint(1, 10)
+    stream.advance(1000)         # Skip the next 1000 numbers
+    stream.randint_batch(1, 6, 100) # 100 dice rolls in one call
+    workers = stream.split(4)    # 4 independent streams
+    ```
+    """
+
+    MOD: int = pow(2, 48)
+    A: int = 25214903917
+    C: int = 11
+
+    def __init__(self, seed: int = None) -> None:
+        self.seed: int = time.time_ns() if seed is None else seed
+
+    def set_seed(self, seed: int = None) -> None:
+        """Seed all future calls to `random`."""
+        self.seed = time.time_ns() if seed is None else seed
+
+    def advance(self, steps: int) -> None:
+        """
+        Skips the stream ahead as if `random` had been called `steps` times.
+        :complexity: O(log(steps))
+        """
+        mult, plus = lcg_jump(steps, self.A, self.C, self.MOD)
+        self.seed = (mult * self.seed + plus) % self.MOD
+
+    def jumped(self, steps: int) -> RandomStream:
+        """
+        Returns a new stream starting `steps` numbers ahead of this one, leaving this stream unchanged.
+        :complexity: O(log(steps))
+        """
+        stream = RandomStream(self.seed)
+        stream.advance(steps)
+        return stream
+
+    @staticmethod
+    def derive_seed(seed: int, index: int) -> int:
+        """
+        Returns the seed of child stream `index` of a stream whose state is `seed`.
+
+        Mixes the state and index with the SplitMix64 finaliser, so each child starts
+        at an unrelated point of the LCG's cycle. Evenly spaced starting points would
+        not do: the LCG's mod is a power of two, so streams a power of two apart
+        produce outputs that are shifted copies of each other.
+
+        :complexity: O(1)
+        """
+        mask = (1 << 64) - 1
+        z = (seed + (index + 1) * 0x9E3779B97F4A7C15) & mask
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+        return (z ^ (z >> 31)) % RandomStream.MOD
+
+    def split(self, k: int) -> ArrayR[RandomStream]:
+        """
+        Returns k new streams seeded with derive_seed(seed, 0) to derive_seed(seed, k - 1),
+        and moves this stream on to derive_seed(seed, k).
+        Splitting a stream with the same state always gives the same streams.
+        :complexity: O(k)
+        """
+        if k <= 0:
+            raise ValueError("Number of streams should be larger than 0.")
+        streams = ArrayR(k)
+        for i in range(k):
+            streams[i] = RandomStream(self.derive_seed(self.seed, i))
+        self.seed = self.derive_seed(self.seed, k)
+        return streams
+
+    def random(self) -> int:
+        """Returns a random integer from 0 to 2^32-1"""
+        self.seed = (self.A * self.seed + self.C) % self.MOD
+        return self.seed >> 16
+
+    def random_float(self) -> float:
+        """Returns a random floating point integer in the range 0 to 1."""
+        return self.random() / (1 << 32)
+
+    def randint(self, lo: int, hi: int) -> int:
+        """Returns a random integer from `lo` to `hi` inclusive on both ends."""
+        return (self.random() % (hi - lo + 1)) + lo
+
+    def random_chance(self, ratio: float) -> bool:
+        """Returns random()/2^32 < ratio"""
+        return self.random_float() < ratio
+
+    def random_choice(self, collection):
+        """Returns a random choice from a collection that supports __getitem__ and __len__"""
+        return collection[self.randint(0, len(collection)-1)]
+
+    def random_batch(self, n: int) -> ArrayR[int]:
+        """
+        Returns the next `n` numbers of the stream, the same as calling `random` n times.
+        Returns None when n is 0, like ArrayR.from_list.
+        :complexity: O(n)
+        """
+        return self.__batch(n, lambda value: value)
+
+    def randint_batch(self, lo: int, hi: int, n: int) -> ArrayR[int]:
+        """
+        Returns `n` random integers from `lo` to `hi` inclusive, the same as calling `randint` n times.
+        :complexity: O(n)
+        """
+        span = hi - lo + 1
+        return self.__batch(n, lambda value: value % span + lo)
+
+    def chance_batch(self, ratio: float, n: int) -> ArrayR[bool]:
+        """
+        Returns `n` random booleans, the same as calling `random_chance` n times.
+        :complexity: O(n)
+        """
+        # random()/2^32 < ratio is exactly random() < ratio * 2^32, as both only scale by a power of two
+        threshold = ratio * (1 << 32)
+        return self.__batch(n, lambda value: value < threshold)
+
+    def __batch(self, n: int, transform) -> ArrayR:
+        """
+        Runs the LCG n times with everything it needs held in local variables,
+        then fills the result with transform(output) in a single copy.
+        :complexity: O(n * transform)
+        """
+        if n < 0:
+            raise ValueError("Batch size should not be negative.")
+        if n == 0:
+            return None
+        a, c, mod = self.A, self.C, self.MOD
+        seed = self.seed
+        values = [0] * n
+        for i in range(n):
+            seed = (a * seed + c) % mod
+            values[i] = seed >> 16
+        self.seed = seed
+        return ArrayR.from_list([transform(value) for value in values])
+
+    def random_shuffle(self, collection, legacy: bool = False) -> None:
+        """
+        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__ in place,
+        using the Fisher-Yates shuffle. ArrayR, LinkedList and Python lists are all supported.
+
+        The first k positions end up exactly as partial_shuffle(collection, k) would leave them.
+        legacy=True uses the old sort based shuffle, to reproduce results from earlier seeds.
+
+        :complexity: O(len(collection)), O(len(collection) * log(len(collection))) when legacy.
+            Shuffling a LinkedList needs O(len(collection)) extra memory for its nodes.
+        """
+        if legacy:
+            positions = [(self.random(), i) for i in range(len(collection))]
+            positions.sort()
+            tmp = [collection[p[1]] for p in positions]
+            for x in range(len(collection)):
+                collection[x] = tmp[x]
+            return
+        self.partial_shuffle(collection, max(0, len(collection) - 1))
+
+    def partial_shuffle(self, collection, k: int) -> None:
+        """
+        Moves a uniformly random selection of k items to the front of the collection,
+        in random order, by running the first k steps of a Fisher-Yates shuffle.
+        The rest of the collection is left in an unspecified order.
+
+        :complexity: O(k), plus O(len(collection)) for a LinkedList.
+        """
+        n = len(collection)
+        if not 0 <= k <= n:
+            raise ValueError("Cannot pick more items than the collection holds.")
+        if isinstance(collection, LinkedList):
+            collection = _LinkedItems(collection)
+        for i in range(min(k, n - 1)):
+            j = self.randint(i, n - 1)
+            if i != j:
+                collection[i], collection[j] = collection[j], collection[i]
+
+    def random_sample(self, collection, k: int) -> ArrayR:
+        """
+        Returns k distinct random items from the collection, leaving the collection untouched.
+        The sample is what partial_shuffle(collection, k) would move to the front, but only the
+        swapped positions are remembered instead of copying the collection.
+        Returns None when k is 0, like ArrayR.from_list.
+
+        :complexity: O(k), plus O(len(collection)) for a LinkedList.
+        """
+        n = len(collection)
+        if not 0 <= k <= n:
+            raise ValueError("Cannot pick more items than the collection holds.")
+        if isinstance(collection, LinkedList):
+            collection = _LinkedItems(collection)
+        displaced = {}  # position -> index of the item currently there, only for swapped positions
+        sample = []
+        for i in range(k):
+            j = self.randint(i, n - 1) if i < n - 1 else i
+            sample.append(collection[displaced.get(j, j)])
+            displaced[j] = displaced.get(i, i)
+        return ArrayR.from_list(sample)
 
 
 class RandomGen:
@@ -18,55 +273,113 @@ class RandomGen:
     RandomGen.random()           # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+    RandomGen.randint_batch(1, 10, 5)  # 5 random numbers from 1 to 10, same as 5 calls to randint
     ```
+
+    The class methods share a single global stream, RandomGen.stream, and draw from it
+    through the RandomStream methods of the same name. Use `RandomGen.split(k)` or
+    `RandomStream(seed)` for independent streams.
     """
 
-    MOD: int = pow(2, 48)
-    A: int = 25214903917
-    C: int = 11
+    MOD: int = RandomStream.MOD
+    A: int = RandomStream.A
+    C: int = RandomStream.C
 
-    seed = time.time_ns()
+    stream: RandomStream = RandomStream(time.time_ns())
 
     @classmethod
     def set_seed(cls, seed: int = None) -> None:
         """Seed all future calls to `random`."""
-        seed = time.time_ns() if seed is None else seed
-        cls.seed = seed
+        cls.stream.set_seed(seed)
+
+    @classmethod
+    def advance(cls, steps: int) -> None:
+        """
+        Skips the global stream ahead as if `random` had been called `steps` times.
+        :complexity: O(log(steps))
+        """
+        cls.stream.advance(steps)
+
+    @classmethod
+    def split(cls, k: int) -> ArrayR[RandomStream]:
+        """
+        Splits the global stream into `k` independent streams. See RandomStream.split.
+        :complexity: O(k)
+        """
+        return cls.stream.split(k)
 
     @classmethod
     def random(cls) -> int:
         """Returns a random integer from 0 to 2^32-1"""
-        cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
-        return cls.seed >> 16
+        return cls.stream.random()
 
     @classmethod
     def random_float(cls) -> float:
         """Returns a random floating point integer in the range 0 to 1."""
-        return cls.random() / (1 << 32)
+        return cls.stream.random_float()
 
     @classmethod
     def randint(cls, lo: int, hi: int) -> int:
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
-        return (cls.random() % (hi - lo + 1)) + lo
+        return cls.stream.randint(lo, hi)
 
     @classmethod
     def random_chance(cls, ratio: float) -> bool:
         """Returns random()/2^32 < ratio"""
-        return cls.random_float() < ratio
+        return cls.stream.random_chance(ratio)
 
     @classmethod
     def random_choice(cls, collection) -> None:
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
-        return collection[cls.randint(0, len(collection)-1)]
+        return cls.stream.random_choice(collection)
+
+    @classmethod
+    def random_batch(cls, n: int) -> ArrayR[int]:
+        """
+        Returns the next `n` numbers of the global stream, the same as calling `random` n times.
+        :complexity: O(n)
+        """
+        return cls.stream.random_batch(n)
+
+    @classmethod
+    def randint_batch(cls, lo: int, hi: int, n: int) -> ArrayR[int]:
+        """
+        Returns `n` random integers from `lo` to `hi`, the same as calling `randint` n times.
+        :complexity: O(n)
+        """
+        return cls.stream.randint_batch(lo, hi, n)
+
+    @classmethod
+    def chance_batch(cls, ratio: float, n: int) -> ArrayR[bool]:
+        """
+        Returns `n` random booleans, the same as calling `random_chance` n times.
+        :complexity: O(n)
+        """
+        return cls.stream.chance_batch(ratio, n)
+
+    @classmethod
+    def random_shuffle(cls, collection, legacy: bool = False) -> None:
+        """
+        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__ in place.
+        See RandomStream.random_shuffle, pass legacy=True to reproduce shuffles from older versions.
+        :complexity: O(len(collection)), O(len(collection) * log(len(collection))) when legacy.
+        """
+        cls.stream.random_shuffle(collection, legacy)
+
+    @classmethod
+    def partial_shuffle(cls, collection, k: int) -> None:
+        """
+        Moves a uniformly random selection of k items to the front of the collection in random order.
+        See RandomStream.partial_shuffle.
+        :complexity: O(k)
+        """
+        cls.stream.partial_shuffle(collection, k)
 
     @classmethod
-    def random_shuffle(cls, collection) -> None:
+    def random_sample(cls, collection, k: int) -> ArrayR:
         """
-        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
-        :complexity: O(len(collection))
+        Returns k distinct random items from the collection without modifying it.
+        See RandomStream.random_sample.
+        :complexity: O(k)
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
-        positions.sort() # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
-        tmp = [collection[p[1]] for p in positions]
-        for x in range(len(collection)):
-            collection[x] = tmp[x]
+        return cls.stream.random_sample(collection, k)
@@ -0,0 +1,233 @@
+"""
+Players of a team bucketed by position.
+
+A RosterIndex keeps one bucket per PlayerPosition, so the players of a position
+(or every outfield player) are available without filtering the whole roster.
+Every player is also kept in a list of the whole roster and, unless they are a
+goalkeeper, in a list of the outfield, both in the order players were added.
+The lists are doubly linked and every player's nodes are indexed, so adding and
+removing a player is O(1) while players keep the order they were added in.
+"""
+from __future__ import annotations
+from constants import PlayerPosition
+from data_structures.referential_array import ArrayR
+from player import Player
+from typing import Generator, Iterable, Union
+
+
+class _RosterNode:
+
+    def __init__(self, player: Player) -> None:
+        self.player: Player = player
+        self.previous: Union[_RosterNode, None] = None
+        self.next: Union[_RosterNode, None] = None
+
+
+class _RosterChain:
+    """ Some of the players of a roster, in the order they were added. """
+
+    def __init__(self) -> None:
+        self.head: Union[_RosterNode, None] = None
+        self.rear: Union[_RosterNode, None] = None
+        self.length: int = 0
+
+    def append(self, node: _RosterNode) -> None:
+        node.previous = self.rear
+        node.next = None
+        if self.rear is None:
+            self.head = node
+        else:
+            self.rear.next = node
+        self.rear = node
+        self.length += 1
+
+    def unlink(self, node: _RosterNode) -> None:
+        if node.previous is None:
+            self.head = node.next
+        else:
+            node.previous.next = node.next
+        if node.next is None:
+            self.rear = node.previous
+        else:
+            node.next.previous = node.previous
+        node.previous = node.next = None
+        self.length -= 1
+
+
+class _RosterEntry:
+    """ The nodes of one player, one in each list of the roster they belong to. """
+
+    def __init__(self, player: Player, bucket: int, outfield: bool) -> None:
+        self.bucket: int = bucket
+        self.position_node: _RosterNode = _RosterNode(player)
+        self.roster_node: _RosterNode = _RosterNode(player)
+        self.outfield_node: Union[_RosterNode, None] = _RosterNode(player) if outfield else None
+
+
+class RosterView:
+    """
+    A read-only view of one of the player lists of a RosterIndex.
+
+    The view holds no copy of the players, so it always reflects the current roster.
+    """
+
+    def __init__(self, index: RosterIndex, chain: _RosterChain, buckets: tuple[int, ...]) -> None:
+        """
+        Args:
+            index (RosterIndex): The roster the view belongs to.
+            chain (_RosterChain): The list of players the view reads.
+            buckets (tuple[int, ...]): The position buckets of the players in that list.
+        """
+        self.index: RosterIndex = index
+        self.chain: _RosterChain = chain
+        self.buckets: tuple[int, ...] = buckets
+
+    def __len__(self) -> int:
+        """
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        return self.chain.length
+
+    def __iter__(self) -> Generator[Player, None, None]:
+        """
+        Complexity:
+        Best Case Complexity: O(1) per player.
+        Worst Case Complexity: O(1) per player.
+        """
+        node: Union[_RosterNode, None] = self.chain.head
+        while node is not None:
+            yield node.player
+            node = node.next
+
+    def __contains__(self, player: Player) -> bool:
+        """
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(B) where B is the number of buckets in the view.
+        """
+        entry: Union[_RosterEntry, None] = self.index.entries.get(id(player))
+        return entry is not None and entry.bucket in self.buckets
+
+    def __str__(self) -> str:
+        return str([player for player in self])
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class RosterIndex:
+    """
+    Players of a team bucketed by position.
+
+    get_players() and get_outfield_players() list players in the order they were
+    added, like filtering a plain list of the roster would, while
+    get_players(position) lists the players of one position in that order.
+
+    Usage:
+    ```
+    roster = RosterIndex(players)
+    roster.add(player)
+    for striker in roster.get_players(PlayerPosition.STRIKER):
+        ...
+    ```
+    """
+
+    POSITIONS: tuple[PlayerPosition, ...] = tuple(PlayerPosition)
+    OUTFIELD_POSITIONS: tuple[PlayerPosition, ...] = tuple(position for position in PlayerPosition if position != PlayerPosition.GOALKEEPER)
+    BUCKETS: dict[PlayerPosition, int] = {position: bucket for bucket, position in enumerate(POSITIONS)}
+
+    def __init__(self, players: Union[Iterable[Player], None] = None) -> None:
+        """
+        Args:
+            players (Union[Iterable[Player], None]): The players to start with.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of players.
+            Worst Case Complexity: O(N) where N is the number of players.
+        """
+        self.buckets: ArrayR[_RosterChain] = ArrayR(len(self.POSITIONS))
+        self.position_views: ArrayR[RosterView] = ArrayR(len(self.POSITIONS))
+        for bucket in range(len(self.POSITIONS)):
+            self.buckets[bucket] = _RosterChain()
+            self.position_views[bucket] = RosterView(self, self.buckets[bucket], (bucket,))
+        self.roster: _RosterChain = _RosterChain()
+        self.outfield: _RosterChain = _RosterChain()
+        self.all_view: RosterView = RosterView(self, self.roster, tuple(range(len(self.POSITIONS))))
+        self.outfield_view: RosterView = RosterView(self, self.outfield, tuple(self.BUCKETS[position] for position in self.OUTFIELD_POSITIONS))
+        self.entries: dict[int, _RosterEntry] = {}
+        if players is not None:
+            for player in players:
+                self.add(player)
+
+    def add(self, player: Player) -> None:
+        """
+        Adds a player to the end of its position's bucket and of the roster lists it belongs to.
+
+        Raises:
+            ValueError: If the player is already in the roster.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if id(player) in self.entries:
+            raise ValueError("Player is already in the roster.")
+        position: PlayerPosition = player.get_position()
+        entry: _RosterEntry = _RosterEntry(player, self.BUCKETS[position], position != PlayerPosition.GOALKEEPER)
+        self.buckets[entry.bucket].append(entry.position_node)
+        self.roster.append(entry.roster_node)
+        if entry.outfield_node is not None:
+            self.outfield.append(entry.outfield_node)
+        self.entries[id(player)] = entry
+
+    def remove(self, player: Player) -> None:
+        """
+        Removes a player, keeping the order of the others.
+
+        Raises:
+            ValueError: If the player is not in the roster.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        entry: Union[_RosterEntry, None] = self.entries.pop(id(player), None)
+        if entry is None:
+            raise ValueError("Player is not in the roster.")
+        self.buckets[entry.bucket].unlink(entry.position_node)
+        self.roster.unlink(entry.roster_node)
+        if entry.outfield_node is not None:
+            self.outfield.unlink(entry.outfield_node)
+
+    def get_players(self, position: Union[PlayerPosition, None] = None) -> Union[RosterView, None]:
+        """
+        Returns a view of the players in a position, or of every player when position is None.
+        Like Team.get_players, None is returned when there are no such players.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        view: RosterView = self.all_view if position is None else self.position_views[self.BUCKETS[position]]
+        return view if len(view) > 0 else None
+
+    def get_outfield_players(self) -> Union[RosterView, None]:
+        """
+        Returns a view of every player except the goalkeepers, or None when there are none.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return self.outfield_view if len(self.outfield_view) > 0 else None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, player: Player) -> bool:
+        return id(player) in self.entries
+
+    def __iter__(self) -> Generator[Player, None, None]:
+        return iter(self.all_view)
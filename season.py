@@ -1,11 +1,49 @@
 from __future__ import annotations
+from constants import Constants
 from data_structures.bset import BSet
+from data_structures.indexable_skip_list import IndexableSkipList
 from data_structures.referential_array import ArrayR
 from dataclasses import dataclass
+from fractions import Fraction
 from team import Team
 from typing import Generator, Union
 
 
+def round_robin_fixture(num_teams: int, week: int, slot: int) -> tuple[int, int]:
+    """
+    Computes a single fixture of a double round robin using the circle (Berger) method.
+
+    The last team (or a bye, when num_teams is odd) stays fixed while the others
+    rotate one place every week. Every pair of teams meets once in the first
+    num_teams - 1 weeks (num_teams weeks when odd), and the second half repeats
+    the first with home and away swapped.
+
+    Args:
+        num_teams (int): The number of teams, at least 2.
+        week (int): The 0-based week, less than 2 * (num_teams - 1) (2 * num_teams when odd).
+        slot (int): The 0-based game within the week, less than num_teams // 2.
+
+    Returns:
+        tuple[int, int]: The indices of the home and away teams.
+
+    Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+    """
+    bye: int = num_teams % 2
+    rotating: int = num_teams + bye - 1
+    round_no: int = week % rotating
+    # With a bye the fixed position is the bye itself, so slot 0 is skipped
+    position: int = slot + bye
+    if position == 0:
+        home, away = (rotating, round_no) if round_no % 2 else (round_no, rotating)
+    else:
+        home, away = (round_no + position) % rotating, (round_no - position) % rotating
+    if week >= rotating:
+        return away, home
+    return home, away
+
+
 @dataclass
 class Game:
     """
@@ -81,6 +119,324 @@ class WeekOfGames:
         raise NotImplementedError
 
 
+class ImplicitWeekOfGames(WeekOfGames):
+    """
+    A week of a RoundRobinSchedule whose games are computed when they are accessed
+    instead of being stored.
+    """
+
+    def __init__(self, schedule: RoundRobinSchedule, week: int) -> None:
+        """
+        Args:
+            schedule (RoundRobinSchedule): The schedule this week belongs to.
+            week (int): The week number, starting at 1.
+
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        self.schedule: RoundRobinSchedule = schedule
+        self.week: int = week
+
+    def get_games(self) -> ArrayR[Game]:
+        """
+        Builds the games in this week.
+
+        Returns:
+            ArrayR[Game]: The games in this week.
+
+        Complexity:
+        Best Case Complexity: O(N) where N is the number of teams.
+        Worst Case Complexity: O(N) where N is the number of teams.
+        """
+        games: ArrayR[Game] = ArrayR(len(self))
+        for slot in range(len(self)):
+            games[slot] = self[slot]
+        return games
+
+    def __getitem__(self, slot: int) -> Game:
+        """
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        return self.schedule.game(self.week, slot)
+
+    def __len__(self) -> int:
+        return self.schedule.games_per_week()
+
+    def __iter__(self) -> Generator[Game, None, None]:
+        """
+        Yields the games of this week one at a time.
+
+        Complexity:
+        Best Case Complexity: O(1) per game.
+        Worst Case Complexity: O(1) per game.
+        """
+        for slot in range(len(self)):
+            yield self[slot]
+
+
+class RoundRobinSchedule:
+    """
+    A double round robin schedule that is never materialised.
+
+    Only the teams are stored, every Game is computed from the week and slot with
+    round_robin_fixture when it is requested. This keeps the schedule at O(N) memory
+    instead of O(N^2) stored games, while still giving O(1) access to any week or game.
+    Weeks are numbered from 1 like the rest of the season.
+    """
+
+    def __init__(self, teams: ArrayR[Team]) -> None:
+        """
+        Args:
+            teams (ArrayR[Team]): The teams playing in the schedule, at least 2.
+
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        if len(teams) < 2:
+            raise ValueError("A schedule needs at least two teams.")
+        self.teams: ArrayR[Team] = teams
+
+    def game(self, week: int, slot: int) -> Game:
+        """
+        Computes a single game of the schedule.
+
+        Args:
+            week (int): The week number, starting at 1.
+            slot (int): The 0-based game within the week.
+
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        if not 1 <= week <= len(self):
+            raise IndexError("Week out of range.")
+        if not 0 <= slot < self.games_per_week():
+            raise IndexError("Game out of range.")
+        home, away = round_robin_fixture(len(self.teams), week - 1, slot)
+        return Game(self.teams[home], self.teams[away])
+
+    def games_per_week(self) -> int:
+        return len(self.teams) // 2
+
+    def __getitem__(self, index: int) -> ImplicitWeekOfGames:
+        """
+        Returns the week at a 0-based position, like indexing the array from _generate_schedule.
+
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Week out of range.")
+        return ImplicitWeekOfGames(self, index + 1)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of weeks in the schedule.
+        """
+        num_teams: int = len(self.teams)
+        return 2 * (num_teams + num_teams % 2 - 1)
+
+    def __iter__(self) -> Generator[ImplicitWeekOfGames, None, None]:
+        """
+        Yields the weeks in order.
+
+        Complexity:
+        Best Case Complexity: O(1) per week.
+        Worst Case Complexity: O(1) per week.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+
+class _WeekNode:
+    """ A week of games in a LinkedSchedule, linked to the weeks played before and after it. """
+
+    def __init__(self, week: int, games: ArrayR[Game], label: Fraction) -> None:
+        self.week: int = week
+        self.games: ArrayR[Game] = games
+        # Sorts the nodes in playing order within LinkedSchedule.order
+        self.label: Fraction = label
+        self.previous: Union[_WeekNode, None] = None
+        self.next: Union[_WeekNode, None] = None
+
+
+class LinkedSchedule:
+    """
+    The weeks of a season kept in playing order as a doubly linked list.
+
+    Moving a week relinks its neighbours in O(1) instead of shifting every later
+    week of an array. delay_week_of_games takes positions in the current playing
+    order, exactly like Season.delay_week_of_games, and finding the week at a
+    position is done through an IndexableSkipList of the nodes. Each node has a
+    label that sorts it in playing order, and a moved week gets a label between
+    those of its new neighbours, so no other label changes. Every move shifts the
+    position of all the weeks between its two ends, so positional lookups cannot
+    stay O(1) across moves; the skip list keeps them, and a whole move, at
+    O(log W) expected instead of the O(W) of walking the list.
+
+    Weeks also keep the number they were scheduled with, and an array from that
+    number to its node finds a week by number in O(1) wherever it has been moved.
+    """
+
+    def __init__(self, weeks: ArrayR[ArrayR[Game]]) -> None:
+        """
+        Args:
+            weeks (ArrayR[ArrayR[Game]]): The weeks in order, as _generate_schedule returns them.
+                The week at index i is week i + 1.
+
+        Complexity:
+        Best Case Complexity: O(W log W) expected where W is the number of weeks.
+        Worst Case Complexity: O(W log W) expected where W is the number of weeks.
+        """
+        self.nodes: ArrayR[_WeekNode] = ArrayR(len(weeks))
+        self.order: IndexableSkipList[Fraction, _WeekNode] = IndexableSkipList()
+        self.head: Union[_WeekNode, None] = None
+        self.rear: Union[_WeekNode, None] = None
+        for index in range(len(weeks)):
+            node: _WeekNode = _WeekNode(index + 1, weeks[index], Fraction(index + 1))
+            self.nodes[index] = node
+            self.order.add(node.label, node)
+            self.__link_after(node, self.rear)
+
+    def __node(self, week: int) -> _WeekNode:
+        if not 1 <= week <= len(self.nodes):
+            raise IndexError("Week out of range.")
+        return self.nodes[week - 1]
+
+    def __node_at(self, position: int) -> _WeekNode:
+        """
+        Returns the node at a 1-based position in the current playing order.
+
+        Complexity:
+        Best Case Complexity: O(log W) expected where W is the number of weeks.
+        Worst Case Complexity: O(log W) expected where W is the number of weeks.
+        """
+        return self.order[position - 1][1]
+
+    def __unlink(self, node: _WeekNode) -> None:
+        if node.previous is None:
+            self.head = node.next
+        else:
+            node.previous.next = node.next
+        if node.next is None:
+            self.rear = node.previous
+        else:
+            node.next.previous = node.previous
+        node.previous = node.next = None
+
+    def __link_after(self, node: _WeekNode, previous: Union[_WeekNode, None]) -> None:
+        """ Links node after previous, or at the start when previous is None. """
+        following: Union[_WeekNode, None] = self.head if previous is None else previous.next
+        node.previous = previous
+        node.next = following
+        if previous is None:
+            self.head = node
+        else:
+            previous.next = node
+        if following is None:
+            self.rear = node
+        else:
+            following.previous = node
+
+    @staticmethod
+    def __label_between(previous: Union[_WeekNode, None], following: Union[_WeekNode, None]) -> Fraction:
+        """ Returns a label that sorts after previous and before following. """
+        if previous is None and following is None:
+            return Fraction(0)
+        if previous is None:
+            return following.label - 1
+        if following is None:
+            return previous.label + 1
+        return (previous.label + following.label) / 2
+
+    def delay_week_of_games(self, orig_week: int, new_week: Union[int, None] = None) -> None:
+        """
+        Moves the week at position orig_week so that it is played at position new_week,
+        the same as Season.delay_week_of_games. Both are positions in the current playing
+        order, so repeated delays behave like repeated removals and insertions in a list.
+
+        Args:
+            orig_week (int): The position of the week to move.
+            new_week (Union[int, None]): The position it should end up at, or None to move it to the end of the season.
+
+        Complexity:
+        Best Case Complexity: O(log W) expected where W is the number of weeks.
+        Worst Case Complexity: O(log W) expected where W is the number of weeks.
+            Relinking the week is O(1); the rest is finding positions in and updating the skip list.
+        """
+        length: int = len(self.nodes)
+        if not 1 <= orig_week <= length or (new_week is not None and not 1 <= new_week <= length):
+            raise IndexError("Week out of range.")
+        if new_week == orig_week:
+            return
+        node: _WeekNode = self.__node_at(orig_week)
+        self.order.remove(node.label)
+        self.__unlink(node)
+        # Once the week is out, it has to follow the week now at position new_week - 1
+        if new_week is None:
+            previous: Union[_WeekNode, None] = self.rear
+        elif new_week == 1:
+            previous = None
+        else:
+            previous = self.__node_at(new_week - 1)
+        self.__link_after(node, previous)
+        node.label = self.__label_between(node.previous, node.next)
+        self.order.add(node.label, node)
+
+    def get_week(self, week: int) -> ArrayR[Game]:
+        """
+        Returns the games of a week by the number it was scheduled with, wherever it has been moved to.
+
+        Complexity:
+        Best Case Complexity: O(1)
+        Worst Case Complexity: O(1)
+        """
+        return self.__node(week).games
+
+    def week_numbers(self) -> Generator[int, None, None]:
+        """
+        Yields the week numbers in playing order.
+        """
+        node: Union[_WeekNode, None] = self.head
+        while node is not None:
+            yield node.week
+            node = node.next
+
+    def games(self) -> Generator[Game, None, None]:
+        """
+        Yields every game of the season in playing order.
+
+        Complexity:
+        Best Case Complexity: O(1) per game.
+        Worst Case Complexity: O(1) per game.
+        """
+        for week in self:
+            if week is not None:
+                for game in week:
+                    yield game
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Generator[ArrayR[Game], None, None]:
+        """
+        Yields the games of each week in playing order, like iterating the array from _generate_schedule.
+
+        Complexity:
+        Best Case Complexity: O(1) per week.
+        Worst Case Complexity: O(1) per week.
+        """
+        node: Union[_WeekNode, None] = self.head
+        while node is not None:
+            yield node.games
+            node = node.next
+
+
 class Season:
 
     def __init__(self, teams: ArrayR[Team]) -> None:
@@ -96,10 +452,16 @@ class Season:
         """
         raise NotImplementedError
 
-    def _generate_schedule(self) -> ArrayR[ArrayR[Game]]:
+    def _generate_schedule(self, circle_method: Union[bool, None] = None) -> ArrayR[ArrayR[Game]]:
         """
         Generates a schedule by generating all possible games between the teams.
 
+        Args:
+            circle_method (Union[bool, None]): Whether to build the schedule with the circle method
+                (see _generate_round_robin_schedule) or by greedily filling weeks with the remaining
+                games in order. None picks the greedy order, which the expected results are based on,
+                for leagues of up to Constants.MAX_NUM_TEAMS teams and the circle method for larger ones.
+
         Return:
             ArrayR[ArrayR[Game]]: The schedule of the season.
                 The outer array is the weeks in the season.
@@ -107,8 +469,14 @@ class Season:
 
         Complexity:
             Best Case Complexity: O(N^2) where N is the number of teams in the season.
-            Worst Case Complexity: O(N^2) where N is the number of teams in the season.
+            Worst Case Complexity: O(N^3) where N is the number of teams in the season,
+                greedily filling each of the O(N) weeks rescans the O(N^2) remaining games.
         """
+        if circle_method is None:
+            circle_method = len(self.teams) > Constants.MAX_NUM_TEAMS
+        if circle_method:
+            return self._generate_round_robin_schedule()
+
         num_teams: int = len(self.teams)
         weekly_games: list[ArrayR[Game]] = []
         flipped_weeks: list[ArrayR[Game]] = []
@@ -143,6 +511,66 @@ class Season:
 
         return ArrayR.from_list(weekly_games + flipped_weeks)
 
+    def _generate_round_robin_schedule(self) -> ArrayR[ArrayR[Game]]:
+        """
+        Generates a double round robin schedule with the circle method.
+        Each week's games are built directly, with no rescanning of the remaining games.
+        With an odd number of teams one team has a bye each week.
+
+        Return:
+            ArrayR[ArrayR[Game]]: The schedule of the season, in the same layout as _generate_schedule.
+
+        Complexity:
+            Best Case Complexity: O(N^2) where N is the number of teams in the season.
+            Worst Case Complexity: O(N^2) where N is the number of teams in the season.
+        """
+        num_teams: int = len(self.teams)
+        if num_teams < 2:
+            return None
+
+        num_weeks: int = 2 * (num_teams + num_teams % 2 - 1)
+        games_per_week: int = num_teams // 2
+        schedule: ArrayR[ArrayR[Game]] = ArrayR(num_weeks)
+        for week in range(num_weeks):
+            games: ArrayR[Game] = ArrayR(games_per_week)
+            for slot in range(games_per_week):
+                home, away = round_robin_fixture(num_teams, week, slot)
+                games[slot] = Game(self.teams[home], self.teams[away])
+            schedule[week] = games
+        return schedule
+
+    def _generate_implicit_schedule(self) -> RoundRobinSchedule:
+        """
+        Generates the same schedule as _generate_round_robin_schedule, but computes
+        each game when it is accessed instead of storing all of them.
+
+        Return:
+            RoundRobinSchedule: The schedule of the season, indexable and iterable by week.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return RoundRobinSchedule(self.teams)
+
+    def _generate_linked_schedule(self) -> Union[LinkedSchedule, None]:
+        """
+        Generates the schedule of _generate_schedule with its weeks linked in playing order,
+        so that delaying a week never shifts the weeks after it.
+
+        Return:
+            Union[LinkedSchedule, None]: The schedule of the season, iterable by week,
+                or None when _generate_schedule has no weeks (fewer than two teams).
+
+        Complexity:
+            Best Case Complexity: O(_generate_schedule)
+            Worst Case Complexity: O(_generate_schedule)
+        """
+        weeks: ArrayR[ArrayR[Game]] = self._generate_schedule()
+        if weeks is None:
+            return None
+        return LinkedSchedule(weeks)
+
     def simulate_season(self) -> None:
         """
         Simulates the season.
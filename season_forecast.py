@@ -0,0 +1,334 @@
+"""
+Monte Carlo forecasting of season outcomes.
+
+Runs many independent simulations of the same season in worker processes and
+aggregates title, top four and relegation probabilities as well as the points
+distribution of every team.
+"""
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from data_structures.hash_table import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from math import sqrt
+from os import cpu_count
+from random_gen import RandomGen, RandomStream
+from season import Season
+from team import Team
+from typing import Callable, Generator, Union
+
+
+class SeasonForecast:
+    """
+    Aggregated outcomes over a number of simulated seasons.
+
+    Teams are stored by their index in the array given at construction, every
+    statistic is a column indexed by that team index.
+    """
+
+    TOP_PLACES = 4
+    RELEGATION_PLACES = 3
+
+    # 95% confidence
+    Z_SCORE = 1.96
+
+    def __init__(self, team_names: ArrayR[str], max_points: int) -> None:
+        """
+        Args:
+            team_names (ArrayR[str]): The names of the teams in the season.
+            max_points (int): The most points a team can get in a season.
+
+        Complexity:
+            Best Case Complexity: O(N * M) where N is the number of teams and M is max_points.
+            Worst Case Complexity: O(N * M * hash(name)) where N is the number of teams and M is max_points.
+        """
+        self.team_names: ArrayR[str] = team_names
+        self.max_points: int = max_points
+        self.runs: int = 0
+        self.team_index: LinearProbeTable[str, int] = LinearProbeTable.from_items(
+            [(team_names[i], i) for i in range(len(team_names))]
+        )
+        self.titles: ArrayR[int] = ArrayR(len(team_names))
+        self.top_places: ArrayR[int] = ArrayR(len(team_names))
+        self.relegations: ArrayR[int] = ArrayR(len(team_names))
+        self.points: ArrayR[ArrayR[int]] = ArrayR(len(team_names))
+        for i in range(len(team_names)):
+            self.titles[i] = 0
+            self.top_places[i] = 0
+            self.relegations[i] = 0
+            self.points[i] = ArrayR(max_points + 1)
+            for points in range(max_points + 1):
+                self.points[i][points] = 0
+
+    def add_leaderboard(self, leaderboard: ArrayR[ArrayR[Union[int, str]]]) -> None:
+        """
+        Records the outcome of one season from its final leaderboard.
+
+        Args:
+            leaderboard (ArrayR[ArrayR[Union[int, str]]]): The result of Season.get_leaderboard.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of teams.
+            Worst Case Complexity: O(N * hash(name)) where N is the number of teams.
+        """
+        num_teams: int = len(leaderboard)
+        for position in range(num_teams):
+            row: ArrayR[Union[int, str]] = leaderboard[position]
+            team: int = self.team_index[row[0]]
+            if position == 0:
+                self.titles[team] += 1
+            if position < self.TOP_PLACES:
+                self.top_places[team] += 1
+            if position >= num_teams - self.RELEGATION_PLACES:
+                self.relegations[team] += 1
+            self.points[team][row[2]] += 1
+        self.runs += 1
+
+    def merge(self, other: SeasonForecast) -> None:
+        """
+        Adds the outcomes recorded in another forecast of the same teams to this one.
+
+        Complexity:
+            Best Case Complexity: O(N * M) where N is the number of teams and M is max_points.
+            Worst Case Complexity: O(N * M) where N is the number of teams and M is max_points.
+        """
+        for team in range(len(self.team_names)):
+            self.titles[team] += other.titles[team]
+            self.top_places[team] += other.top_places[team]
+            self.relegations[team] += other.relegations[team]
+            for points in range(self.max_points + 1):
+                self.points[team][points] += other.points[team][points]
+        self.runs += other.runs
+
+    def copy(self) -> SeasonForecast:
+        """
+        Returns a forecast with the same outcomes that later merges into this one do not change.
+
+        Complexity:
+            Best Case Complexity: O(N * M) where N is the number of teams and M is max_points.
+            Worst Case Complexity: O(N * M * hash(name)) where N is the number of teams and M is max_points.
+        """
+        forecast: SeasonForecast = SeasonForecast(self.team_names, self.max_points)
+        forecast.merge(self)
+        return forecast
+
+    def title_probability(self, team_name: str) -> float:
+        return self.__probability(self.titles, team_name)
+
+    def top_places_probability(self, team_name: str) -> float:
+        return self.__probability(self.top_places, team_name)
+
+    def relegation_probability(self, team_name: str) -> float:
+        return self.__probability(self.relegations, team_name)
+
+    def points_distribution(self, team_name: str) -> ArrayR[int]:
+        """
+        Returns:
+            ArrayR[int]: How many runs ended with the team on each number of points, indexed by points.
+        """
+        return self.points[self.team_index[team_name]]
+
+    def expected_points(self, team_name: str) -> float:
+        """
+        Complexity:
+            Best Case Complexity: O(M) where M is max_points.
+            Worst Case Complexity: O(M) where M is max_points.
+        """
+        if self.runs == 0:
+            return 0.0
+        distribution: ArrayR[int] = self.points_distribution(team_name)
+        return sum(points * distribution[points] for points in range(self.max_points + 1)) / self.runs
+
+    def max_interval_width(self) -> float:
+        """
+        The widest half-width of the Wilson confidence interval across every
+        team's title, top places and relegation probability.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of teams.
+            Worst Case Complexity: O(N) where N is the number of teams.
+        """
+        if self.runs == 0:
+            return 1.0
+        widest: float = 0.0
+        for column in (self.titles, self.top_places, self.relegations):
+            for team in range(len(self.team_names)):
+                widest = max(widest, self.__interval_width(column[team]))
+        return widest
+
+    def __interval_width(self, successes: int) -> float:
+        n: int = self.runs
+        p: float = successes / n
+        z: float = self.Z_SCORE
+        return z / (1 + z * z / n) * sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+
+    def __probability(self, column: ArrayR[int], team_name: str) -> float:
+        if self.runs == 0:
+            return 0.0
+        return column[self.team_index[team_name]] / self.runs
+
+    def __str__(self) -> str:
+        result: str = f"Forecast over {self.runs} seasons\n"
+        for i in range(len(self.team_names)):
+            name: str = self.team_names[i]
+            result += f"{name}: title {self.title_probability(name):.3f}, " \
+                      f"top {self.TOP_PLACES} {self.top_places_probability(name):.3f}, " \
+                      f"relegation {self.relegation_probability(name):.3f}, " \
+                      f"expected points {self.expected_points(name):.1f}\n"
+        return result
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def simulate_seasons(teams: ArrayR[Team], seeds: ArrayR[int]) -> SeasonForecast:
+    """
+    Simulates one season per seed and aggregates the outcomes.
+    This runs inside a worker process, so it works on its own copy of the teams.
+
+    Complexity:
+        Best Case Complexity: O(S * simulate_season) where S is the number of seeds.
+        Worst Case Complexity: O(S * simulate_season) where S is the number of seeds.
+    """
+    forecast: SeasonForecast = SeasonForecaster.empty_forecast(teams)
+    for seed in seeds:
+        RandomGen.set_seed(seed)
+        for team in teams:
+            team.reset_stats()
+        season: Season = Season(teams)
+        season.simulate_season()
+        forecast.add_leaderboard(season.get_leaderboard())
+    return forecast
+
+
+class SeasonForecaster:
+    """
+    Runs independent copies of a season across a process pool.
+
+    Every run is seeded deterministically from `seed`, so a forecast that runs to
+    completion is reproducible regardless of the number of workers or the order
+    they finish in.
+
+    Usage:
+    ```
+    forecaster = SeasonForecaster(teams, runs=10000, seed=123, tolerance=0.01)
+    for partial in forecaster.stream():
+        print(partial.runs, partial.max_interval_width())
+    forecast = forecaster.run()
+    ```
+    """
+
+    DEFAULT_BATCH_SIZE = 50
+
+    def __init__(self, teams: ArrayR[Team], runs: int, seed: int = 0, workers: Union[int, None] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, tolerance: Union[float, None] = None,
+                 min_runs: int = 0,
+                 simulate: Callable[[ArrayR[Team], ArrayR[int]], SeasonForecast] = simulate_seasons) -> None:
+        """
+        Args:
+            teams (ArrayR[Team]): The teams playing the season.
+            runs (int): The maximum number of seasons to simulate.
+            seed (int): Base seed every run is derived from.
+            workers (Union[int, None]): Number of worker processes, defaults to the number of cores.
+            batch_size (int): Number of seasons a worker simulates per task.
+            tolerance (Union[float, None]): Stop early once every probability's confidence
+                interval half-width is below this. None runs all seasons.
+            min_runs (int): Never stop early before this many seasons were simulated.
+            simulate (Callable[[ArrayR[Team], ArrayR[int]], SeasonForecast]): Simulates one batch of seeds
+                in a worker, simulate_seasons by default. It is sent to the workers, so it must be a
+                module level function.
+        """
+        if runs <= 0 or batch_size <= 0:
+            raise ValueError("runs and batch_size must be positive.")
+        self.teams: ArrayR[Team] = teams
+        self.runs: int = runs
+        self.seed: int = seed
+        self.workers: int = workers if workers is not None else (cpu_count() or 1)
+        self.batch_size: int = batch_size
+        self.tolerance: Union[float, None] = tolerance
+        self.min_runs: int = min_runs
+        self.simulate: Callable[[ArrayR[Team], ArrayR[int]], SeasonForecast] = simulate
+
+    @staticmethod
+    def empty_forecast(teams: ArrayR[Team]) -> SeasonForecast:
+        """
+        Creates a forecast with no runs for the given teams.
+
+        Complexity:
+            Best Case Complexity: O(N^2) where N is the number of teams.
+            Worst Case Complexity: O(N^2) where N is the number of teams.
+        """
+        names: ArrayR[str] = ArrayR(len(teams))
+        for i in range(len(teams)):
+            names[i] = teams[i].get_name()
+        # Every team plays every other team home and away
+        max_points: int = 3 * 2 * (len(teams) - 1)
+        return SeasonForecast(names, max_points)
+
+    def run_seeds(self, first_run: int, num_runs: int) -> ArrayR[int]:
+        """
+        Returns the seeds of runs first_run to first_run + num_runs - 1.
+
+        Run i is seeded like stream i of RandomStream(seed).split(runs), so runs are
+        independent of each other and of how they are batched.
+
+        :complexity: O(num_runs)
+        """
+        seeds: ArrayR[int] = ArrayR(num_runs)
+        for i in range(num_runs):
+            seeds[i] = RandomStream.derive_seed(self.seed, first_run + i)
+        return seeds
+
+    def stream(self) -> Generator[SeasonForecast, None, None]:
+        """
+        Simulates the seasons, yielding the aggregate so far every time a batch finishes.
+        Each yield is a copy, so forecasts kept by the caller do not change as later batches finish.
+
+        At most one batch per worker is in flight at any time, so an early stop
+        only wastes the batches that are already running.
+
+        Complexity:
+            Best Case Complexity: O(R * simulate_season / W) where R is the number of runs and W the number of workers.
+            Worst Case Complexity: O(R * simulate_season / W) where R is the number of runs and W the number of workers.
+        """
+        total: SeasonForecast = SeasonForecaster.empty_forecast(self.teams)
+        submitted: int = 0
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending: set[Future] = set()
+            submitted = self.__fill(executor, pending, submitted)
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    total.merge(future.result())
+                yield total.copy()
+
+                if self.__converged(total):
+                    for future in pending:
+                        future.cancel()
+                    return
+
+                submitted = self.__fill(executor, pending, submitted)
+
+    def run(self) -> SeasonForecast:
+        """
+        Simulates the seasons and returns the final aggregate.
+        """
+        forecast: SeasonForecast = SeasonForecaster.empty_forecast(self.teams)
+        for forecast in self.stream():
+            pass
+        return forecast
+
+    def __fill(self, executor: ProcessPoolExecutor, pending: set[Future], submitted: int) -> int:
+        """
+        Submits batches until every worker has one, returns the number of runs submitted so far.
+        """
+        while submitted < self.runs and len(pending) < self.workers:
+            num_runs: int = min(self.batch_size, self.runs - submitted)
+            pending.add(executor.submit(self.simulate, self.teams, self.run_seeds(submitted, num_runs)))
+            submitted += num_runs
+        return submitted
+
+    def __converged(self, forecast: SeasonForecast) -> bool:
+        if self.tolerance is None or forecast.runs < self.min_runs:
+            return False
+        return forecast.max_interval_width() < self.tolerance
@@ -0,0 +1,211 @@
+"""
+Streaming season simulation.
+
+A season is run as a chain of generators:
+
+    schedule_games -> simulate_games -> ResultApplier -> update_standings
+
+Each stage pulls one game at a time from the stage before it, so a season can
+be consumed game by game, paused and resumed, and no stage ever holds more than
+the game it is currently working on.
+"""
+from __future__ import annotations
+from constants import PlayerStats, TeamStats
+from data_structures.hash_table import LinearProbeTable
+from data_structures.referential_array import ArrayR
+from game_simulator import GameSimulator, SimulationResults
+from player import Player
+from random_gen import RandomGen, RandomStream
+from season import Game, ImplicitWeekOfGames, WeekOfGames
+from team import Team
+from typing import Generator, Iterable, Protocol, Union
+
+GameResultPair = tuple[Game, LinearProbeTable]
+SimulatedGame = tuple[Game, SimulationResults]
+
+
+class Standings(Protocol):
+    """ Anything that needs to know when a team's statistics have changed. """
+
+    def update(self, team: Team) -> None:
+        ...
+
+
+def schedule_games(schedule: Iterable[Union[WeekOfGames, ArrayR[Game]]]) -> Generator[Game, None, None]:
+    """
+    Yields every game of a schedule in order.
+
+    Args:
+        schedule: The weeks of the season, as WeekOfGames or as ArrayR[Game] like _generate_schedule returns.
+
+    Complexity:
+        Best Case Complexity: O(1) per game.
+        Worst Case Complexity: O(1) per game, plus O(N) at the start of each week for
+            stored WeekOfGames where N is the number of games in that week.
+    """
+    for week in schedule:
+        if isinstance(week, WeekOfGames) and not isinstance(week, ImplicitWeekOfGames):
+            week = week.get_games()
+        if week is None:
+            continue
+        for game in week:
+            yield game
+
+
+def simulate_games(games: Iterable[Game], rng: Union[RandomStream, type[RandomGen]] = RandomGen) -> Generator[SimulatedGame, None, None]:
+    """
+    Simulates each game as it arrives. Results are passed on as SimulationResults,
+    which keep the player behind every event for the ResultApplier.
+
+    Complexity:
+        Best Case Complexity: O(simulate) per game.
+        Worst Case Complexity: O(simulate) per game.
+    """
+    for game in games:
+        yield game, GameSimulator.simulate_game(game.home_team, game.away_team, rng)
+
+
+class ResultApplier:
+    """
+    Applies simulated results to the team and player statistics.
+
+    Every event is credited to the player the simulator recorded for it, so
+    players are never looked up by name and players of the two teams that
+    share a name are kept apart.
+    """
+
+    def __call__(self, results: Iterable[SimulatedGame]) -> Generator[GameResultPair, None, None]:
+        """
+        Applies every result and passes it on as the table GameSimulator.simulate returns.
+
+        Complexity:
+            Best Case Complexity: O(P) per game where P is the number of players in both teams.
+            Worst Case Complexity: O(P) per game where P is the number of players in both teams.
+        """
+        for game, result in results:
+            self.apply(game, result)
+            yield game, result.to_table(0)
+
+    def apply(self, game: Game, result: SimulationResults, index: int = 0) -> None:
+        """
+        Applies row `index` of the results, the result of `game`.
+        """
+        home_goals: int = result.home_goals[index]
+        away_goals: int = result.away_goals[index]
+        ResultApplier.apply_team(game.home_team, home_goals, away_goals)
+        ResultApplier.apply_team(game.away_team, away_goals, home_goals)
+
+        for team in (game.home_team, game.away_team):
+            players = team.get_players()
+            if players is not None:
+                for player in players:
+                    player[PlayerStats.GAMES_PLAYED] = player[PlayerStats.GAMES_PLAYED] + 1
+
+        for column, stat in ((result.goal_scorer_players, PlayerStats.GOALS),
+                             (result.goal_assist_players, PlayerStats.ASSISTS),
+                             (result.tackle_players, PlayerStats.TACKLES),
+                             (result.interception_players, PlayerStats.INTERCEPTIONS)):
+            players: Union[ArrayR[Player], None] = column[index]
+            if players is None:
+                continue
+            for player in players:
+                player[stat] = player[stat] + 1
+
+    @staticmethod
+    def apply_team(team: Team, goals_for: int, goals_against: int) -> None:
+        """
+        Records one game for a team. Games played, points and the last five results
+        follow from the win, draw or loss being recorded.
+        """
+        team[TeamStats.GOALS_FOR] = team[TeamStats.GOALS_FOR] + goals_for
+        team[TeamStats.GOALS_AGAINST] = team[TeamStats.GOALS_AGAINST] + goals_against
+        if goals_for > goals_against:
+            team[TeamStats.WINS] = team[TeamStats.WINS] + 1
+        elif goals_for == goals_against:
+            team[TeamStats.DRAWS] = team[TeamStats.DRAWS] + 1
+        else:
+            team[TeamStats.LOSSES] = team[TeamStats.LOSSES] + 1
+
+
+def update_standings(results: Iterable[GameResultPair], standings: Union[Standings, None]) -> Generator[GameResultPair, None, None]:
+    """
+    Tells the standings about both teams of every applied result and passes it on.
+
+    Complexity:
+        Best Case Complexity: O(standings.update) per game.
+        Worst Case Complexity: O(standings.update) per game.
+    """
+    for game, result in results:
+        if standings is not None:
+            standings.update(game.home_team)
+            standings.update(game.away_team)
+        yield game, result
+
+
+class SeasonPipeline:
+    """
+    Runs a season one game at a time.
+
+    Iterating the pipeline simulates, applies and publishes the next game and
+    yields it with its result. Stopping iteration pauses the season, and
+    iterating again resumes it from the next game.
+
+    Usage:
+    ```
+    pipeline = SeasonPipeline(season.schedule)
+    for game, result in pipeline:
+        ...
+    pipeline.run(10)   # or advance a fixed number of games
+    ```
+    """
+
+    def __init__(self, schedule: Iterable[Union[WeekOfGames, ArrayR[Game]]], standings: Union[Standings, None] = None,
+                 rng: Union[RandomStream, type[RandomGen]] = RandomGen) -> None:
+        """
+        Args:
+            schedule: The weeks of the season.
+            standings (Union[Standings, None]): Told about every team whose statistics change.
+            rng (Union[RandomStream, type[RandomGen]]): The random stream games are simulated with.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        self.games_played: int = 0
+        self.stream: Generator[GameResultPair, None, None] = update_standings(
+            ResultApplier()(simulate_games(schedule_games(schedule), rng)), standings
+        )
+
+    def __iter__(self) -> SeasonPipeline:
+        return self
+
+    def __next__(self) -> GameResultPair:
+        """
+        Plays the next game of the season.
+
+        Raises:
+            StopIteration: When every game has been played.
+        """
+        game_result: GameResultPair = next(self.stream)
+        self.games_played += 1
+        return game_result
+
+    def run(self, num_games: Union[int, None] = None) -> int:
+        """
+        Plays up to num_games games, or the rest of the season when num_games is None.
+
+        Returns:
+            int: The number of games played by this call.
+
+        Complexity:
+            Best Case Complexity: O(G * simulate) where G is the number of games played.
+            Worst Case Complexity: O(G * simulate) where G is the number of games played.
+        """
+        played: int = 0
+        while num_games is None or played < num_games:
+            try:
+                next(self)
+            except StopIteration:
+                break
+            played += 1
+        return played
@@ -0,0 +1,68 @@
+"""
+Minimal stand-ins for Player and Team, shared by the tests of code that only
+needs their public interface.
+"""
+from constants import GameResult, PlayerPosition, PlayerStats, TeamStats
+from data_structures.referential_array import ArrayR
+from roster import RosterIndex, RosterView
+
+
+class StubPlayer:
+    """ Minimal stand-in for Player, holding its stats in a dict. """
+
+    def __init__(self, name: str, position: PlayerPosition) -> None:
+        self.name = name
+        self.position = position
+        self.stats = {stat: 0 for stat in PlayerStats}
+        self.stats[PlayerStats.HEIGHT] = 170
+        self.stats[PlayerStats.WEIGHT] = 80
+        self.stats[PlayerStats.STAR_SKILL] = 3
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_position(self) -> PlayerPosition:
+        return self.position
+
+    def __getitem__(self, stat: PlayerStats) -> int:
+        return self.stats[stat]
+
+    def __setitem__(self, stat: PlayerStats, value: int) -> None:
+        self.stats[stat] = value
+
+
+class StubTeam:
+    """ Minimal stand-in for Team with cascading results. """
+
+    def __init__(self, name: str, players: list[StubPlayer]) -> None:
+        self.name = name
+        self.players = RosterIndex(players)
+        self.stats = {stat: 0 for stat in TeamStats}
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_players(self, position: PlayerPosition = None) -> RosterView:
+        return self.players.get_players(position)
+
+    def get_outfield_players(self) -> RosterView:
+        return self.players.get_outfield_players()
+
+    def __getitem__(self, stat: TeamStats) -> int:
+        return self.stats[stat]
+
+    def __setitem__(self, stat: TeamStats, value: int) -> None:
+        self.stats[stat] = value
+        results = {TeamStats.WINS: GameResult.WIN, TeamStats.DRAWS: GameResult.DRAW, TeamStats.LOSSES: GameResult.LOSS}
+        if stat in results:
+            self.stats[TeamStats.GAMES_PLAYED] += 1
+            self.stats[TeamStats.POINTS] += results[stat].value
+        self.stats[TeamStats.GOALS_DIFFERENCE] = self.stats[TeamStats.GOALS_FOR] - self.stats[TeamStats.GOALS_AGAINST]
+
+
+def stub_teams(num_teams: int) -> ArrayR[StubTeam]:
+    positions = list(PlayerPosition)
+    return ArrayR.from_list([
+        StubTeam(f"Team {t}", [StubPlayer(f"Player {t}-{p}", positions[p % len(positions)]) for p in range(12)])
+        for t in range(num_teams)
+    ])
@@ -0,0 +1,103 @@
+from unittest import TestCase
+
+from constants import PlayerPosition, PlayerStats, ResultStats
+from data_structures.referential_array import ArrayR
+from game_simulator import GameSimulator, SimulationResults, _RosterTables
+from random_gen import RandomGen, RandomStream
+from season import Game, WeekOfGames
+from tests.stubs import StubPlayer, stub_teams
+
+
+class InsertionOrderTeam:
+    """ A team whose get_players() keeps the order players were added in, not grouped by position. """
+
+    def __init__(self, name: str, players: list[StubPlayer]) -> None:
+        self.name = name
+        self.players = players
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_players(self, position: PlayerPosition = None):
+        players = [player for player in self.players if position is None or player.get_position() == position]
+        return players if players else None
+
+
+def interleaved_team(name: str) -> InsertionOrderTeam:
+    positions = [PlayerPosition.STRIKER, PlayerPosition.DEFENDER, PlayerPosition.GOALKEEPER,
+                 PlayerPosition.MIDFIELDER, PlayerPosition.STRIKER, PlayerPosition.DEFENDER]
+    players = [StubPlayer(f"{name} {i}", position) for i, position in enumerate(positions * 2)]
+    for i, player in enumerate(players):
+        player[PlayerStats.STAR_SKILL] = i % 5
+        player[PlayerStats.WEAK_FOOT_ABILITY] = (i * 3) % 4
+    return InsertionOrderTeam(name, players)
+
+
+class TestRosterTables(TestCase):
+
+    def test_outfield_keeps_get_players_order(self) -> None:
+        team = interleaved_team("Home")
+        tables = _RosterTables(team)
+        expected = [player for player in team.get_players() if player.get_position() != PlayerPosition.GOALKEEPER]
+        self.assertEqual(tables.outfield, expected)
+
+    def test_reads_outfield_view(self) -> None:
+        team = stub_teams(1)[0]
+        tables = _RosterTables(team)
+        self.assertIs(tables.outfield, team.get_outfield_players())
+        expected = [player for player in team.get_players() if player.get_position() != PlayerPosition.GOALKEEPER]
+        self.assertEqual(list(tables.outfield), expected)
+
+
+def as_lists(table) -> list:
+    result = []
+    for stat in ResultStats:
+        value = table[stat.value]
+        result.append(value.to_list() if isinstance(value, ArrayR) else value)
+    return result
+
+
+class TestSimulateMany(TestCase):
+
+    def setUp(self) -> None:
+        teams = stub_teams(4)
+        games = [Game(teams[i], teams[j]) for i in range(4) for j in range(4) if i != j]
+        self.week = WeekOfGames(1, ArrayR.from_list(games))
+
+    def test_matches_simulate(self) -> None:
+        games = self.week.get_games()
+        stream = RandomStream(21)
+        expected = [as_lists(GameSimulator.simulate(game.home_team, game.away_team, stream)) for game in games]
+        results = GameSimulator.simulate_many(self.week, RandomStream(21))
+        self.assertEqual(len(results), len(games))
+        self.assertEqual([as_lists(results[i]) for i in range(len(results))], expected)
+
+        # The global stream is drawn from the same way
+        RandomGen.set_seed(21)
+        global_results = GameSimulator.simulate_many(games)
+        self.assertEqual([as_lists(global_results[i]) for i in range(len(global_results))], expected)
+
+    def test_to_table(self) -> None:
+        results = GameSimulator.simulate_many(self.week, RandomStream(4))
+        for i in range(len(results)):
+            table = results.to_table(i)
+            self.assertEqual(table[ResultStats.HOME_GOALS.value], results.home_goals[i])
+            self.assertEqual(table[ResultStats.AWAY_GOALS.value], results.away_goals[i])
+            self.assertIs(table[ResultStats.GOAL_SCORERS.value], results.goal_scorers[i])
+            self.assertIs(table[ResultStats.GOAL_ASSISTS.value], results.goal_assists[i])
+            self.assertIs(table[ResultStats.TACKLES.value], results.tackles[i])
+            self.assertIs(table[ResultStats.INTERCEPTIONS.value], results.interceptions[i])
+            self.assertEqual(as_lists(results[i]), as_lists(table))
+            self.assertEqual(len(table), len(ResultStats))
+        self.assertRaises(IndexError, results.to_table, len(results))
+        self.assertRaises(IndexError, results.to_table, -1)
+
+    def test_empty_week(self) -> None:
+        stream = RandomStream(9)
+        for games in (WeekOfGames(2, None), []):
+            results = GameSimulator.simulate_many(games, stream)
+            self.assertIsInstance(results, SimulationResults)
+            self.assertEqual(len(results), 0)
+            self.assertRaises(IndexError, results.to_table, 0)
+        # Nothing was drawn
+        self.assertEqual(stream.seed, 9)
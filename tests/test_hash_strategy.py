@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+from data_structures.hash_strategy import INTERNED_HASH, InternedHash, UniversalHash
+from data_structures.hash_table import IncrementalLinearProbeTable, LinearProbeTable, RobinHoodTable, SplitLinearProbeTable
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from hashy_step_table import HashyStepTable
+
+
+class TestUniversalHash(TestCase):
+
+    def test_seeded_is_reproducible(self) -> None:
+        self.assertEqual(UniversalHash(7)("Lionel Messi"), UniversalHash(7)("Lionel Messi"))
+        self.assertNotEqual(UniversalHash(7)("Lionel Messi"), UniversalHash(8)("Lionel Messi"))
+        self.assertNotEqual(UniversalHash(7)("ab"), UniversalHash(7)("ba"))
+
+    def test_leading_zero_characters_change_hash(self) -> None:
+        for seed in range(20):
+            strategy = UniversalHash(seed)
+            hashes = {strategy(key) for key in ("x", "\x00x", "\x00\x00x", "\x00\x00\x00x")}
+            self.assertEqual(len(hashes), 4)
+
+    def test_cache(self) -> None:
+        strategy = UniversalHash(1)
+        value = strategy("Sam Kerr")
+        self.assertEqual(strategy.cache["Sam Kerr"], value)
+        self.assertEqual(strategy("Sam Kerr"), value)
+
+    def test_breaks_up_colliding_keys(self) -> None:
+        # Keys that all share the same home position under the fixed hash
+        fixed = LinearProbeTable([101])
+        colliding = [key for key in (f"player {i}" for i in range(5000)) if fixed.hash(key) == 0][:20]
+        self.assertEqual(len(colliding), 20)
+        seeded = LinearProbeTable([1543], hash_strategy=UniversalHash(3))
+        self.assertGreater(len({seeded.hash(key) for key in colliding}), 15)
+
+    def test_tables_accept_strategy(self) -> None:
+        tables = [cls(hash_strategy=UniversalHash(5)) for cls in
+                  (LinearProbeTable, IncrementalLinearProbeTable, RobinHoodTable, SplitLinearProbeTable)]
+        tables.append(HashTableSeparateChaining(hash_strategy=UniversalHash(5)))
+        for table in tables:
+            for i in range(300):
+                table[f"player {i}"] = i
+            for i in range(300):
+                self.assertEqual(table[f"player {i}"], i)
+        self.assertLess(HashyStepTable(hash_strategy=UniversalHash(5)).hash("player"), HashyStepTable.TABLE_SIZES[0])
+
+
+class CountingHash(UniversalHash):
+
+    def __init__(self, seed: int) -> None:
+        UniversalHash.__init__(self, seed)
+        self.calls = 0
+
+    def __call__(self, key: str) -> int:
+        self.calls += 1
+        return UniversalHash.__call__(self, key)
+
+
+class TestInternedHash(TestCase):
+
+    def test_interns_keys(self) -> None:
+        strategy = InternedHash(2)
+        key = "".join(["Home ", "Goals"])
+        shared = strategy.intern(key)
+        self.assertEqual(shared, key)
+        self.assertIs(strategy.intern("".join(["Home ", "Goals"])), shared)
+        self.assertEqual(strategy(key), UniversalHash(2)(key))
+
+    def test_shared_instance(self) -> None:
+        first, second = LinearProbeTable(hash_strategy=INTERNED_HASH), SplitLinearProbeTable(hash_strategy=INTERNED_HASH)
+        first["Goals"] = 1
+        second["Goals"] = 2
+        self.assertIn("Goals", INTERNED_HASH.cache)
+        self.assertEqual((first["Goals"], second["Goals"]), (1, 2))
+
+    def test_split_table_resizes_from_stored_hashes(self) -> None:
+        strategy = CountingHash(4)
+        table = SplitLinearProbeTable(hash_strategy=strategy)
+        for i in range(1000):
+            table[f"player {i}"] = i
+        # One hash per insert, none while growing through the table sizes
+        self.assertEqual(strategy.calls, 1000)
+        for i in range(0, 1000, 2):
+            del table[f"player {i}"]
+        for i in range(1, 1000, 2):
+            self.assertEqual(table[f"player {i}"], i)
+        self.assertNotIn("player 0", table)
@@ -0,0 +1,246 @@
+from unittest import TestCase
+
+from data_structures.hash_table import IncrementalLinearProbeTable, LinearProbeTable, RobinHoodTable, \
+    SplitLinearProbeTable
+
+
+def churn(test: TestCase, table, rounds: int = 3000) -> dict:
+    """ Inserts and deletes keys in table and a dict, checking they agree. """
+    expected = {}
+    for i in range(rounds):
+        key = f"key {i * 7 % 1000}"
+        if i % 5 == 4 and key in expected:
+            del table[key]
+            del expected[key]
+        else:
+            table[key] = i
+            expected[key] = i
+        test.assertEqual(len(table), len(expected))
+    for key, value in expected.items():
+        test.assertEqual(table[key], value)
+    test.assertEqual(sorted(table.keys().to_list()), sorted(expected))
+    test.assertEqual(sorted(table.values().to_list()), sorted(expected.values()))
+    test.assertNotIn("missing", table)
+    test.assertRaises(KeyError, table.__delitem__, "missing")
+    return expected
+
+
+class TestTombstones(TestCase):
+
+    def test_matches_dict(self) -> None:
+        for table in (LinearProbeTable(tombstones=True), IncrementalLinearProbeTable(tombstones=True),
+                      SplitLinearProbeTable(tombstones=True)):
+            churn(self, table)
+
+    def test_delete_leaves_tombstone(self) -> None:
+        table = LinearProbeTable([97], tombstones=True)
+        for i in range(20):
+            table[str(i)] = i
+        del table["3"]
+        self.assertEqual(table.tombstone_count, 1)
+        self.assertEqual(sum(item is LinearProbeTable.TOMBSTONE for item in table.array), 1)
+        for i in range(20):
+            if i != 3:
+                self.assertEqual(table[str(i)], i)
+        table["3"] = 30
+        self.assertEqual(table.tombstone_count, 0)
+        self.assertEqual(len(table), 20)
+
+    def test_compacts_after_threshold(self) -> None:
+        table = LinearProbeTable([97], tombstones=True)
+        for i in range(40):
+            table[str(i)] = i
+        for i in range(30):
+            del table[str(i)]
+            self.assertLessEqual(table.tombstone_count, 97 * LinearProbeTable.MAX_TOMBSTONE_LOAD)
+        self.assertEqual(sorted(table.values().to_list()), list(range(30, 40)))
+
+
+class TestIncrementalLinearProbeTable(TestCase):
+
+    def test_matches_dict_through_migrations(self) -> None:
+        table = IncrementalLinearProbeTable()
+        churn(self, table)
+        self.assertGreater(table.size_index, 2)
+
+    def test_lookups_during_migration(self) -> None:
+        table = IncrementalLinearProbeTable()
+        i = 0
+        while not table.is_migrating():
+            table[f"key {i}"] = i
+            i += 1
+        self.assertIsNotNone(table.old_array)
+        # Every key is still reachable, whichever array it is in
+        for j in range(i):
+            self.assertEqual(table[f"key {j}"], j)
+        table["key 0"] = -1
+        del table["key 1"]
+        self.assertEqual(table["key 0"], -1)
+        self.assertNotIn("key 1", table)
+        self.assertEqual(len(table), i - 1)
+
+    def test_same_contents_as_linear_probe_table(self) -> None:
+        incremental = IncrementalLinearProbeTable()
+        table = LinearProbeTable()
+        for i in range(500):
+            incremental[str(i)] = i
+            table[str(i)] = i
+        self.assertEqual(sorted(incremental.keys().to_list()), sorted(table.keys().to_list()))
+
+    def test_migration_reuses_tombstones(self) -> None:
+        # Every key starts probing at 0, so migrated items fill the tombstones left there
+        table = IncrementalLinearProbeTable([53, 107], tombstones=True, hash_strategy=lambda key: 0)
+        i = 0
+        while not table.is_migrating():
+            table[f"key {i}"] = i
+            i += 1
+        _ = table["key 0"]
+        migrated = [item[0] for item in table.array if item is not None]
+        for key in migrated:
+            del table[key]
+        self.assertGreater(table.tombstone_count, 0)
+        while table.is_migrating():
+            _ = table[f"key {i - 1}"]
+        self.assertEqual(table.tombstone_count, sum(item is table.TOMBSTONE for item in table.array))
+        self.assertEqual(len(table), i - len(migrated))
+
+    def test_old_lookups_leave_array_alone(self) -> None:
+        table = IncrementalLinearProbeTable()
+        i = 0
+        while not table.is_migrating():
+            table[f"key {i}"] = i
+            i += 1
+        array = table.array
+        self.assertLess(table._old_position(f"key {i - 1}"), len(table.old_array))
+        self.assertIs(table.array, array)
+        # A key that cannot be hashed fails without leaving the old array in place
+        self.assertRaises(TypeError, table._old_position, 12)
+        self.assertIs(table.array, array)
+        self.assertEqual(table.hash("key 0", len(table.old_array)), LinearProbeTable([len(table.old_array)]).hash("key 0"))
+
+
+class TestRobinHoodTable(TestCase):
+
+    def test_matches_dict(self) -> None:
+        churn(self, RobinHoodTable())
+
+    def test_invariants(self) -> None:
+        table = RobinHoodTable([97, 193])
+        for i in range(87):
+            table[f"player {i}"] = i
+        self.assertEqual(table.table_size, 97)
+        for i in range(0, 87, 3):
+            del table[f"player {i}"]
+        for position, item in enumerate(table.array):
+            if item is None:
+                continue
+            self.assertEqual((table.hash(item[0]) + table.distances[position]) % table.table_size, position)
+            # No item sits further from home than the item before it plus one
+            previous = (position - 1) % table.table_size
+            if table.distances[position] > 0:
+                self.assertIsNotNone(table.array[previous])
+                self.assertGreaterEqual(table.distances[previous], table.distances[position] - 1)
+
+    def test_high_load(self) -> None:
+        table = RobinHoodTable([97, 193])
+        for i in range(87):
+            table[str(i)] = i
+        self.assertEqual(table.table_size, 97)
+        table["87"] = 87
+        self.assertEqual(table.table_size, 193)
+        self.assertEqual(sorted(table.values().to_list()), list(range(88)))
+
+    def test_grows_past_sizes(self) -> None:
+        table = RobinHoodTable([5])
+        for i in range(6):
+            table[str(i)] = i
+        self.assertEqual(table.table_size, 11)
+        self.assertEqual(sorted(table.values().to_list()), list(range(6)))
+
+
+class TestSplitLinearProbeTable(TestCase):
+
+    def test_matches_dict(self) -> None:
+        churn(self, SplitLinearProbeTable())
+        churn(self, SplitLinearProbeTable(cache_hashes=False))
+
+    def test_updates_in_place(self) -> None:
+        table = SplitLinearProbeTable()
+        table["Goals"] = 1
+        position = table._linear_probe("Goals", False)
+        table["Goals"] = 2
+        self.assertEqual(table.value_array[position], 2)
+        self.assertEqual(table.hash_array[position], table.hash("Goals"))
+        self.assertEqual(len(table), 1)
+
+
+class TestBulkConstruction(TestCase):
+
+    def test_with_capacity(self) -> None:
+        for cls in (LinearProbeTable, RobinHoodTable, SplitLinearProbeTable, IncrementalLinearProbeTable):
+            table = cls.with_capacity(1000)
+            size = table.table_size
+            self.assertGreaterEqual(size * cls.MAX_LOAD, 1000)
+            for i in range(1000):
+                table[str(i)] = i
+            self.assertEqual(table.table_size, size, cls.__name__)
+        self.assertEqual(LinearProbeTable.with_capacity(0).table_size, LinearProbeTable.TABLE_SIZES[0])
+
+    def test_from_items(self) -> None:
+        pairs = [(f"player {i}", i) for i in range(5000)] + [("player 7", -7)]
+        for cls in (LinearProbeTable, RobinHoodTable, SplitLinearProbeTable, IncrementalLinearProbeTable):
+            table = cls.from_items(iter(pairs))
+            self.assertEqual(len(table), 5000)
+            self.assertEqual(table["player 7"], -7)
+            self.assertEqual(table["player 4999"], 4999)
+            self.assertEqual(table.size_index, cls.with_capacity(len(pairs)).size_index)
+
+    def test_from_items_keeps_options(self) -> None:
+        table = LinearProbeTable.from_items([("a", 1), ("b", 2)], sizes=[7, 17], tombstones=True)
+        self.assertEqual(table.table_size, 7)
+        del table["a"]
+        self.assertEqual(table.tombstone_count, 1)
+
+
+class TestComputedSizes(TestCase):
+
+    def test_grows_past_table_sizes(self) -> None:
+        for cls in (LinearProbeTable, RobinHoodTable, SplitLinearProbeTable, IncrementalLinearProbeTable):
+            table = cls([5, 13])
+            for i in range(200):
+                table[str(i)] = i
+            self.assertEqual(table.TABLE_SIZES[:4], [5, 13, 29, 59], cls.__name__)
+            self.assertGreaterEqual(table.table_size * cls.MAX_LOAD, 200)
+            for i in range(200):
+                self.assertEqual(table[str(i)], i)
+        # The class list is left alone
+        self.assertEqual(len(LinearProbeTable.TABLE_SIZES), 19)
+
+    def test_with_capacity_past_table_sizes(self) -> None:
+        table = LinearProbeTable.with_capacity(100, sizes=[5, 13])
+        self.assertEqual(table.table_size, 257)
+
+    def test_shrinks_after_deletes(self) -> None:
+        tables = [RobinHoodTable(shrink=True)] + [cls(tombstones=tombstones, shrink=True) for tombstones in (False, True)
+                                                  for cls in (LinearProbeTable, SplitLinearProbeTable, IncrementalLinearProbeTable)]
+        for table in tables:
+            for i in range(2000):
+                table[str(i)] = i
+            grown = table.table_size
+            for i in range(1990):
+                del table[str(i)]
+            self.assertLess(table.table_size, grown // 16, type(table).__name__)
+            self.assertLessEqual(len(table), table.table_size * table.MAX_LOAD)
+            self.assertEqual(sorted(table.values().to_list()), list(range(1990, 2000)))
+            self.assertNotIn("0", table)
+
+    def test_no_shrink_by_default(self) -> None:
+        for cls in (LinearProbeTable, RobinHoodTable, SplitLinearProbeTable, IncrementalLinearProbeTable):
+            table = cls()
+            for i in range(2000):
+                table[str(i)] = i
+            grown = table.table_size
+            for i in range(1990):
+                del table[str(i)]
+            self.assertEqual(table.table_size, grown, cls.__name__)
+        self.assertTrue(LinearProbeTable.with_capacity(10, shrink=True).shrink)
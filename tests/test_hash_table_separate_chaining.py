@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining, _ArrayBucket, _SortedBucket
+
+
+class TestHashTableSeparateChaining(TestCase):
+
+    def test_matches_dict(self) -> None:
+        table = HashTableSeparateChaining()
+        expected = {}
+        for i in range(4000):
+            key = f"key {i * 7 % 1500}"
+            if i % 4 == 3 and key in expected:
+                del table[key]
+                del expected[key]
+            else:
+                table[key] = i
+                expected[key] = i
+            self.assertEqual(len(table), len(expected))
+        for key, value in expected.items():
+            self.assertEqual(table[key], value)
+        self.assertEqual(sorted(table.keys().to_list()), sorted(expected))
+        self.assertEqual(sorted(table), sorted(expected.values()))
+        self.assertRaises(KeyError, table.__getitem__, "missing")
+        self.assertRaises(KeyError, table.__delitem__, "missing")
+
+    def test_grows_with_load(self) -> None:
+        table = HashTableSeparateChaining()
+        for i in range(1000):
+            table[str(i)] = i
+            self.assertLessEqual(len(table), len(table.table) * HashTableSeparateChaining.MAX_LOAD)
+        self.assertEqual(len(table.table), 1361)
+
+    def test_update_in_place(self) -> None:
+        table = HashTableSeparateChaining()
+        table["Goals"] = 1
+        table["Goals"] = 2
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table["Goals"], 2)
+        del table["Goals"]
+        self.assertTrue(table.is_empty())
+        self.assertIsNone(table.table[table.hash("Goals")])
+
+    def test_long_chains_are_sorted(self) -> None:
+        table = HashTableSeparateChaining()
+        # Only hash to one position, like a crafted set of names would
+        table.hash = lambda key: 0
+        for i in range(200):
+            table[f"player {i}"] = i
+        self.assertIsInstance(table.table[0], _SortedBucket)
+        for i in range(200):
+            self.assertEqual(table[f"player {i}"], i)
+        table["player 5"] = -5
+        self.assertEqual(table["player 5"], -5)
+
+        for i in range(196):
+            del table[f"player {i}"]
+        self.assertIsInstance(table.table[0], _ArrayBucket)
+        self.assertEqual(sorted(table.keys().to_list()), ["player 196", "player 197", "player 198", "player 199"])
+        self.assertRaises(KeyError, table.__getitem__, "player 5")
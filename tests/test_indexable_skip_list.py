@@ -0,0 +1,40 @@
+from bisect import bisect_left, insort_left
+from unittest import TestCase
+
+from data_structures.indexable_skip_list import IndexableSkipList
+from random_gen import RandomStream
+
+
+class TestIndexableSkipList(TestCase):
+
+    def test_matches_sorted_list(self) -> None:
+        rng = RandomStream(42)
+        skip_list = IndexableSkipList()
+        expected = []
+        for _ in range(2000):
+            key = rng.randint(1, 200)
+            if key in expected and rng.random_chance(0.5):
+                self.assertEqual(skip_list.remove(key), -key)
+                expected.remove(key)
+            else:
+                skip_list.add(key, -key)
+                insort_left(expected, key)
+            self.assertEqual(len(skip_list), len(expected))
+
+        self.assertEqual([key for key, _ in skip_list], expected)
+        for index, key in enumerate(expected):
+            self.assertEqual(skip_list[index], (key, -key))
+        for key in set(expected):
+            self.assertEqual(skip_list.rank(key), bisect_left(expected, key))
+        first = skip_list.first(10)
+        self.assertEqual([key for key, _ in first], expected[:10])
+
+    def test_missing_keys(self) -> None:
+        skip_list = IndexableSkipList()
+        self.assertIsNone(skip_list.first(3))
+        skip_list.add("b")
+        self.assertIn("b", skip_list)
+        self.assertNotIn("a", skip_list)
+        self.assertRaises(KeyError, skip_list.remove, "a")
+        self.assertRaises(KeyError, skip_list.rank, "c")
+        self.assertRaises(IndexError, skip_list.__getitem__, 1)
@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+from constants import TeamStats
+from leaderboard import LeaderboardIndex
+from random_gen import RandomStream
+from season import RoundRobinSchedule
+from season_pipeline import SeasonPipeline
+from tests.stubs import stub_teams
+
+
+def sorted_names(teams) -> list[str]:
+    return [team.get_name() for team in sorted(teams, key=LeaderboardIndex.standing_key)]
+
+
+class TestLeaderboardIndex(TestCase):
+
+    def test_ties_broken_by_name(self) -> None:
+        teams = stub_teams(4)
+        index = LeaderboardIndex(teams)
+        self.assertEqual([team.get_name() for team in index], ["Team 0", "Team 1", "Team 2", "Team 3"])
+
+    def test_update_moves_team(self) -> None:
+        teams = stub_teams(4)
+        index = LeaderboardIndex(teams)
+        teams[3][TeamStats.GOALS_FOR] = 2
+        teams[3][TeamStats.WINS] = 1
+        index.update(teams[3])
+        self.assertEqual(index.rank(teams[3]), 1)
+        self.assertIs(index.team_at(1), teams[3])
+        self.assertEqual(index.rank(teams[0]), 2)
+
+        teams[1][TeamStats.GOALS_FOR] = 5
+        teams[1][TeamStats.WINS] = 1
+        index.update(teams[1])
+        self.assertEqual([team.get_name() for team in index.top(2)], ["Team 1", "Team 3"])
+
+    def test_follows_pipeline(self) -> None:
+        teams = stub_teams(8)
+        index = LeaderboardIndex(teams)
+        pipeline = SeasonPipeline(RoundRobinSchedule(teams), index, RandomStream(7))
+        while pipeline.run(5):
+            self.assertEqual([team.get_name() for team in index], sorted_names(teams))
+        self.assertEqual([team.get_name() for team in index.teams()], sorted_names(teams))
+        self.assertEqual(len(index), 8)
@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from constants import PlayerStats, TeamStats
+from data_structures.ordinal_table import OrdinalTable
+
+
+class TestOrdinalTable(TestCase):
+
+    def test_ordinals_follow_definition_order(self) -> None:
+        for stats in (PlayerStats, TeamStats):
+            self.assertEqual([stat.ordinal for stat in stats], list(range(len(stats))))
+
+    def test_set_get_delete(self) -> None:
+        table = OrdinalTable(PlayerStats)
+        self.assertTrue(table.is_empty())
+        for value, stat in enumerate(PlayerStats):
+            table[stat] = value
+        self.assertTrue(table.is_full())
+        self.assertEqual(table[PlayerStats.HEIGHT], 8)
+        self.assertEqual(table["Goals"], 1)
+
+        table["Goals"] = 10
+        self.assertEqual(table[PlayerStats.GOALS], 10)
+        self.assertEqual(len(table), len(PlayerStats))
+
+        del table[PlayerStats.GOALS]
+        self.assertNotIn(PlayerStats.GOALS, table)
+        self.assertRaises(KeyError, table.__getitem__, PlayerStats.GOALS)
+        self.assertRaises(KeyError, table.__delitem__, PlayerStats.GOALS)
+        self.assertEqual(len(table), len(PlayerStats) - 1)
+
+    def test_keys_and_values(self) -> None:
+        table = OrdinalTable(TeamStats)
+        table[TeamStats.LOSSES] = 2
+        table[TeamStats.POINTS] = 7
+        self.assertEqual(table.keys().to_list(), [TeamStats.POINTS, TeamStats.LOSSES])
+        self.assertEqual(table.values().to_list(), [7, 2])
+
+    def test_empty_keys_and_values(self) -> None:
+        table = OrdinalTable(PlayerStats)
+        self.assertEqual(table.keys().to_list(), [None])
+        self.assertEqual(table.values().to_list(), [None])
+        table[PlayerStats.GOALS] = 1
+        del table[PlayerStats.GOALS]
+        self.assertEqual(table.keys().to_list(), [None])
+
+    def test_foreign_keys(self) -> None:
+        table = OrdinalTable(TeamStats)
+        self.assertNotIn(PlayerStats.GOALS, table)
+        self.assertNotIn("Star Skill", table)
+        self.assertRaises(KeyError, table.__setitem__, PlayerStats.GOALS, 1)
@@ -0,0 +1,66 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from constants import PlayerStats, ResultStats, TeamStats
+from data_structures.perfect_hash import PerfectHash, PerfectHashTable
+
+
+class TestPerfectHash(TestCase):
+
+    def test_minimal_and_collision_free(self) -> None:
+        key_sets = [[stat.value for stat in enum] for enum in (PlayerStats, TeamStats, ResultStats)]
+        key_sets.append([f"Player {i}" for i in range(500)])
+        for keys in key_sets:
+            perfect_hash = PerfectHash.generate(keys)
+            self.assertEqual(perfect_hash.size, len(keys))
+            self.assertEqual(sorted(perfect_hash(key) for key in keys), list(range(len(keys))))
+
+    def test_invalid_keys(self) -> None:
+        self.assertRaises(ValueError, PerfectHash.generate, [])
+        self.assertRaises(ValueError, PerfectHash.generate, ["a", "b", "a"])
+
+    def test_cached(self) -> None:
+        keys = [stat.value for stat in TeamStats]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "team_stats.json")
+            generated = PerfectHash.cached(keys, path)
+            loaded = PerfectHash.cached(reversed(keys), path)
+            self.assertEqual(loaded.to_dict(), generated.to_dict())
+            other = PerfectHash.cached(keys[:5], path)
+            self.assertEqual(other.size, 5)
+
+
+class TestPerfectHashTable(TestCase):
+
+    def test_enum_keys(self) -> None:
+        table = PerfectHashTable(PlayerStats)
+        for value, stat in enumerate(PlayerStats):
+            table[stat] = value
+        self.assertTrue(table.is_full())
+        for value, stat in enumerate(PlayerStats):
+            self.assertEqual(table[stat], value)
+            self.assertEqual(table[stat.value], value)
+        del table[PlayerStats.GOALS]
+        self.assertNotIn(PlayerStats.GOALS, table)
+        self.assertEqual(len(table), len(PlayerStats) - 1)
+        self.assertEqual(len(table.values()), len(PlayerStats) - 1)
+
+    def test_unknown_keys(self) -> None:
+        names = [f"Player {i}" for i in range(15)]
+        table = PerfectHashTable(names)
+        for name in names:
+            table[name] = len(name)
+        self.assertNotIn("Someone else", table)
+        self.assertRaises(KeyError, table.__getitem__, "Someone else")
+        self.assertRaises(KeyError, table.__setitem__, "Someone else", 0)
+
+    def test_unknown_key_into_empty_slot(self) -> None:
+        names = [f"Player {i}" for i in range(15)]
+        table = PerfectHashTable(names)
+        self.assertRaises(KeyError, table.__setitem__, "Someone else", 1)
+        self.assertEqual(len(table), 0)
+        table["Player 6"] = 2
+        self.assertEqual(table["Player 6"], 2)
+        self.assertEqual(len(table), 1)
+        self.assertRaises(KeyError, table.__delitem__, "Someone else")
@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from constants import PlayerStats
+from player_store import PlayerStore
+
+
+class TestPlayerStore(TestCase):
+
+    def setUp(self) -> None:
+        self.store = PlayerStore()
+        self.ids = [self.store.allocate() for _ in range(5)]
+
+    def test_views_share_columns(self) -> None:
+        stats = self.store.stats(self.ids[2])
+        self.assertEqual(stats[PlayerStats.GOALS], 0)
+        stats[PlayerStats.GOALS] += 3
+        self.assertEqual(self.store.get(self.ids[2], PlayerStats.GOALS), 3)
+        self.assertEqual(self.store.column(PlayerStats.GOALS).tolist(), [0, 0, 3, 0, 0])
+        self.assertEqual(self.store.stats(self.ids[0])[PlayerStats.GOALS], 0)
+
+    def test_reset(self) -> None:
+        for player_id in self.ids:
+            for stat in PlayerStats:
+                self.store.set(player_id, stat, player_id + 1)
+        self.store.stats(self.ids[1]).reset()
+        self.assertEqual(self.store.total(PlayerStats.HEIGHT), 1 + 3 + 4 + 5)
+        self.store.reset()
+        for stat in PlayerStats:
+            self.assertEqual(self.store.total(stat), 0)
+
+    def test_aggregates(self) -> None:
+        for player_id, goals in zip(self.ids, [2, 7, 7, 1, 4]):
+            self.store.set(player_id, PlayerStats.GOALS, goals)
+        self.assertEqual(self.store.total(PlayerStats.GOALS), 21)
+        self.assertEqual(self.store.total(PlayerStats.GOALS, self.ids[:2]), 9)
+        self.assertEqual(self.store.top(PlayerStats.GOALS, 3).to_list(), [self.ids[1], self.ids[2], self.ids[4]])
+
+    def test_release_reuses_rows(self) -> None:
+        self.store.set(self.ids[3], PlayerStats.ASSISTS, 4)
+        self.store.release(self.ids[3])
+        self.assertNotIn(self.ids[3], self.store)
+        self.assertEqual(len(self.store), 4)
+        self.assertRaises(KeyError, self.store.stats, self.ids[3])
+        self.assertNotIn(self.ids[3], self.store.top(PlayerStats.ASSISTS, 5).to_list())
+
+        reused = self.store.allocate()
+        self.assertEqual(reused, self.ids[3])
+        self.assertEqual(self.store.get(reused, PlayerStats.ASSISTS), 0)
+
+    def test_columns_are_read_only(self) -> None:
+        with self.assertRaises(TypeError):
+            self.store.column(PlayerStats.GOALS)[0] = 1
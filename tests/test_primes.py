@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from data_structures.hash_table import LinearProbeTable
+from data_structures.primes import is_prime, next_prime
+
+
+class TestPrimes(TestCase):
+
+    def test_is_prime_matches_trial_division(self) -> None:
+        def trial(n: int) -> bool:
+            return n >= 2 and all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+        for n in range(-2, 5000):
+            self.assertEqual(is_prime(n), trial(n), n)
+
+    def test_large(self) -> None:
+        self.assertTrue(is_prime((1 << 61) - 1))
+        self.assertFalse(is_prime(3215031751))  # strong pseudoprime to bases 2, 3, 5 and 7
+        self.assertFalse(is_prime(((1 << 31) - 1) * ((1 << 61) - 1)))
+
+    def test_next_prime(self) -> None:
+        self.assertEqual(next_prime(0), 2)
+        self.assertEqual(next_prime(2), 3)
+        self.assertEqual(next_prime(13), 17)
+        self.assertEqual(next_prime(2 * 1572869), 3145739)
+        self.assertTrue(all(is_prime(size) for size in LinearProbeTable.TABLE_SIZES))
@@ -0,0 +1,153 @@
+from unittest import TestCase
+
+from data_structures.linked_list import LinkedList
+from data_structures.referential_array import ArrayR
+from random_gen import RandomGen, RandomStream
+
+
+class TestRandomStream(TestCase):
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        self.expected: list[int] = [RandomGen.random() for _ in range(2000)]
+
+    def test_matches_global_stream(self) -> None:
+        stream: RandomStream = RandomStream(123)
+        self.assertEqual(self.expected, [stream.random() for _ in range(2000)])
+
+    def test_global_stream_is_a_random_stream(self) -> None:
+        RandomGen.set_seed(123)
+        stream: RandomStream = RandomStream(123)
+        self.assertIsInstance(RandomGen.stream, RandomStream)
+        self.assertEqual(RandomGen.randint(1, 6), stream.randint(1, 6))
+        self.assertEqual(RandomGen.randint_batch(1, 6, 10).to_list(), stream.randint_batch(1, 6, 10).to_list())
+        self.assertEqual(RandomGen.random_chance(0.4), stream.random_chance(0.4))
+        self.assertEqual(RandomGen.stream.seed, stream.seed)
+
+    def test_independent_of_global_stream(self) -> None:
+        stream: RandomStream = RandomStream(123)
+        RandomGen.set_seed(123)
+        first: int = stream.random()
+        RandomGen.random()
+        self.assertEqual(stream.random(), self.expected[1])
+        self.assertEqual(first, self.expected[0])
+        self.assertEqual(RandomGen.random(), self.expected[1])
+
+    def test_advance(self) -> None:
+        for steps in [0, 1, 2, 17, 1000, 1999]:
+            stream: RandomStream = RandomStream(123)
+            stream.advance(steps)
+            self.assertEqual(stream.random(), self.expected[steps])
+
+        RandomGen.set_seed(123)
+        RandomGen.advance(1500)
+        self.assertEqual(RandomGen.random(), self.expected[1500])
+
+    def test_advance_full_period(self) -> None:
+        stream: RandomStream = RandomStream(123)
+        stream.advance(RandomStream.MOD)
+        self.assertEqual(stream.seed, 123)
+
+    def test_split(self) -> None:
+        parent: RandomStream = RandomStream(123)
+        streams = parent.split(3)
+        for i in range(3):
+            self.assertEqual(streams[i].seed, RandomStream.derive_seed(123, i))
+        self.assertEqual(parent.seed, RandomStream.derive_seed(123, 3))
+        again = RandomStream(123).split(3)
+        self.assertEqual([stream.seed for stream in again], [stream.seed for stream in streams])
+        self.assertRaises(ValueError, lambda: parent.split(0))
+
+    def test_split_streams_are_not_shifted_copies(self) -> None:
+        for k in [1, 3, 7]:
+            parent: RandomStream = RandomStream(123)
+            streams = list(parent.split(k)) + [parent]
+            outputs = [[stream.random() for _ in range(50)] for stream in streams]
+            for i in range(len(outputs)):
+                for j in range(i + 1, len(outputs)):
+                    offsets = {(a - b) % (1 << 32) for a, b in zip(outputs[i], outputs[j])}
+                    self.assertGreater(len(offsets), 45, (k, i, j))
+
+
+class TestRandomBatch(TestCase):
+
+    def test_random_batch(self) -> None:
+        RandomGen.set_seed(77)
+        expected: list[int] = [RandomGen.random() for _ in range(300)]
+        RandomGen.set_seed(77)
+        self.assertEqual(RandomGen.random_batch(300).to_list(), expected)
+        stream: RandomStream = RandomStream(77)
+        self.assertEqual(stream.random_batch(150).to_list() + stream.random_batch(150).to_list(), expected)
+        self.assertIsNone(stream.random_batch(0))
+
+    def test_randint_batch(self) -> None:
+        RandomGen.set_seed(77)
+        expected: list[int] = [RandomGen.randint(-3, 9) for _ in range(300)]
+        after: int = RandomGen.random()
+        RandomGen.set_seed(77)
+        self.assertEqual(RandomGen.randint_batch(-3, 9, 300).to_list(), expected)
+        self.assertEqual(RandomGen.random(), after)
+
+    def test_chance_batch(self) -> None:
+        for ratio in [0.0, 0.33, 0.7, 1.0]:
+            RandomGen.set_seed(77)
+            expected: list[bool] = [RandomGen.random_chance(ratio) for _ in range(300)]
+            RandomGen.set_seed(77)
+            self.assertEqual(RandomGen.chance_batch(ratio, 300).to_list(), expected)
+
+
+class TestRandomShuffle(TestCase):
+
+    def test_legacy_shuffle(self) -> None:
+        items: list[int] = list(range(50))
+        RandomGen.set_seed(9)
+        positions = sorted((RandomGen.random(), i) for i in range(len(items)))
+        expected: list[int] = [items[i] for _, i in positions]
+        RandomGen.set_seed(9)
+        RandomGen.random_shuffle(items, legacy=True)
+        self.assertEqual(items, expected)
+
+    def test_shuffle_is_permutation(self) -> None:
+        items: list[int] = list(range(100))
+        RandomGen.set_seed(9)
+        RandomGen.random_shuffle(items)
+        self.assertNotEqual(items, list(range(100)))
+        self.assertEqual(sorted(items), list(range(100)))
+
+    def test_shuffle_collections_agree(self) -> None:
+        items: list[int] = list(range(30))
+        array: ArrayR[int] = ArrayR.from_list(items)
+        linked: LinkedList[int] = LinkedList()
+        for item in items:
+            linked.append(item)
+
+        for collection in (items, array, linked):
+            RandomStream(4).random_shuffle(collection)
+        self.assertEqual(array.to_list(), items)
+        self.assertEqual([linked[i] for i in range(len(linked))], items)
+
+    def test_small_collections(self) -> None:
+        for size in range(3):
+            items: list[int] = list(range(size))
+            RandomStream(4).random_shuffle(items)
+            self.assertEqual(sorted(items), list(range(size)))
+        RandomStream(4).random_shuffle(LinkedList())
+
+    def test_partial_shuffle_prefix(self) -> None:
+        full: list[int] = list(range(40))
+        partial: list[int] = list(range(40))
+        RandomStream(11).random_shuffle(full)
+        RandomStream(11).partial_shuffle(partial, 10)
+        self.assertEqual(full[:10], partial[:10])
+        self.assertEqual(sorted(partial), list(range(40)))
+
+    def test_random_sample(self) -> None:
+        items: list[int] = list(range(40))
+        for k in [1, 10, 39, 40]:
+            shuffled: list[int] = list(range(40))
+            RandomStream(11).partial_shuffle(shuffled, k)
+            sample: ArrayR[int] = RandomStream(11).random_sample(items, k)
+            self.assertEqual(sample.to_list(), shuffled[:k])
+        self.assertEqual(items, list(range(40)))
+        self.assertIsNone(RandomStream(11).random_sample(items, 0))
+        self.assertRaises(ValueError, lambda: RandomStream(11).random_sample(items, 41))
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+from constants import PlayerPosition
+from roster import RosterIndex
+from tests.stubs import StubPlayer
+
+
+class TestRosterIndex(TestCase):
+
+    def setUp(self) -> None:
+        positions = [PlayerPosition.STRIKER, PlayerPosition.GOALKEEPER, PlayerPosition.DEFENDER,
+                     PlayerPosition.STRIKER, PlayerPosition.MIDFIELDER, PlayerPosition.DEFENDER]
+        self.players = [StubPlayer(f"Player {i}", position) for i, position in enumerate(positions)]
+        self.roster = RosterIndex(self.players)
+
+    def names(self, view) -> list[str]:
+        return [player.get_name() for player in view]
+
+    def test_insertion_order(self) -> None:
+        self.assertEqual(self.names(self.roster.get_players()),
+                         ["Player 0", "Player 1", "Player 2", "Player 3", "Player 4", "Player 5"])
+        self.assertEqual(self.names(self.roster.get_players(PlayerPosition.STRIKER)), ["Player 0", "Player 3"])
+        self.assertEqual(self.names(self.roster.get_outfield_players()),
+                         ["Player 0", "Player 2", "Player 3", "Player 4", "Player 5"])
+        self.assertEqual(len(self.roster.get_players()), 6)
+
+    def test_views_follow_changes(self) -> None:
+        strikers = self.roster.get_players(PlayerPosition.STRIKER)
+        outfield = self.roster.get_outfield_players()
+        self.roster.remove(self.players[0])
+        self.assertEqual(self.names(strikers), ["Player 3"])
+        self.assertEqual(len(outfield), 4)
+        self.assertNotIn(self.players[0], self.roster)
+        self.assertNotIn(self.players[0], outfield)
+
+        self.roster.add(self.players[0])
+        self.assertEqual(self.names(strikers), ["Player 3", "Player 0"])
+        self.assertEqual(self.names(outfield), ["Player 2", "Player 3", "Player 4", "Player 5", "Player 0"])
+        self.assertIn(self.players[0], outfield)
+        self.assertNotIn(self.players[1], outfield)
+
+    def test_empty_positions(self) -> None:
+        self.roster.remove(self.players[1])
+        self.assertIsNone(self.roster.get_players(PlayerPosition.GOALKEEPER))
+        self.assertIsNone(RosterIndex().get_players())
+        self.assertIsNone(RosterIndex([self.players[1]]).get_outfield_players())
+
+    def test_invalid_changes(self) -> None:
+        self.assertRaises(ValueError, self.roster.add, self.players[0])
+        self.assertRaises(ValueError, self.roster.remove, StubPlayer("Other", PlayerPosition.STRIKER))
+
+    def test_views_are_read_only(self) -> None:
+        view = self.roster.get_players()
+        with self.assertRaises(TypeError):
+            view[0] = self.players[0]
+        self.assertFalse(hasattr(view, "add"))
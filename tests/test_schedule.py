@@ -0,0 +1,128 @@
+from unittest import TestCase
+
+from data_structures.referential_array import ArrayR
+from season import LinkedSchedule, RoundRobinSchedule, Season, round_robin_fixture
+
+
+class TestRoundRobinSchedule(TestCase):
+
+    def season_with_teams(self, num_teams: int) -> Season:
+        """ Only the teams are needed to build a schedule. """
+        season: Season = Season.__new__(Season)
+        season.teams = ArrayR.from_list([f"Team {i}" for i in range(num_teams)])
+        return season
+
+    def test_every_pairing_once(self) -> None:
+        for num_teams in range(2, 26):
+            num_weeks: int = 2 * (num_teams + num_teams % 2 - 1)
+            fixtures: set[tuple[int, int]] = set()
+            for week in range(num_weeks):
+                playing: set[int] = set()
+                for slot in range(num_teams // 2):
+                    home, away = round_robin_fixture(num_teams, week, slot)
+                    self.assertNotIn(home, playing)
+                    self.assertNotIn(away, playing)
+                    playing.update((home, away))
+                    fixtures.add((home, away))
+            self.assertEqual(len(fixtures), num_teams * (num_teams - 1))
+
+    def test_second_half_is_flipped(self) -> None:
+        num_teams: int = 6
+        for week in range(num_teams - 1):
+            for slot in range(num_teams // 2):
+                home, away = round_robin_fixture(num_teams, week, slot)
+                self.assertEqual(round_robin_fixture(num_teams, week + num_teams - 1, slot), (away, home))
+
+    def test_generate_schedule(self) -> None:
+        season: Season = self.season_with_teams(7)
+        schedule = season._generate_schedule(circle_method=True)
+        self.assertEqual(len(schedule), 14)
+        for week in schedule:
+            self.assertEqual(len(week), 3)
+        self.assertEqual(schedule[0][0].home_team, season.teams[round_robin_fixture(7, 0, 0)[0]])
+        self.assertIsNone(self.season_with_teams(1)._generate_schedule(circle_method=True))
+
+    def test_large_leagues_default_to_circle_method(self) -> None:
+        season: Season = self.season_with_teams(30)
+        schedule = season._generate_schedule()
+        self.assertEqual(len(schedule), 58)
+
+
+class TestImplicitSchedule(TestCase):
+
+    def test_matches_materialised_schedule(self) -> None:
+        for num_teams in [2, 5, 8, 21]:
+            season: Season = Season.__new__(Season)
+            season.teams = ArrayR.from_list([f"Team {i}" for i in range(num_teams)])
+            materialised = season._generate_round_robin_schedule()
+            implicit: RoundRobinSchedule = season._generate_implicit_schedule()
+
+            self.assertEqual(len(implicit), len(materialised))
+            for index, week in enumerate(implicit):
+                self.assertEqual(week.get_week(), index + 1)
+                games = week.get_games()
+                self.assertEqual(len(games), len(materialised[index]))
+                for slot, game in enumerate(week):
+                    self.assertEqual(game, materialised[index][slot])
+                    self.assertEqual(games[slot], game)
+
+    def test_random_access(self) -> None:
+        teams = ArrayR.from_list([f"Team {i}" for i in range(1000)])
+        schedule: RoundRobinSchedule = RoundRobinSchedule(teams)
+        self.assertEqual(len(schedule), 1998)
+        home, away = round_robin_fixture(1000, 1500, 321)
+        game = schedule[1500][321]
+        self.assertEqual((game.home_team, game.away_team), (teams[home], teams[away]))
+        self.assertRaises(IndexError, lambda: schedule[1998])
+        self.assertRaises(IndexError, lambda: schedule.game(1, 500))
+
+
+class TestLinkedSchedule(TestCase):
+
+    def linked_schedule(self, num_weeks: int) -> LinkedSchedule:
+        return LinkedSchedule(ArrayR.from_list([ArrayR.from_list([f"Week {week}"]) for week in range(1, num_weeks + 1)]))
+
+    def test_delay_like_array(self) -> None:
+        schedule: LinkedSchedule = self.linked_schedule(6)
+        schedule.delay_week_of_games(2, 4)
+        self.assertEqual(list(schedule.week_numbers()), [1, 3, 4, 2, 5, 6])
+        schedule.delay_week_of_games(3)
+        self.assertEqual(list(schedule.week_numbers()), [1, 3, 2, 5, 6, 4])
+        self.assertEqual(list(schedule.games()), ["Week 1", "Week 3", "Week 2", "Week 5", "Week 6", "Week 4"])
+        self.assertEqual(schedule.get_week(4)[0], "Week 4")
+
+    def test_two_delays_use_current_positions(self) -> None:
+        schedule: LinkedSchedule = self.linked_schedule(6)
+        schedule.delay_week_of_games(2, 4)
+        # Position 4 now holds week 2, so this moves week 2 back to the start
+        schedule.delay_week_of_games(4, 1)
+        self.assertEqual(list(schedule.week_numbers()), [2, 1, 3, 4, 5, 6])
+
+    def test_delays_match_list(self) -> None:
+        schedule: LinkedSchedule = self.linked_schedule(20)
+        expected: list[int] = list(range(1, 21))
+        for step in range(200):
+            orig_week, new_week = step * 7 % 20 + 1, step * 3 % 20 + 1
+            if step % 5 == 0:
+                new_week = None
+            week: int = expected.pop(orig_week - 1)
+            expected.insert(len(expected) if new_week is None else new_week - 1, week)
+            schedule.delay_week_of_games(orig_week, new_week)
+            self.assertEqual(list(schedule.week_numbers()), expected)
+        self.assertEqual(schedule.get_week(5)[0], "Week 5")
+        self.assertEqual(len(schedule), 20)
+        self.assertRaises(IndexError, schedule.delay_week_of_games, 0, 3)
+        self.assertRaises(IndexError, schedule.delay_week_of_games, 3, 21)
+
+    def test_generate_linked_schedule(self) -> None:
+        season: Season = Season.__new__(Season)
+        # Large enough to use the circle method, which works on any team objects
+        season.teams = ArrayR.from_list([f"Team {i}" for i in range(25)])
+        linked: LinkedSchedule = season._generate_linked_schedule()
+        materialised = season._generate_schedule()
+        self.assertEqual([week.to_list() for week in linked], [week.to_list() for week in materialised])
+
+    def test_generate_linked_schedule_without_games(self) -> None:
+        season: Season = Season.__new__(Season)
+        season.teams = ArrayR.from_list(["Team 0"])
+        self.assertIsNone(season._generate_linked_schedule())
@@ -0,0 +1,126 @@
+from unittest import TestCase
+
+from data_structures.referential_array import ArrayR
+from random_gen import RandomStream
+from season_forecast import SeasonForecast, SeasonForecaster
+
+
+class TestSeasonForecast(TestCase):
+
+    def setUp(self) -> None:
+        self.names: ArrayR[str] = ArrayR.from_list(['A', 'B', 'C', 'D', 'E'])
+        self.forecast: SeasonForecast = SeasonForecast(self.names, 24)
+
+    def leaderboard(self, order: list[str], points: list[int]) -> ArrayR:
+        return ArrayR.from_list([ArrayR.from_list([name, 8, pts]) for name, pts in zip(order, points)])
+
+    def test_add_leaderboard(self) -> None:
+        self.forecast.add_leaderboard(self.leaderboard(['A', 'B', 'C', 'D', 'E'], [20, 15, 12, 9, 3]))
+        self.forecast.add_leaderboard(self.leaderboard(['B', 'A', 'E', 'C', 'D'], [18, 17, 10, 9, 6]))
+
+        self.assertEqual(self.forecast.runs, 2)
+        self.assertEqual(self.forecast.title_probability('A'), 0.5)
+        self.assertEqual(self.forecast.title_probability('C'), 0.0)
+        self.assertEqual(self.forecast.top_places_probability('E'), 0.5)
+        self.assertEqual(self.forecast.relegation_probability('D'), 1.0)
+        self.assertEqual(self.forecast.relegation_probability('A'), 0.0)
+        self.assertEqual(self.forecast.points_distribution('A')[17], 1)
+        self.assertEqual(self.forecast.expected_points('B'), 16.5)
+
+    def test_merge(self) -> None:
+        other: SeasonForecast = SeasonForecast(self.names, 24)
+        self.forecast.add_leaderboard(self.leaderboard(['A', 'B', 'C', 'D', 'E'], [20, 15, 12, 9, 3]))
+        other.add_leaderboard(self.leaderboard(['C', 'B', 'A', 'D', 'E'], [20, 15, 12, 9, 3]))
+        self.forecast.merge(other)
+
+        self.assertEqual(self.forecast.runs, 2)
+        self.assertEqual(self.forecast.title_probability('C'), 0.5)
+        self.assertEqual(self.forecast.points_distribution('A')[12], 1)
+        self.assertEqual(self.forecast.points_distribution('A')[20], 1)
+
+    def test_interval_width_shrinks(self) -> None:
+        self.assertEqual(self.forecast.max_interval_width(), 1.0)
+        self.forecast.add_leaderboard(self.leaderboard(['A', 'B', 'C', 'D', 'E'], [20, 15, 12, 9, 3]))
+        few_runs: float = self.forecast.max_interval_width()
+        for _ in range(99):
+            self.forecast.add_leaderboard(self.leaderboard(['A', 'B', 'C', 'D', 'E'], [20, 15, 12, 9, 3]))
+        self.assertLess(self.forecast.max_interval_width(), few_runs)
+        self.assertGreater(self.forecast.max_interval_width(), 0.0)
+
+
+class NamedTeam:
+    """ Only what the forecaster itself needs from a team. """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def get_name(self) -> str:
+        return self.name
+
+
+def shuffled_seasons(teams: ArrayR[NamedTeam], seeds: ArrayR[int]) -> SeasonForecast:
+    """ Stands in for simulate_seasons: a random leaderboard per seed, drawn from a stream seeded with it. """
+    forecast: SeasonForecast = SeasonForecaster.empty_forecast(teams)
+    for seed in seeds:
+        stream = RandomStream(seed)
+        names = [team.get_name() for team in teams]
+        stream.random_shuffle(names)
+        points = sorted((stream.randint(0, forecast.max_points) for _ in names), reverse=True)
+        forecast.add_leaderboard(ArrayR.from_list([ArrayR.from_list([name, 0, pts]) for name, pts in zip(names, points)]))
+    return forecast
+
+
+class TestSeasonForecaster(TestCase):
+
+    def setUp(self) -> None:
+        self.teams: ArrayR[NamedTeam] = ArrayR.from_list([NamedTeam(name) for name in 'ABCDEF'])
+
+    def forecaster(self, **kwargs) -> SeasonForecaster:
+        return SeasonForecaster(self.teams, simulate=shuffled_seasons, **kwargs)
+
+    def columns(self, forecast: SeasonForecast) -> list:
+        return [forecast.runs, forecast.titles.to_list(), forecast.top_places.to_list(), forecast.relegations.to_list(),
+                [column.to_list() for column in forecast.points]]
+
+    def test_run_independent_of_workers(self) -> None:
+        single: SeasonForecast = self.forecaster(runs=90, seed=5, workers=1, batch_size=7).run()
+        several: SeasonForecast = self.forecaster(runs=90, seed=5, workers=3, batch_size=7).run()
+        self.assertEqual(single.runs, 90)
+        self.assertEqual(self.columns(several), self.columns(single))
+        other_seed: SeasonForecast = self.forecaster(runs=90, seed=6, workers=1, batch_size=7).run()
+        self.assertNotEqual(self.columns(other_seed), self.columns(single))
+
+    def test_stream_stops_at_tolerance(self) -> None:
+        forecaster: SeasonForecaster = self.forecaster(runs=5000, seed=1, workers=2, batch_size=10,
+                                                       tolerance=0.25, min_runs=20)
+        partials: list[tuple[int, float]] = []
+        forecast: SeasonForecast = None
+        for forecast in forecaster.stream():
+            partials.append((forecast.runs, forecast.max_interval_width()))
+        self.assertLess(forecast.runs, 5000)
+        self.assertGreaterEqual(forecast.runs, 20)
+        self.assertLess(forecast.max_interval_width(), 0.25)
+        self.assertGreater(len(partials), 1)
+        # Every yield before the last was too early or still too wide to stop
+        for runs, width in partials[:-1]:
+            self.assertTrue(runs < 20 or width >= 0.25)
+
+    def test_stream_yields_snapshots(self) -> None:
+        forecaster: SeasonForecaster = self.forecaster(runs=40, seed=2, workers=2, batch_size=10)
+        kept: list[SeasonForecast] = []
+        seen: list[list] = []
+        for forecast in forecaster.stream():
+            kept.append(forecast)
+            seen.append(self.columns(forecast))
+        self.assertEqual([self.columns(forecast) for forecast in kept], seen)
+        self.assertEqual([forecast.runs for forecast in kept], [10, 20, 30, 40])
+
+    def test_run_seeds_partition(self) -> None:
+        forecaster: SeasonForecaster = self.forecaster(runs=23, seed=9, batch_size=5)
+        seeds: list[int] = forecaster.run_seeds(0, 23).to_list()
+        batched: list[int] = []
+        for first in range(0, 23, 5):
+            batched += forecaster.run_seeds(first, min(5, 23 - first)).to_list()
+        self.assertEqual(batched, seeds)
+        self.assertEqual(len(set(seeds)), 23)
+        self.assertEqual(seeds, [stream.seed for stream in RandomStream(9).split(23)])
@@ -0,0 +1,95 @@
+from unittest import TestCase
+
+from constants import PlayerPosition, PlayerStats, ResultStats, TeamStats
+from data_structures.referential_array import ArrayR
+from game_simulator import GameSimulator
+from random_gen import RandomGen, RandomStream
+from season import Game, RoundRobinSchedule
+from season_pipeline import SeasonPipeline
+from tests.stubs import StubPlayer, StubTeam, stub_teams
+
+
+class RecordingStandings:
+
+    def __init__(self) -> None:
+        self.updates: list[str] = []
+
+    def update(self, team: StubTeam) -> None:
+        self.updates.append(team.get_name())
+
+
+class TestSeasonPipeline(TestCase):
+
+    def test_full_season(self) -> None:
+        teams = stub_teams(5)
+        standings = RecordingStandings()
+        pipeline = SeasonPipeline(RoundRobinSchedule(teams), standings, RandomStream(3))
+        self.assertEqual(pipeline.run(), 20)
+
+        total_goals: int = 0
+        for team in teams:
+            self.assertEqual(team[TeamStats.GAMES_PLAYED], 8)
+            total_goals += team[TeamStats.GOALS_FOR]
+            for player in team.get_players():
+                self.assertEqual(player[PlayerStats.GAMES_PLAYED], 8)
+        player_goals: int = sum(player[PlayerStats.GOALS] for team in teams for player in team.get_players())
+        self.assertEqual(player_goals, total_goals)
+        self.assertEqual(len(standings.updates), 40)
+
+    def test_pause_and_resume(self) -> None:
+        teams = stub_teams(4)
+        pipeline = SeasonPipeline(RoundRobinSchedule(teams), rng=RandomStream(8))
+        first_game, first_result = next(pipeline)
+        self.assertEqual(first_game.home_team[TeamStats.GAMES_PLAYED], 1)
+        self.assertEqual(pipeline.run(4), 4)
+        self.assertEqual(pipeline.games_played, 5)
+        self.assertEqual(pipeline.run(), 7)
+        self.assertEqual(pipeline.run(), 0)
+
+    def test_matches_direct_simulation(self) -> None:
+        teams = stub_teams(4)
+        schedule = RoundRobinSchedule(teams)
+        RandomGen.set_seed(12)
+        expected = [GameSimulator.simulate(game.home_team, game.away_team)[ResultStats.HOME_GOALS.value]
+                    for week in schedule for game in week]
+        RandomGen.set_seed(12)
+        actual = [result[ResultStats.HOME_GOALS.value] for _, result in SeasonPipeline(schedule)]
+        self.assertEqual(actual, expected)
+
+    def test_same_names_on_both_teams(self) -> None:
+        positions = list(PlayerPosition)
+        home = StubTeam("Home", [StubPlayer(f"Player {p}", positions[p % len(positions)]) for p in range(12)])
+        away = StubTeam("Away", [StubPlayer(f"Player {p}", positions[p % len(positions)]) for p in range(12)])
+        games = ArrayR.from_list([Game(home, away), Game(away, home)] * 5)
+        results = [result for _, result in SeasonPipeline([games], rng=RandomStream(4))]
+
+        for team in (home, away):
+            goals: int = sum(player[PlayerStats.GOALS] for player in team.get_players())
+            self.assertEqual(goals, team[TeamStats.GOALS_FOR])
+        self.assertGreater(home[TeamStats.GOALS_FOR] + away[TeamStats.GOALS_FOR], 0)
+        events: int = sum(0 if result[key.value] is None else len(result[key.value])
+                          for result in results for key in (ResultStats.TACKLES, ResultStats.INTERCEPTIONS))
+        defensive: int = sum(player[PlayerStats.TACKLES] + player[PlayerStats.INTERCEPTIONS]
+                             for team in (home, away) for player in team.get_players())
+        self.assertEqual(defensive, events)
+
+    def test_roster_change_between_games(self) -> None:
+        teams = stub_teams(2)
+        home, away = teams[0], teams[1]
+        games = ArrayR.from_list([Game(home, away)] * 30)
+        pipeline = SeasonPipeline([games], rng=RandomStream(2))
+        pipeline.run(10)
+
+        departed = next(iter(home.get_players(PlayerPosition.STRIKER)))
+        home.players.remove(departed)
+        signing = StubPlayer("New Signing", PlayerPosition.STRIKER)
+        signing[PlayerStats.STAR_SKILL] = 50
+        home.players.add(signing)
+        departed_goals: int = departed[PlayerStats.GOALS]
+        pipeline.run()
+
+        self.assertEqual(departed[PlayerStats.GOALS], departed_goals)
+        self.assertEqual(signing[PlayerStats.GAMES_PLAYED], 20)
+        self.assertGreater(signing[PlayerStats.GOALS], 0)
+        goals: int = sum(player[PlayerStats.GOALS] for player in home.get_players()) + departed_goals
+        self.assertEqual(goals, home[TeamStats.GOALS_FOR])
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from random_gen import RandomGen
+from weighted_table import AliasTable, CumulativeWeightTable
+
+
+class TestWeightedTable(TestCase):
+
+    def setUp(self) -> None:
+        self.items: list[str] = ['A', 'B', 'C', 'D', 'E', 'F']
+        self.weights: list[int] = [0, 7, 3, 0, 12, 1]
+
+    def linear_choice(self, items: list[str], weights: list[int]) -> str:
+        """ The original linear scan the cumulative table has to reproduce. """
+        total_weight: int = sum(weights)
+        if total_weight == 0:
+            return RandomGen.random_choice(items)
+        rand_val: int = RandomGen.random_choice(range(total_weight))
+        cumulative_weight: int = 0
+        for item, weight in zip(items, weights):
+            cumulative_weight += weight
+            if cumulative_weight >= rand_val:
+                return item
+
+    def test_cumulative_matches_linear_scan(self) -> None:
+        table = CumulativeWeightTable(self.items, self.weights)
+        RandomGen.set_seed(1008)
+        expected: list[str] = [self.linear_choice(self.items, self.weights) for _ in range(500)]
+        RandomGen.set_seed(1008)
+        actual: list[str] = [table.choice() for _ in range(500)]
+        self.assertEqual(expected, actual)
+
+    def test_zero_weights(self) -> None:
+        weights: list[int] = [0] * len(self.items)
+        table = CumulativeWeightTable(self.items, weights)
+        RandomGen.set_seed(5)
+        expected: list[str] = [self.linear_choice(self.items, weights) for _ in range(50)]
+        RandomGen.set_seed(5)
+        self.assertEqual(expected, [table.choice() for _ in range(50)])
+
+    def test_alias_distribution(self) -> None:
+        table = AliasTable(self.items, self.weights)
+        RandomGen.set_seed(42)
+        counts: dict[str, int] = {item: 0 for item in self.items}
+        draws: int = 23000
+        for _ in range(draws):
+            counts[table.choice()] += 1
+        self.assertEqual(counts['D'], 0)
+        for item, weight in zip(self.items, self.weights):
+            self.assertAlmostEqual(counts[item] / draws, weight / 23, delta=0.02)
+
+    def test_empty(self) -> None:
+        self.assertRaises(ValueError, lambda: CumulativeWeightTable([], []))
+        self.assertRaises(ValueError, lambda: AliasTable([], []))
@@ -0,0 +1,148 @@
+"""
+Prebuilt tables for repeatedly drawing items in proportion to integer weights.
+
+A table is built once for a fixed collection of items and can then be sampled
+as many times as needed without recomputing the weights.
+"""
+from __future__ import annotations
+from data_structures.referential_array import ArrayR
+from random_gen import RandomGen
+from typing import Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class CumulativeWeightTable(Generic[T]):
+    """
+    Weighted sampler backed by a cumulative weight array and binary search.
+
+    Draws consume exactly one random number and pick the first item whose
+    cumulative weight is at least the drawn value, so the sequence of choices
+    is identical to scanning the items linearly on every draw.
+    """
+
+    def __init__(self, items: Iterable[T], weights: Iterable[int]) -> None:
+        """
+        Args:
+            items (Iterable[T]): The items to choose from, in scan order.
+            weights (Iterable[int]): The weight of each item.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of items.
+            Worst Case Complexity: O(N) where N is the number of items.
+        """
+        self.items: ArrayR[T] = ArrayR.from_list(list(items))
+        if self.items is None:
+            raise ValueError("Cannot build a weighted table with no items.")
+        self.cumulative: ArrayR[int] = ArrayR(len(self.items))
+        total: int = 0
+        for i, weight in enumerate(weights):
+            total += weight
+            self.cumulative[i] = total
+        self.total: int = total
+
+    def choice(self, rng=RandomGen) -> T:
+        """
+        Selects an item based on its weight.
+
+        Args:
+            rng: The random source to draw from.
+
+        Returns:
+            T: The selected item.
+
+        Complexity:
+            Best Case Complexity: O(1) when the middle item is selected first.
+            Worst Case Complexity: O(log(N)) where N is the number of items.
+        """
+        if self.total == 0:  # Handle edge case where all weights are zero
+            return rng.random_choice(self.items)
+
+        rand_val: int = rng.random_choice(range(self.total))
+        lo: int = 0
+        hi: int = len(self.items) - 1
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            if self.cumulative[mid] >= rand_val:
+                hi = mid
+            else:
+                lo = mid + 1
+        return self.items[lo]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class AliasTable(Generic[T]):
+    """
+    Weighted sampler using Vose's alias method.
+
+    Every draw is O(1) regardless of the number of items, but it consumes two
+    random numbers per draw, so it does not reproduce the sequence of choices
+    made by CumulativeWeightTable for the same seed.
+    """
+
+    def __init__(self, items: Iterable[T], weights: Iterable[int]) -> None:
+        """
+        Args:
+            items (Iterable[T]): The items to choose from.
+            weights (Iterable[int]): The weight of each item.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of items.
+            Worst Case Complexity: O(N) where N is the number of items.
+        """
+        self.items: ArrayR[T] = ArrayR.from_list(list(items))
+        if self.items is None:
+            raise ValueError("Cannot build a weighted table with no items.")
+        n: int = len(self.items)
+        weight_list: list[int] = list(weights)
+        self.total: int = sum(weight_list)
+        self.probability: ArrayR[float] = ArrayR(n)
+        self.alias: ArrayR[int] = ArrayR(n)
+        if self.total == 0:
+            return
+
+        scaled: list[float] = [weight * n / self.total for weight in weight_list]
+        small: list[int] = [i for i in range(n) if scaled[i] < 1]
+        large: list[int] = [i for i in range(n) if scaled[i] >= 1]
+        while small and large:
+            less: int = small.pop()
+            more: int = large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Whatever is left over is only there because of rounding errors
+        for i in large + small:
+            self.probability[i] = 1.0
+            self.alias[i] = i
+
+    def choice(self, rng=RandomGen) -> T:
+        """
+        Selects an item based on its weight.
+
+        Args:
+            rng: The random source to draw from.
+
+        Returns:
+            T: The selected item.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if self.total == 0:  # Handle edge case where all weights are zero
+            return rng.random_choice(self.items)
+
+        column: int = rng.randint(0, len(self.items) - 1)
+        if rng.random_float() < self.probability[column]:
+            return self.items[column]
+        return self.items[self.alias[column]]
+
+    def __len__(self) -> int:
+        return len(self.items)